@@ -0,0 +1,795 @@
+'''
+DobotSimulator.py
+
+Local simulator of the Dobot TCP interface for testing and benchmarking the DobotTCP library without hardware.
+The dashboard simulator speaks the text protocol of port 29999 and answers in the same err,{value},Cmd(); format as the robot controller.
+The feedback simulator sends the 1440 byte real-time frames of ports 30004, 30005 and 30006 in the layout read by Feedback.ParseFeedback.
+
+Classes:
+    SimulatedRobot: Simulated joint, pose, IO and motion queue state shared by the simulator servers.
+    DashboardSimulator: A TCP server emulating the dashboard port (29999) of the robot controller.
+    FeedbackSimulator: A TCP server emulating a real-time feedback port (30004, 30005, 30006) of the robot controller.
+
+Usage:
+    In-process:
+        simulator = DashboardSimulator(port=0)
+        simulator.Start()
+        robot = Dobot(simulator.ip, simulator.port)
+
+        feedback = FeedbackSimulator(simulator.robot, port=30004)
+        feedback.Start()
+
+    As a subprocess:
+        python DobotSimulator.py --port 29999 --latency 0.001 --move-time 0.5 --feedback
+'''
+
+import argparse
+import collections
+import random
+import socket
+import subprocess
+import sys
+import threading
+import time
+
+from DobotTCP import Feedback, Kinematics
+
+
+class SimulatedRobot:
+    """
+    Simulated state of a robot arm. Joint and Cartesian targets are tracked independently, the simulator does not compute kinematics for motions. PositiveKin and InverseKin are answered with Kinematics if NumPy is installed.
+
+    Attributes:
+        robotType (int): Robot type reported by the simulator. Default is 150 (Magician E6).
+        moveTime (float): Execution time of a motion command. Unit: s. Default is 0.5.
+        commandTimes (dict): Execution time per command name, overriding moveTime. Unit: s.
+        robotMode (int): Current robot mode, see Dobot.robot_modes.
+        joints (list): Current joint angles J1-J6. Unit: degree.
+        pose (list): Current Cartesian pose X,Y,Z,Rx,Ry,Rz. Unit: mm and degree.
+        digitalInputs (dict): Digital input states by index. Set these to simulate sensors.
+        digitalOutputs (dict): Digital output states by index.
+        currentCommandID (int): ID of the queue command that is executing or was executed last.
+    """
+
+    # Commands executed in the motion queue. The value is True for motions, which take moveTime to execute
+    queue_commands = {
+        "MovJ": True, "MovL": True, "Arc": True, "Circle": True,
+        "RelMovJTool": True, "RelMovLTool": True, "RelMovJUser": True, "RelMovLUser": True, "RelJointMovJ": True,
+        "DO": False, "ToolDO": False, "AO": False, "SetPayload": False,
+    }
+
+    def __init__(self, robotType:int=150, moveTime:float=0.5):
+        self.robotType = robotType
+        self.moveTime = moveTime
+        self.commandTimes = {}
+        self.lock = threading.RLock()
+        self.robotMode = 4
+        self.joints = [0.0] * 6
+        self.pose = [300.0, 0.0, 300.0, 180.0, 0.0, 0.0]
+        self.targetJoints = list(self.joints)
+        self.targetPose = list(self.pose)
+        self.digitalInputs = collections.defaultdict(int)
+        self.digitalOutputs = collections.defaultdict(int)
+        self.toolDigitalOutputs = collections.defaultdict(int)
+        self.analogOutputs = collections.defaultdict(float)
+        self.holdRegs = collections.defaultdict(int)
+        self.speedFactor = 100
+        self.user = 0
+        self.tool = 0
+        self.payload = 0.0
+        self.commandID = 0
+        self.currentCommandID = 0
+        self.queue = collections.deque()
+        self.queueEnd = 0.0
+        self.startTime = time.monotonic()
+
+    def Enqueue(self, name:str, joints:list=None, pose:list=None, action=None) -> int:
+        """
+        Add a command to the motion queue.
+
+        Args:
+            name (string): Command name, used to look up the execution time.
+            joints (list): Joint target of a joint space motion.
+            pose (list): Cartesian target of a Cartesian motion.
+            action (callable): Called when the command is executed, e.g. to set an output.
+
+        Returns:
+            The queue ID of the command.
+
+        Example:
+            Enqueue("MovJ", joints=[0,0,90,0,90,0])
+        """
+        with self.lock:
+            now = time.monotonic()
+            self.Update(now)
+            duration = self.commandTimes.get(name, self.moveTime if self.queue_commands.get(name) else 0.0)
+            start = max(now, self.queueEnd)
+            self.queueEnd = start + duration
+            self.commandID += 1
+            entry = {"id": self.commandID, "start": start, "end": self.queueEnd, "action": action,
+                     "fromJoints": list(self.targetJoints), "fromPose": list(self.targetPose), "joints": joints, "pose": pose}
+            if joints is not None:
+                self.targetJoints = list(joints)
+            if pose is not None:
+                self.targetPose = list(pose)
+            self.queue.append(entry)
+            self.Update(now)
+            return self.commandID
+
+    def Update(self, now:float=None) -> None:
+        """
+        Advance the motion queue to the given time.
+
+        Args:
+            now (float): Monotonic time. Default is the current time.
+
+        Example:
+            Update()
+        """
+        with self.lock:
+            now = time.monotonic() if now is None else now
+            while self.queue and self.queue[0]["start"] <= now:
+                entry = self.queue[0]
+                self.currentCommandID = entry["id"]
+                if entry["end"] > now:
+                    # Interpolate the running motion
+                    ratio = (now - entry["start"]) / (entry["end"] - entry["start"])
+                    if entry["joints"] is not None:
+                        self.joints = [a + (b - a) * ratio for a, b in zip(entry["fromJoints"], entry["joints"])]
+                    if entry["pose"] is not None:
+                        self.pose = [a + (b - a) * ratio for a, b in zip(entry["fromPose"], entry["pose"])]
+                    break
+                if entry["joints"] is not None:
+                    self.joints = list(entry["joints"])
+                if entry["pose"] is not None:
+                    self.pose = list(entry["pose"])
+                if entry["action"] is not None:
+                    entry["action"]()
+                self.queue.popleft()
+            if self.robotMode in (5, 7):
+                self.robotMode = 7 if self.queue else 5
+
+    def ClearQueue(self) -> None:
+        """
+        Stop the motion queue at the current state.
+
+        Example:
+            ClearQueue()
+        """
+        with self.lock:
+            self.Update()
+            self.queue.clear()
+            self.queueEnd = 0.0
+            self.targetJoints = list(self.joints)
+            self.targetPose = list(self.pose)
+            if self.robotMode == 7:
+                self.robotMode = 5
+
+
+class DashboardSimulator:
+    """
+    TCP server emulating the dashboard port of the robot controller.
+
+    Attributes:
+        robot (SimulatedRobot): The simulated robot state. Can be shared with a feedback simulator.
+        ip (string): Address the server listens on.
+        port (int): Port the server listens on. Set to 0 on construction to pick a free port.
+        latency (float): Delay before each reply is sent, emulating the network. Unit: s.
+        strict (bool): Answer unknown commands with error -10000 (True) or accept them with an empty reply (False).
+        commandCount (int): Number of commands answered.
+    """
+
+    def __init__(self, robot:SimulatedRobot=None, host:str="127.0.0.1", port:int=29999, latency:float=0, strict:bool=False):
+        """
+        Constructor for the dashboard simulator.
+
+        Args:
+            robot (SimulatedRobot): The simulated robot state. Default is a new SimulatedRobot.
+            host (string): Interface to listen on. Default is 127.0.0.1.
+            port (int): Port to listen on. 0 picks a free port. Default is 29999.
+            latency (float): Delay before each reply is sent. Unit: s. Default is 0.
+            strict (bool): Answer unknown commands with error -10000. Default is False.
+        """
+        self.robot = robot if robot is not None else SimulatedRobot()
+        self.latency = latency
+        self.strict = strict
+        self.commandCount = 0
+        self.server = socket.create_server((host, port))
+        self.ip, self.port = self.server.getsockname()[:2]
+        self.thread = None
+        self.handlers = {
+            "EnableRobot": self.EnableRobot, "DisableRobot": self.DisableRobot, "ClearError": self.ClearError,
+            "PowerOn": self.Accept, "RequestControl": self.Accept, "Stop": self.Stop, "EmergencyStop": self.Stop,
+            "RobotMode": self.RobotMode, "GetAngle": self.GetAngle, "GetPose": self.GetPose, "GetErrorID": self.GetErrorID,
+            "GetCurrentCommandID": self.GetCurrentCommandID, "SpeedFactor": self.SpeedFactor, "User": self.User, "Tool": self.Tool,
+            "MovJ": self.Move, "MovL": self.Move, "Arc": self.Move, "Circle": self.Move,
+            "RelMovJTool": self.RelMove, "RelMovLTool": self.RelMove, "RelMovJUser": self.RelMove, "RelMovLUser": self.RelMove,
+            "RelJointMovJ": self.RelJointMove, "ServoJ": self.ServoJ, "ServoP": self.ServoP,
+            "DO": self.DO, "DOInstant": self.DOInstant, "GetDO": self.GetDO, "ToolDO": self.ToolDO, "ToolDOInstant": self.ToolDOInstant,
+            "GetToolDO": self.GetToolDO, "DI": self.DI, "DIGroup": self.DIGroup, "DOGroup": self.DOGroup, "GetDOGroup": self.GetDOGroup,
+            "AO": self.AO, "AOInstant": self.AOInstant, "GetAO": self.GetAO, "SetPayload": self.SetPayload,
+            "GetHoldRegs": self.GetHoldRegs, "GetInRegs": self.GetHoldRegs, "SetHoldRegs": self.SetHoldRegs,
+            "PositiveKin": self.PositiveKin, "InverseKin": self.InverseKin,
+        }
+        self.kinematics = None
+
+    def Start(self) -> "DashboardSimulator":
+        """
+        Serve connections in a background thread.
+
+        Returns:
+            The simulator itself.
+
+        Example:
+            DashboardSimulator(port=0).Start()
+        """
+        self.thread = threading.Thread(target=self.Serve, daemon=True)
+        self.thread.start()
+        return self
+
+    def Serve(self) -> None:
+        """
+        Serve connections until the simulator is closed. Each connection is handled in its own thread.
+
+        Example:
+            Serve()
+        """
+        while True:
+            try:
+                client, _ = self.server.accept()
+            except OSError:
+                return
+            threading.Thread(target=self.HandleClient, args=(client,), daemon=True).start()
+
+    def Close(self) -> None:
+        """
+        Stop accepting connections.
+
+        Example:
+            Close()
+        """
+        self.server.close()
+
+    @staticmethod
+    def Spawn(port:int=29999, latency:float=0, moveTime:float=0.5, feedback:bool=False, timeout:float=5) -> subprocess.Popen:
+        """
+        Start the simulator as a subprocess on localhost and wait until it accepts connections.
+
+        Args:
+            port (int): Port to listen on. Default is 29999.
+            latency (float): Delay before each reply is sent. Unit: s. Default is 0.
+            moveTime (float): Execution time of a motion command. Unit: s. Default is 0.5.
+            feedback (bool): Also serve the feedback ports 30004, 30005 and 30006. Default is False.
+            timeout (float): Time to wait for the subprocess to start. Unit: s. Default is 5.
+
+        Returns:
+            The subprocess. Call terminate() to stop it.
+
+        Example:
+            process = DashboardSimulator.Spawn(29999)
+        """
+        command = [sys.executable, __file__, "--port", str(port), "--latency", str(latency), "--move-time", str(moveTime)]
+        process = subprocess.Popen(command + (["--feedback"] if feedback else []))
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                socket.create_connection(("127.0.0.1", port), 0.1).close()
+                return process
+            except OSError:
+                if time.monotonic() > deadline or process.poll() is not None:
+                    process.terminate()
+                    raise Exception(f"  ! Simulator did not start on port {port}")
+                time.sleep(0.02)
+
+    def HandleClient(self, client:socket.socket) -> None:
+        """
+        Answer the commands of one client until it disconnects.
+
+        Args:
+            client (socket): The client connection.
+        """
+        client.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        pending = b""
+        with client:
+            while True:
+                try:
+                    data = client.recv(65536)
+                except OSError:
+                    return
+                if not data:
+                    return
+                pending += data
+                *commands, pending = pending.split(b"\n")
+                replies = [self.Reply(command.decode().strip()) for command in commands if command.strip()]
+                if replies:
+                    if self.latency:
+                        time.sleep(self.latency)
+                    try:
+                        client.sendall("".join(replies).encode())
+                    except OSError:
+                        return
+
+    def Reply(self, command:str) -> str:
+        """
+        Execute a command on the simulated robot and format the reply.
+
+        Args:
+            command (string): The command line, e.g. MovJ(pose={200,200,200,0,0,0}).
+
+        Returns:
+            The reply in the format err,{value},command;
+
+        Example:
+            Reply("RobotMode()")
+        """
+        name, _, arguments = command.partition("(")
+        args, kwargs = self.ParseArguments(arguments[:-1] if arguments.endswith(")") else arguments)
+        handler = self.handlers.get(name)
+        if handler is None:
+            error, value = (-10000, "") if self.strict else (0, "")
+        else:
+            try:
+                error, value = handler(name, args, kwargs)
+            except (IndexError, ValueError, TypeError):
+                error, value = -20000, ""
+        self.commandCount += 1
+        return f"{error},{{{value}}},{command};"
+
+    @staticmethod
+    def ParseArguments(text:str) -> tuple:
+        """
+        Split a command argument string into positional and keyword arguments. Values in curly brackets become lists of floats, numbers become floats. Points (pose={...} or joint={...}) stay positional as tuples (kind, values) to keep their order.
+
+        Args:
+            text (string): The argument string, e.g. pose={1,2,3,4,5,6},user=0
+
+        Returns:
+            A tuple (args, kwargs).
+
+        Example:
+            ParseArguments("pose={1,2,3,4,5,6},user=0")
+        """
+        parts, depth, start = [], 0, 0
+        for i, char in enumerate(text):
+            if char == "{":
+                depth += 1
+            elif char == "}":
+                depth -= 1
+            elif char == "," and depth == 0:
+                parts.append(text[start:i])
+                start = i + 1
+        parts.append(text[start:])
+        args, kwargs = [], {}
+        for part in parts:
+            part = part.strip()
+            if not part:
+                continue
+            key, separator, value = part.partition("=")
+            key = key.strip()
+            if separator and key in ("pose", "joint"):
+                args.append((key, DashboardSimulator.ParseValue(value)))
+            elif separator and "{" not in key:
+                kwargs[key] = DashboardSimulator.ParseValue(value)
+            else:
+                args.append(DashboardSimulator.ParseValue(part))
+        return args, kwargs
+
+    @staticmethod
+    def ParseValue(text:str):
+        text = text.strip()
+        if text.startswith("{") and text.endswith("}"):
+            return [float(value) for value in text[1:-1].split(",") if value.strip()]
+        try:
+            return float(text)
+        except ValueError:
+            return text
+
+    @staticmethod
+    def FormatValues(values:list) -> str:
+        return ",".join(f"{value:.6f}" for value in values)
+
+    # Command handlers. Each returns a tuple (error code, reply value).
+
+    def Accept(self, name, args, kwargs):
+        return 0, ""
+
+    def EnableRobot(self, name, args, kwargs):
+        with self.robot.lock:
+            self.robot.robotMode = 5
+            if args:
+                self.robot.payload = args[0]
+        return 0, ""
+
+    def DisableRobot(self, name, args, kwargs):
+        with self.robot.lock:
+            self.robot.ClearQueue()
+            self.robot.robotMode = 4
+        return 0, ""
+
+    def ClearError(self, name, args, kwargs):
+        with self.robot.lock:
+            if self.robot.robotMode == 9:
+                self.robot.robotMode = 5
+        return 0, ""
+
+    def Stop(self, name, args, kwargs):
+        self.robot.ClearQueue()
+        return 0, ""
+
+    def RobotMode(self, name, args, kwargs):
+        self.robot.Update()
+        return 0, self.robot.robotMode
+
+    def GetAngle(self, name, args, kwargs):
+        self.robot.Update()
+        return 0, self.FormatValues(self.robot.joints)
+
+    def GetPose(self, name, args, kwargs):
+        self.robot.Update()
+        return 0, self.FormatValues(self.robot.pose)
+
+    def Kinematics(self) -> Kinematics:
+        if self.kinematics is None or self.kinematics.robotType != self.robot.robotType:
+            self.kinematics = Kinematics(self.robot.robotType)
+        return self.kinematics
+
+    def PositiveKin(self, name, args, kwargs):
+        try:
+            pose = self.Kinematics().Forward(args[:6])
+        except ImportError:
+            return -10000, ""
+        return 0, self.FormatValues(pose)
+
+    def InverseKin(self, name, args, kwargs):
+        near = kwargs.get("JointNear") if kwargs.get("useJointNear") == 1 else None
+        try:
+            joints = self.Kinematics().Inverse(args[:6], jointNear=near or None)
+        except ImportError:
+            return -10000, ""
+        if joints[0] != joints[0]:
+            # No solution within the joint limits
+            return -1, ""
+        return 0, self.FormatValues(joints)
+
+    def GetErrorID(self, name, args, kwargs):
+        return 0, "[[],[],[],[],[],[],[]]"
+
+    def GetCurrentCommandID(self, name, args, kwargs):
+        self.robot.Update()
+        return 0, self.robot.currentCommandID
+
+    def SpeedFactor(self, name, args, kwargs):
+        self.robot.speedFactor = int(args[0]) if args else self.robot.speedFactor
+        return 0, ""
+
+    def User(self, name, args, kwargs):
+        self.robot.user = int(args[0])
+        return 0, ""
+
+    def Tool(self, name, args, kwargs):
+        self.robot.tool = int(args[0])
+        return 0, ""
+
+    def SetPayload(self, name, args, kwargs):
+        def action():
+            if args and isinstance(args[0], float):
+                self.robot.payload = args[0]
+        return self.Queue(name, action=action)
+
+    def Queue(self, name, joints=None, pose=None, action=None):
+        # Queue commands are rejected unless the robot is enabled
+        if self.robot.robotMode not in (5, 7):
+            return -1, ""
+        return 0, self.robot.Enqueue(name, joints, pose, action)
+
+    def Move(self, name, args, kwargs):
+        # Arc and Circle pass the intermediate point first, the last point is the target
+        kind, target = [arg for arg in args if isinstance(arg, tuple)][-1]
+        if len(target) != 6:
+            return -20000, ""
+        if kind == "joint":
+            return self.Queue(name, joints=target)
+        return self.Queue(name, pose=target)
+
+    def RelMove(self, name, args, kwargs):
+        offsets = [float(value) for value in args[:6]]
+        with self.robot.lock:
+            target = [a + b for a, b in zip(self.robot.targetPose, offsets)]
+            return self.Queue(name, pose=target)
+
+    def RelJointMove(self, name, args, kwargs):
+        offsets = [float(value) for value in args[:6]]
+        with self.robot.lock:
+            target = [a + b for a, b in zip(self.robot.targetJoints, offsets)]
+            return self.Queue(name, joints=target)
+
+    def ServoJ(self, name, args, kwargs):
+        with self.robot.lock:
+            self.robot.ClearQueue()
+            self.robot.joints = [float(value) for value in args[:6]]
+            self.robot.targetJoints = list(self.robot.joints)
+        return 0, ""
+
+    def ServoP(self, name, args, kwargs):
+        with self.robot.lock:
+            self.robot.ClearQueue()
+            self.robot.pose = [float(value) for value in args[:6]]
+            self.robot.targetPose = list(self.robot.pose)
+        return 0, ""
+
+    def DO(self, name, args, kwargs):
+        index, status = int(args[0]), int(args[1])
+        return self.Queue(name, action=lambda: self.robot.digitalOutputs.__setitem__(index, status))
+
+    def DOInstant(self, name, args, kwargs):
+        self.robot.digitalOutputs[int(args[0])] = int(args[1])
+        return 0, ""
+
+    def GetDO(self, name, args, kwargs):
+        self.robot.Update()
+        return 0, self.robot.digitalOutputs[int(args[0])]
+
+    def ToolDO(self, name, args, kwargs):
+        index, status = int(args[0]), int(args[1])
+        return self.Queue(name, action=lambda: self.robot.toolDigitalOutputs.__setitem__(index, status))
+
+    def ToolDOInstant(self, name, args, kwargs):
+        self.robot.toolDigitalOutputs[int(args[0])] = int(args[1])
+        return 0, ""
+
+    def GetToolDO(self, name, args, kwargs):
+        self.robot.Update()
+        return 0, self.robot.toolDigitalOutputs[int(args[0])]
+
+    def DI(self, name, args, kwargs):
+        return 0, self.robot.digitalInputs[int(args[0])]
+
+    def DIGroup(self, name, args, kwargs):
+        return 0, ",".join(str(self.robot.digitalInputs[int(index)]) for index in args)
+
+    def DOGroup(self, name, args, kwargs):
+        for index, status in zip(args[::2], args[1::2]):
+            self.robot.digitalOutputs[int(index)] = int(status)
+        return 0, ""
+
+    def GetDOGroup(self, name, args, kwargs):
+        self.robot.Update()
+        return 0, ",".join(str(self.robot.digitalOutputs[int(index)]) for index in args)
+
+    def AO(self, name, args, kwargs):
+        index, value = int(args[0]), float(args[1])
+        return self.Queue(name, action=lambda: self.robot.analogOutputs.__setitem__(index, value))
+
+    def AOInstant(self, name, args, kwargs):
+        self.robot.analogOutputs[int(args[0])] = float(args[1])
+        return 0, ""
+
+    def GetAO(self, name, args, kwargs):
+        self.robot.Update()
+        return 0, f"{self.robot.analogOutputs[int(args[0])]:.6f}"
+
+    def GetHoldRegs(self, name, args, kwargs):
+        address, count = int(args[1]), int(args[2])
+        return 0, ",".join(str(self.robot.holdRegs[address + i]) for i in range(count))
+
+    def SetHoldRegs(self, name, args, kwargs):
+        address, values = int(args[1]), args[3]
+        for i, value in enumerate(values):
+            self.robot.holdRegs[address + i] = int(value)
+        return 0, ""
+
+
+class FeedbackSimulator:
+    """
+    TCP server emulating a real-time feedback port of the robot controller. Every connected client receives the same 1440 byte frames at a fixed period.
+
+    Attributes:
+        robot (SimulatedRobot): The simulated robot state, usually shared with a DashboardSimulator.
+        ip (string): Address the server listens on.
+        port (int): Port the server listens on.
+        period (float): Time between two frames. Unit: s.
+        jitter (float): Maximum random deviation of the send time of a frame. Unit: s.
+        dropRate (float): Probability that a frame is not sent. Range: [0,1].
+        frameCount (int): Number of frames generated.
+        droppedCount (int): Number of frames dropped on purpose.
+    """
+
+    # Default frame periods of the feedback ports in s
+    feedback_periods = {30004: 0.008, 30005: 0.2, 30006: 0.008}
+
+    # Frame layout shared with the feedback parser
+    frame_layout = Feedback.frame_layout
+    frame_struct = Feedback.frame_struct
+
+    def __init__(self, robot:SimulatedRobot=None, host:str="127.0.0.1", port:int=30004, period:float=None, jitter:float=0, dropRate:float=0):
+        """
+        Constructor for the feedback simulator.
+
+        Args:
+            robot (SimulatedRobot): The simulated robot state. Default is a new SimulatedRobot.
+            host (string): Interface to listen on. Default is 127.0.0.1.
+            port (int): Port to listen on. 0 picks a free port. Default is 30004.
+            period (float): Time between two frames. Unit: s. Default is the period of the port (8 ms for 30004 and 30006, 200 ms for 30005).
+            jitter (float): Maximum random deviation of the send time of a frame. Unit: s. Default is 0.
+            dropRate (float): Probability that a frame is not sent. Range: [0,1]. Default is 0.
+        """
+        self.robot = robot if robot is not None else SimulatedRobot()
+        self.period = period if period is not None else self.feedback_periods.get(port, 0.008)
+        self.jitter = jitter
+        self.dropRate = dropRate
+        self.frameCount = 0
+        self.droppedCount = 0
+        self.clients = []
+        self.server = socket.create_server((host, port))
+        self.ip, self.port = self.server.getsockname()[:2]
+        self.running = False
+        self.threads = []
+        self._previousJoints = None
+        self._previousPose = None
+        self._previousTime = None
+
+    def Start(self) -> "FeedbackSimulator":
+        """
+        Accept clients and send frames in background threads.
+
+        Returns:
+            The simulator itself.
+
+        Example:
+            FeedbackSimulator(port=0).Start()
+        """
+        self.running = True
+        self.threads = [threading.Thread(target=self.Accept, daemon=True), threading.Thread(target=self.Send, daemon=True)]
+        for thread in self.threads:
+            thread.start()
+        return self
+
+    def Close(self) -> None:
+        """
+        Stop sending frames and close all connections.
+
+        Example:
+            Close()
+        """
+        self.running = False
+        self.server.close()
+        for client in list(self.clients):
+            client.close()
+
+    def Accept(self) -> None:
+        """
+        Accept clients until the simulator is closed.
+        """
+        while True:
+            try:
+                client, _ = self.server.accept()
+            except OSError:
+                return
+            client.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self.clients.append(client)
+
+    def Send(self) -> None:
+        """
+        Send frames at a fixed period to all clients until the simulator is closed. Deadlines are absolute, so jitter does not accumulate.
+        """
+        deadline = time.monotonic()
+        while self.running:
+            deadline += self.period
+            delay = deadline - time.monotonic() + (random.uniform(-self.jitter, self.jitter) if self.jitter else 0)
+            if delay > 0:
+                time.sleep(delay)
+            frame = self.Frame()
+            if self.dropRate and random.random() < self.dropRate:
+                self.droppedCount += 1
+                continue
+            for client in list(self.clients):
+                try:
+                    client.sendall(frame)
+                except OSError:
+                    self.clients.remove(client)
+                    client.close()
+
+    def Frame(self, now:float=None) -> bytes:
+        """
+        Pack the current state of the simulated robot into a feedback frame. Running motions are interpolated to the given time.
+
+        Args:
+            now (float): Monotonic time. Default is the current time.
+
+        Returns:
+            The 1440 byte frame.
+
+        Example:
+            Frame()
+        """
+        robot = self.robot
+        now = time.monotonic() if now is None else now
+        with robot.lock:
+            robot.Update(now)
+            joints, pose = list(robot.joints), list(robot.pose)
+            # Speeds from the change since the previous frame
+            if self._previousTime is not None and now > self._previousTime:
+                dt = now - self._previousTime
+                jointSpeeds = [(a - b) / dt for a, b in zip(joints, self._previousJoints)]
+                poseSpeeds = [(a - b) / dt for a, b in zip(pose, self._previousPose)]
+            else:
+                jointSpeeds, poseSpeeds = [0.0] * 6, [0.0] * 6
+            self._previousJoints, self._previousPose, self._previousTime = joints, pose, now
+            values = {
+                "MessageSize": 1440,
+                "DigitalInputs": self.PackBits(robot.digitalInputs),
+                "DigitalOutputs": self.PackBits(robot.digitalOutputs),
+                "RobotMode": robot.robotMode,
+                "TimeStamp": int(time.time() * 1000),
+                "RunTime": int((now - robot.startTime) * 1000),
+                "SpeedScaling": robot.speedFactor,
+                "QTarget": robot.targetJoints, "QActual": joints, "QDActual": jointSpeeds,
+                "ToolVectorTarget": robot.targetPose, "ToolVectorActual": pose, "TCPSpeedActual": poseSpeeds,
+                "UserCoordinateSystem": robot.user, "ToolCoordinateSystem": robot.tool,
+                "VelocityRatio": robot.speedFactor, "AccelerationRatio": robot.speedFactor,
+                "XYZVelocityRatio": robot.speedFactor, "RVelocityRatio": robot.speedFactor,
+                "XYZAccelerationRatio": robot.speedFactor, "RAccelerationRatio": robot.speedFactor,
+                "BrakeStatus": 0 if robot.robotMode == 3 else 63,
+                "EnableStatus": int(robot.robotMode in (5, 6, 7, 8)),
+                "RunningStatus": int(robot.robotMode == 7),
+                "ErrorStatus": int(robot.robotMode == 9),
+                "CollisionState": int(robot.robotMode == 11),
+                "RobotType": robot.robotType,
+                "RunQueuedCmd": int(bool(robot.queue)),
+                "CurrentCommandID": robot.currentCommandID,
+                "Payload": robot.payload,
+                "ActualQuaternion": (1.0, 0.0, 0.0, 0.0), "TargetQuaternion": (1.0, 0.0, 0.0, 0.0),
+            }
+        self.frameCount += 1
+        return self.frame_struct.pack(*self.FrameValues(values))
+
+    @classmethod
+    def FrameValues(cls, values:dict) -> list:
+        """
+        Flatten field values into the argument list of frame_struct. Missing fields are zero.
+
+        Args:
+            values (dict): Field values by field name.
+
+        Returns:
+            The flat list of values.
+        """
+        flat = []
+        for fmt, key in cls.frame_layout:
+            if key is None:
+                continue
+            count = int(fmt[:-1]) if len(fmt) > 1 else 1
+            value = values.get(key, 0)
+            if count == 1:
+                flat.append(value)
+            else:
+                flat.extend(value if value else [0] * count)
+        return flat
+
+    @staticmethod
+    def PackBits(states:dict) -> int:
+        # Index 1 is the lowest bit
+        return sum(1 << (index - 1) for index, state in states.items() if state and 1 <= index <= 64)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Simulate the dashboard port of a Dobot robot controller on localhost.")
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to listen on. Default is 127.0.0.1.")
+    parser.add_argument("--port", type=int, default=29999, help="Dashboard port. Default is 29999.")
+    parser.add_argument("--latency", type=float, default=0, help="Delay before each reply in s. Default is 0.")
+    parser.add_argument("--move-time", type=float, default=0.5, help="Execution time of a motion command in s. Default is 0.5.")
+    parser.add_argument("--robot-type", type=int, default=150, help="Simulated robot type. Default is 150 (Magician E6).")
+    parser.add_argument("--feedback", action="store_true", help="Also serve the feedback ports 30004, 30005 and 30006.")
+    parser.add_argument("--jitter", type=float, default=0, help="Maximum feedback send time deviation in s. Default is 0.")
+    parser.add_argument("--drop-rate", type=float, default=0, help="Probability of a dropped feedback frame. Default is 0.")
+    args = parser.parse_args()
+    simulator = DashboardSimulator(SimulatedRobot(args.robot_type, args.move_time), args.host, args.port, args.latency)
+    print(f"Dobot dashboard simulator listening on {simulator.ip}:{simulator.port}")
+    if args.feedback:
+        for port in FeedbackSimulator.feedback_periods:
+            FeedbackSimulator(simulator.robot, args.host, port, jitter=args.jitter, dropRate=args.drop_rate).Start()
+            print(f"Dobot feedback simulator listening on {simulator.ip}:{port}")
+    try:
+        simulator.Serve()
+    except KeyboardInterrupt:
+        simulator.Close()
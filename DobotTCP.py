@@ -12,17 +12,190 @@ Version:
     1.1.6 (15.01.2026)
 
 Classes:
+    Dispatcher: A class for resolving overloaded commands by argument count and keyword names.
     Dobot: A class for controlling the Dobot robot arms using TCP/IP communication.
+    DobotPipeline: A class for sending a batch of commands without waiting for each reply.
+    ServoStreamer: A class for streaming ServoJ and ServoP setpoints at a fixed rate.
+    Kinematics: A class for computing forward and inverse kinematics of whole paths locally.
+    PathValidator: A class for checking joint limits, reachability and safety zones of a whole path before sending it.
+    AsyncDobot: A class for controlling the Dobot robot arms with asyncio.
     FlexGripper: A class for controlling the FlexGripper attached to the Dobot robot arm.
     ServoGripper: A class for controlling the ServoGripper attached to the Dobot robot arm.
     Feedback: A class for getting feedback from the Dobot robot arm.
+    FeedbackFrame: A class for reading the fields of a feedback frame on access.
+    FeedbackEvent: A class describing an edge or change detected by FeedbackEvents.
+    FeedbackEvents: A class for calling functions on edges of IO bits and changes of feedback fields.
+    MotionTracker: A class for waiting on queued motions with the CurrentCommandID of the feedback stream.
+    FeedbackRecorder: A class for recording raw feedback frames to segmented files with a time index.
+    FeedbackLog: A class for reading recorded feedback frames by time through memory mapping.
+    FeedbackHub: A class for sharing one feedback connection between many subscribers.
+    FeedbackSubscription: A class for receiving the frames of a FeedbackHub.
+    SharedFeedbackPublisher: A class for publishing feedback frames to other processes through shared memory.
+    SharedFeedbackReader: A class for reading feedback frames published through shared memory.
+    AsyncFeedback: A class for getting feedback from the Dobot robot arm with asyncio.
 '''
 
+import asyncio
+import bisect
+import collections
+import concurrent.futures
+import inspect
+import mmap
+import multiprocessing.shared_memory
+import numbers
+import os
+import queue
 import socket
 import struct
+import sys
+import threading
 import time
 
-from multipledispatch import dispatch
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class Dispatcher:
+    """
+    Overloaded command. The overloads are collected by the dispatch decorator and compiled into a lookup table by argument count when the class is created.
+
+    Attributes:
+        name (string): The command name.
+        overloads (list): The overloads as (types, function, parameter names, minimum argument count).
+        table (dict): Argument count to the overloads accepting it, the one with the fewest parameters first.
+        cache (dict): Argument types (the type itself for a single argument) to the overload resolved for them and the parameter types, or None if no conversion is needed.
+    """
+
+    def __init__(self, name:str):
+        self.name = name
+        self.overloads = []
+        self.table = {}
+        self.cache = {}
+
+    def Add(self, types:tuple, function) -> None:
+        """
+        Add an overload.
+
+        Args:
+            types (tuple): Argument types. Integers are accepted for float arguments.
+            function (function): The implementation.
+        """
+        parameters = list(inspect.signature(function).parameters.values())[1:]
+        if len(types) != len(parameters):
+            raise Exception(f"  ! {self.name} declares {len(types)} argument types for {len(parameters)} parameters")
+        required = sum(1 for parameter in parameters if parameter.default is inspect.Parameter.empty)
+        self.overloads.append((types, function, tuple(parameter.name for parameter in parameters), required))
+
+    def __set_name__(self, owner, name:str) -> None:
+        # Build the lookup table once and replace the dispatcher by a plain function
+        for overload in sorted(self.overloads, key=lambda overload: len(overload[2])):
+            for count in range(overload[3], len(overload[2]) + 1):
+                self.table.setdefault(count, []).append(overload)
+        # Argument counts with a single overload skip the type checks, unless a float may need conversion for an int parameter
+        direct = {count: overloads[0][1] for count, overloads in self.table.items() if len(overloads) == 1}
+        convert = {count for count, overloads in self.table.items() if int in overloads[0][0][:count]}
+        cache = self.cache
+        resolve = self.Resolve
+
+        def method(robot, *args, **kwargs):
+            if not kwargs:
+                count = len(args)
+                function = direct.get(count)
+                if function is not None and (count not in convert or float not in map(type, args)):
+                    return function(robot, *args)
+                entry = cache.get(type(args[0]) if count == 1 else tuple(map(type, args)))
+                if entry is not None:
+                    function, types = entry
+                    if types is None:
+                        return function(robot, *args)
+                    converted = Dispatcher.Convert(types, args)
+                    if converted is not None:
+                        return function(robot, *converted)
+            function, args, kwargs = resolve(args, kwargs)
+            return function(robot, *args, **kwargs)
+
+        method.__name__ = name
+        method.__qualname__ = f"{owner.__name__}.{name}"
+        method.__doc__ = "\n".join(f"{name}{inspect.signature(function)}\n{inspect.getdoc(function) or ''}\n" for _, function, _, _ in self.overloads)
+        method.dispatcher = self
+        setattr(owner, name, method)
+
+    def Resolve(self, args:tuple, kwargs:dict) -> tuple:
+        """
+        Find the overload for a call. Among the overloads accepting the argument count and keyword names, the first one with matching argument types and the fewest parameters is used.
+
+        Args:
+            args (tuple): Positional arguments.
+            kwargs (dict): Keyword arguments.
+
+        Returns:
+            The implementation, the positional and the keyword arguments, with integral floats converted for int parameters.
+
+        Raises:
+            TypeError: If no overload matches.
+        """
+        # Set if an overload was skipped only because a float was not integral, the choice then depends on the values
+        dependent = False
+        for types, function, names, required in self.table.get(len(args) + len(kwargs), ()):
+            if kwargs and not kwargs.keys() <= set(names[len(args):]):
+                continue
+            converted = self.Convert(types, args)
+            if converted is None:
+                dependent = dependent or self.Convert(types, tuple(0.0 if type(arg) is float else arg for arg in args)) is not None
+            else:
+                if kwargs:
+                    # Keyword arguments get the same conversion, but are not used to choose the overload
+                    for key, value in kwargs.items():
+                        if types[names.index(key)] is int and isinstance(value, float) and value.is_integer():
+                            kwargs = {**kwargs, key: int(value)}
+                elif not dependent:
+                    # Calls whose arguments were converted keep the types, so the next call converts them again
+                    exact = all(a is b for a, b in zip(converted, args))
+                    self.cache[type(args[0]) if len(args) == 1 else tuple(map(type, args))] = (function, None if exact else types)
+                return function, converted, kwargs
+        raise TypeError(f"  ! No overload of {self.name} accepts {len(args)} arguments {tuple(type(arg).__name__ for arg in args)} and keywords {list(kwargs)}")
+
+    @staticmethod
+    def Convert(types:tuple, args:tuple) -> tuple:
+        # Check the positional arguments, None if they do not fit the types
+        converted = []
+        for kind, arg in zip(types, args):
+            if kind is float:
+                if not isinstance(arg, numbers.Real):
+                    return None
+            elif kind is int:
+                if isinstance(arg, float) and arg.is_integer():
+                    arg = int(arg)
+                elif not isinstance(arg, numbers.Integral):
+                    return None
+            elif not isinstance(arg, kind):
+                return None
+            converted.append(arg)
+        return tuple(converted)
+
+
+def dispatch(*types):
+    """
+    Decorator for an overload of a Dobot command. Overloads with the same name in a class body are resolved by argument count, keyword names and types.
+
+    Args:
+        types (type): Types of the arguments after self.
+
+    Example:
+        @dispatch(int, int)
+        def DO(self, index:int, status:int) -> tuple[str, str, str]:
+    """
+    def decorator(function) -> Dispatcher:
+        namespace = sys._getframe(1).f_locals
+        dispatcher = namespace.get(function.__name__)
+        if not isinstance(dispatcher, Dispatcher):
+            dispatcher = Dispatcher(function.__name__)
+        dispatcher.Add(types, function)
+        return dispatcher
+    return decorator
+
 
 class Dobot:
     '''
@@ -35,15 +208,68 @@ class Dobot:
         isEnabled (bool): The state of the robot arm. True if the robot is enabled, False otherwise.
         debugLevel (int): The level of debug information to print. 0: No debug information, 1: Print basic information. 2: Print parse information as well.
         response (tuple): The response from the robot arm.
+        recvBufferSize (int): Size of the receive buffer filled by each recv_into call. Default is 4096.
+        timeout (float): Time to wait for the reply to a command. Unit: s. Default is None (wait indefinitely).
+        connectTime (float): Duration of the last successful Connect call including retries. Unit: s.
+        autoReconnect (bool): Restore a broken connection in the background. See SetAutoReconnect. Default is False.
+        journal (deque): Commands (timestamp, command) that were sent but not yet acknowledged by the robot.
+        replayCommands (set): Names of commands that are resent after a reconnect. Default are the idempotent queries.
+        lock (RLock): Request lock held while a command is sent and its reply is read.
+        feedbackCache (Feedback): Feedback used to answer GetPose, GetAngle, RobotMode, DI and GetDO locally. See SetFeedbackCache. Default is None.
+        cacheMaxAge (float): Maximum age of a feedback frame used to answer a query. Unit: s. Default is 0.02.
+        cacheHits (int): Number of queries answered from the feedback.
+        cacheMisses (int): Number of queries sent to the robot because no fresh feedback frame was available.
+        kinematicsCache (OrderedDict): Replies of PositiveKin and InverseKin by rounded request. See SetKinematicsCache. Default is None.
+        kinematicsHits (int): Number of PositiveKin and InverseKin requests answered from the cache.
+        kinematicsMisses (int): Number of PositiveKin and InverseKin requests sent to the robot while the cache was enabled.
+        safeWalls (dict): Enable values of the safety walls by index, as last set with SetSafeWallEnable.
+        workZones (dict): Enable values of the work zones by index, as last set with SetWorkZoneEnable.
     
     '''
-    def __init__(self, ip='192.168.5.1', port=29999):
+    def __init__(self, ip='192.168.5.1', port=29999, recvBufferSize=4096):
         self.ip = ip
         self.port = port
         self.connection = None
         self.isEnabled = False
         self.debugLevel = 1
         self.response = ()
+        self.recvBufferSize = recvBufferSize
+        self._timeout = None
+        self.connectTime = None
+        self.autoReconnect = False
+        self.reconnectTimeout = 5
+        self.reconnectBackoff = 0.05
+        self.reconnectMaxBackoff = 2
+        self.journal = collections.deque(maxlen=64)
+        self.replayCommands = set(self.idempotent_commands)
+        self._reconnecting = False
+        self._reconnected = threading.Event()
+        self._reconnectLock = threading.Lock()
+        self._recvBuffer = bytearray(recvBufferSize)
+        self._recvView = memoryview(self._recvBuffer)
+        self._recvPending = bytearray()
+        self._staleReplies = collections.deque()
+        self._local = threading.local()
+        self.lock = threading.RLock()
+        self._worker = None
+        self._commandQueue = None
+        self._inFlight = collections.deque()
+        self._repliesDue = threading.Semaphore(0)
+        self.feedbackCache = None
+        self.cacheMaxAge = 0.02
+        self.cacheHits = 0
+        self.cacheMisses = 0
+        self._cacheLock = threading.Lock()
+        self.kinematicsCache = None
+        self.kinematicsCacheSize = 1024
+        self.kinematicsResolution = 0.001
+        self.kinematicsHits = 0
+        self.kinematicsMisses = 0
+        self.kinematicsRoundTrip = 0.0
+        self._kinematicsLock = threading.Lock()
+        self._kinematicsGeneration = 0
+        self.safeWalls = {}
+        self.workZones = {}
 
     # Error Codes:
     error_codes = {
@@ -68,6 +294,35 @@ class Dobot:
         -60002: "The range of the second optional parameter is incorrect: Ensure the optional parameter value is within the valid range."
     }
 
+    @property
+    def _pipeline(self) -> "DobotPipeline":
+        # Pipelines are per thread, so other threads keep sending directly
+        return getattr(self._local, "pipeline", None)
+
+    @_pipeline.setter
+    def _pipeline(self, pipeline:"DobotPipeline") -> None:
+        self._local.pipeline = pipeline
+
+    @property
+    def timeout(self) -> float:
+        return self._timeout
+
+    @timeout.setter
+    def timeout(self, timeout:float) -> None:
+        # Applied to the open connection as well, Connect applies it to new ones
+        self._timeout = timeout
+        connection = self.connection
+        if connection is not None:
+            connection.settimeout(timeout)
+
+    # Queries without side effects, safe to resend after a reconnect:
+    idempotent_commands = {
+        "RobotMode", "GetAngle", "GetPose", "GetErrorID", "PositiveKin", "InverseKin", "GetTrayPoint", "GetStartPose",
+        "GetDO", "GetDOGroup", "GetToolDO", "GetAO", "DI", "DIGroup", "ToolDI", "AI", "ToolAI",
+        "GetInBits", "GetInRegs", "GetCoils", "GetHoldRegs", "GetInputBool", "GetInputInt", "GetInputFloat",
+        "GetOutputBool", "GetOutputInt", "GetOutputFloat", "GetCurrentCommandID", "PathRecoveryStatus", "GetExportStatus", "GetForce"
+    }
+
     # Robot Modes:
     robot_modes = {
         1: "ROBOT_MODE_INIT: Initialized status",
@@ -222,7 +477,7 @@ class Dobot:
                 self.isEnabled = True
                 return response
 
-    @dispatch(float, float, float, float, int=0)
+    @dispatch(float, float, float, float, int)
     def EnableRobot(self, load:float, centerX:float, centerY:float, centerZ:float, isCheck:int) -> tuple[str, str, str]:
         """
         Enable the Dobot Magician E6 robot.
@@ -450,7 +705,7 @@ class Dobot:
             User(1)
         """
         if self.debugLevel > 0: print(f"  Setting user index to {index}")
-        return self.SendCommand(f"User({index})")
+        return self._SendFrameChange(f"User({index})")
 
     def SetUser(self, index:int, value:str, type:int=0) -> tuple[str, str, str]:
         """
@@ -468,7 +723,7 @@ class Dobot:
             SetUser(1, "{10,10,10,0,0,0}")
         """
         if self.debugLevel > 0: print(f"  Setting user coordinate system {index} to {value}. Type: {type}")
-        return self.SendCommand(f"SetUser({index},{value},{type})")
+        return self._SendFrameChange(f"SetUser({index},{value},{type})")
 
     def CalcUser(self, index:int, matrix:int, offset:int) -> tuple[str, str, str]:
         """
@@ -502,7 +757,7 @@ class Dobot:
             Tool(1)
         """
         if self.debugLevel > 0: print(f"  Setting tool index to {index}")
-        return self.SendCommand(f"Tool({index})")
+        return self._SendFrameChange(f"Tool({index})")
     
     def SetTool(self, index:int, value:str, type:int=0) -> tuple[str, str, str]:
         """
@@ -520,7 +775,7 @@ class Dobot:
             SetTool(1, "{10,10,10,0,0,0}")
         """
         if self.debugLevel > 0: print(f"  Setting tool coordinate system {index} to {value}. Type: {type}")
-        return self.SendCommand(f"SetTool({index},{value},{type})")
+        return self._SendFrameChange(f"SetTool({index},{value},{type})")
     
     def CalcTool(self, index:int, matrix:int, offset:str) -> tuple[str, str, str]:
         """
@@ -555,7 +810,7 @@ class Dobot:
             SetPayload("Load1")
         """
         if self.debugLevel > 0: print(f"  Setting payload to preset {name})")
-        return self.SendCommand(f"SetPayload({name})")
+        return self._SendFrameChange(f"SetPayload({name})")
 
     @dispatch(float)
     def SetPayload(self, load:float) -> tuple[str, str, str]:
@@ -572,7 +827,7 @@ class Dobot:
             SetPayload(0.5)
         """
         if self.debugLevel > 0: print(f"  Setting payload to {load} kg)")
-        return self.SendCommand(f"SetPayload({load})")
+        return self._SendFrameChange(f"SetPayload({load})")
 
     @dispatch(float, float, float, float)
     def SetPayload(self, load:float, x:float, y:float, z:float) -> tuple[str, str, str]:
@@ -592,7 +847,7 @@ class Dobot:
             SetPayload(0.5, 0, 0, 0)
         """
         if self.debugLevel > 0: print(f"  Setting payload to {load} kg at ({x},{y},{z})")
-        return self.SendCommand(f"SetPayload({load},{x},{y},{z})")
+        return self._SendFrameChange(f"SetPayload({load},{x},{y},{z})")
 
     def AccJ(self, R:int=100) -> tuple[str, str, str]:
         """
@@ -787,6 +1042,7 @@ class Dobot:
             SetSafeWallEnable(1, 1)
         """
         if self.debugLevel > 0: print(f"  Setting safety wall {index} to {value}")
+        self.safeWalls[index] = value
         return self.SendCommand(f"SetSafeWallEnable({index},{value})")
 
     def SetWorkZoneEnable(self, index:int, value:int) -> tuple[str, str, str]:
@@ -804,6 +1060,7 @@ class Dobot:
             SetWorkZoneEnable(1, 1)
         """
         if self.debugLevel > 0: print(f"  Setting work zone {index} to {value}")
+        self.workZones[index] = value
         return self.SendCommand(f"SetWorkZoneEnable({index},{value})")
 
 
@@ -823,6 +1080,10 @@ class Dobot:
             RobotMode()
         """
         if self.debugLevel > 0: print("  Getting robot mode...")
+        if self.feedbackCache is not None:
+            cached = self._CachedQuery("RobotMode()", lambda frame: str(frame.RobotMode))
+            if cached is not None:
+                return cached
         return self.SendCommand("RobotMode()")
     
     def PositiveKin(self, J1:float, J2:float, J3:float, J4:float, J5:float, J6:float, user:int=0, tool:int=0) -> tuple[str, str, str]:
@@ -846,7 +1107,10 @@ class Dobot:
             PositiveKin(0,0,-90,0,90,0,user=1,tool=1)
         """
         if self.debugLevel > 0: print(f"  Calculating positive kinematics of robot at ({J1},{J2},{J3},{J4},{J5},{J6})")
-        return self.SendCommand(f"PositiveKin({J1},{J2},{J3},{J4},{J5},{J6},user={user},tool={tool})")
+        command = f"PositiveKin({J1},{J2},{J3},{J4},{J5},{J6},user={user},tool={tool})"
+        if self.kinematicsCache is not None:
+            return self._KinematicsQuery(command, ("PositiveKin", J1, J2, J3, J4, J5, J6), (user, tool))
+        return self.SendCommand(command)
 
     def InverseKin(self, X:float, Y:float, Z:float, Rx:float, Ry:float, Rz:float, useJointNear:int=0, JointNear:str="", user:int=0, tool:int=0) -> tuple[str, str, str]:
         """
@@ -871,7 +1135,11 @@ class Dobot:
             InverseKin(473.000000,-141.000000,469.000000,-180.000000,0.000,-90.000)
         """
         if self.debugLevel > 0: print(f"  Calculating inverse kinematics of robot at ({X},{Y},{Z},{Rx},{Ry},{Rz})")
-        return self.SendCommand(f"InverseKin({X},{Y},{Z},{Rx},{Ry},{Rz},user={user},tool={tool},useJointNear={useJointNear},JointNear={JointNear})")
+        command = f"InverseKin({X},{Y},{Z},{Rx},{Ry},{Rz},user={user},tool={tool},useJointNear={useJointNear},JointNear={JointNear})"
+        if self.kinematicsCache is not None:
+            near = [value for value in JointNear.strip("{}").split(",") if value.strip()] if useJointNear else []
+            return self._KinematicsQuery(command, ("InverseKin", X, Y, Z, Rx, Ry, Rz, *near), (user, tool, useJointNear))
+        return self.SendCommand(command)
 
     def GetAngle(self) -> tuple[str, str, str]:
         """
@@ -887,6 +1155,10 @@ class Dobot:
             GetAngle()
         """
         if self.debugLevel > 0: print("  Getting robot joint angles...")
+        if self.feedbackCache is not None:
+            cached = self._CachedQuery("GetAngle()", lambda frame: ",".join(f"{value:.6f}" for value in frame.QActual))
+            if cached is not None:
+                return cached
         return self.SendCommand("GetAngle()")
 
     def GetPose(self, user:int=0, tool:int=0) -> tuple[str, str, str]:
@@ -904,6 +1176,12 @@ class Dobot:
             GetPose(user=1,tool=1)
         """
         if self.debugLevel > 0: print(f"  Getting robot pose with user={user},tool={tool}...")
+        if self.feedbackCache is not None:
+            # The feedback pose is given in the active user and tool coordinate systems
+            cached = self._CachedQuery(f"GetPose(user={user},tool={tool})", lambda frame: ",".join(f"{value:.6f}" for value in frame.ToolVectorActual)
+                                       if frame.UserCoordinateSystem == user and frame.ToolCoordinateSystem == tool else None)
+            if cached is not None:
+                return cached
         return self.SendCommand(f"GetPose(user={user},tool={tool})")
 
     def GetErrorID(self) -> tuple[str, str, str]:
@@ -1064,6 +1342,10 @@ class Dobot:
             GetDO(1)
         """
         if self.debugLevel > 0: print(f"  Getting digital output pin {index}")
+        if self.feedbackCache is not None and 1 <= index <= 64:
+            cached = self._CachedQuery(f"GetDO({index})", lambda frame: str(frame.DigitalOutputs >> (index - 1) & 1))
+            if cached is not None:
+                return cached
         return self.SendCommand(f"GetDO({index})")
 
     def DOGroup(self, values:str) -> tuple[str, str, str]:
@@ -1212,6 +1494,10 @@ class Dobot:
             DI(1)
         """
         if self.debugLevel > 0: print(f"  Getting digital input pin {index}")
+        if self.feedbackCache is not None and 1 <= index <= 64:
+            cached = self._CachedQuery(f"DI({index})", lambda frame: str(frame.DigitalInputs >> (index - 1) & 1))
+            if cached is not None:
+                return cached
         return self.SendCommand(f"DI({index})")
 
     def DIGroup(self, values:str) -> tuple[str, str, str]:
@@ -1910,7 +2196,7 @@ class Dobot:
         if self.debugLevel > 0: print(f"  Joint move robot to {P} with IO control {IO}")
         return self.SendCommand(f"MovJ({P},{IO})")
     
-    @dispatch(str, str, int, int, int, int, int, int)
+    @dispatch(str, str, int, int, int, int, int)
     def MovJIO(self, P:str, IO:str, user:int, tool:int, a:int, v:int, cp:int) -> tuple[str, str, str]:
         """
         Move the robot to a specified point through joint motion setting status of the digital output.
@@ -2475,7 +2761,7 @@ class Dobot:
         if self.debugLevel > 0: print(f"  Joint move robot to offset ({offset1},{offset2},{offset3},{offset4},{offset5},{offset6})")
         return self.SendCommand(f"RelJointMovJ({offset1},{offset2},{offset3},{offset4},{offset5},{offset6})")
 
-    @dispatch(float, float, float, float, float, float, int, int, int)
+    @dispatch(float, float, float, float, float, float, int, int, int, int, int)
     def RelJointMovJ(self, offset1:float, offset2:float, offset3:float, offset4:float, offset5:float, offset6:float, user:int, tool:int, a:int, v:int, cp:int) -> tuple[str, str, str]:
         """
         Perform relative motion along the joint coordinate system of each axis, and the end motion mode is joint motion.
@@ -2971,34 +3257,49 @@ class Dobot:
 
     # Added Commands (not standard command from TCP protocol):
 
-    def Connect(self) -> None:
+    def Connect(self, timeout:float=5, retries:int=3, backoff:float=0.5) -> None:
         """
-        Connect to the Dobot Magician E6 robot.
+        Connect to the Dobot Magician E6 robot. The connection is ready as soon as the robot answers a RobotMode() probe. Failed attempts are retried with exponentially increasing delays.
 
         Args:
-            None
+            timeout (float): Time allowed for each connection attempt and its probe reply. Unit: s. Default is 5.
+            retries (int): Number of retries after a failed attempt. Default is 3.
+            backoff (float): Delay before the first retry. The delay doubles with every further retry. Unit: s. Default is 0.5.
         
         Returns:
             None
         
         Raises:
-            Exception: If the connection fails.
+            Exception: If the connection fails after all retries.
 
         Example:
-           Connect()
+           Connect(timeout=2, retries=5)
         """
-        try :
-            if self.debugLevel > 0: print(f"Connecting to Dobot at {self.ip}:{self.port}...")
-            self.connection = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self.connection.connect((self.ip, self.port))
-            time.sleep(2)  # Wait for the connection to establish
-            if self.connection == None:
-                raise Exception("Connection error")
-            else:
-                if self.debugLevel > 0: print("  Connected to Dobot Magician E6")
-        except:
-            print("  Connection error")
-            self.connection = None
+        if self.debugLevel > 0: print(f"Connecting to Dobot at {self.ip}:{self.port}...")
+        start = time.perf_counter()
+        for attempt in range(retries + 1):
+            try:
+                self.connection = socket.create_connection((self.ip, self.port), timeout)
+                self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                self._recvPending.clear()
+                self._staleReplies.clear()
+                # Readiness probe: the robot accepts commands once it answers
+                self.connection.sendall(b"RobotMode()\n")
+                self.ReceiveResponse()
+                self.connection.settimeout(self._timeout)
+                self.connectTime = time.perf_counter() - start
+                if self.debugLevel > 0: print(f"  Connected to Dobot Magician E6 in {self.connectTime * 1000:.1f} ms")
+                return
+            except OSError as e:
+                error = e
+                if self.connection:
+                    self.connection.close()
+                    self.connection = None
+                if attempt < retries:
+                    delay = backoff * 2 ** attempt
+                    if self.debugLevel > 0: print(f"  Connection attempt {attempt + 1} failed ({e}), retrying in {delay:.2f} s")
+                    time.sleep(delay)
+        raise Exception(f"  ! Connection error: {error}")
 
     def Disconnect(self) -> tuple[str, str, str]:
         """
@@ -3013,38 +3314,432 @@ class Dobot:
         Example:
             Disconnect()
         """
+        self._reconnecting = False
         if self.connection:
             self.connection.close()
             self.connection = None
+            self._recvPending.clear()
             if self.debugLevel > 0: print("  Disconnected from Dobot Magician E6")
 
-    def SendCommand(self, command:str) -> tuple[str, str, str]:
+    def SendCommand(self, command:str, replay:bool=None) -> tuple[str, str, str]:
         """
         Send a command to the Dobot and receive a response.
 
         Args:
             command (string): The command to send to the robot.
+            replay (bool): Only used with auto reconnect. Resend the command after a reconnect (True) or fail fast (False) if the connection breaks before the reply arrives. Default (None) replays the commands listed in replayCommands.
 
         Returns:
             The response from the robot.
 
         Raises:
-            Exception: If not connected to the Dobot Magician E6.
+            Exception: If not connected to the Dobot Magician E6, or if auto reconnect is enabled and the reply cannot be parsed.
+            ConnectionError: If auto reconnect or the worker is enabled and the command could not be completed.
+            TimeoutError: If the reply does not arrive within the timeout attribute. The late reply is discarded when it arrives.
         
         Example:
             SendCommand("GetPose()")
         """
+        if self._pipeline is not None:
+            # Queue the command, the reply is collected by the pipeline
+            self._pipeline.commands.append(command)
+            return None, None, None
+        if self._worker is not None:
+            return self.SubmitCommand(command).result(self.timeout)
+        if self.autoReconnect:
+            return self._SendResilient(command, replay)
         if self.connection:
             try:
-                self.connection.sendall(command.encode() + b'\n')
-                response = self.connection.recv(1024).decode()
-                return self.ParseResponse(response.strip())
+                with self.lock:
+                    self.connection.sendall(command.encode() + b'\n')
+                    try:
+                        return self._ReceiveReply(command)
+                    except socket.timeout:
+                        self._MarkStale([command])
+                        raise
+            except socket.timeout as e:
+                raise TimeoutError(f"  ! No reply to {command} within {self.timeout} s") from e
             except Exception as e:
                 print(f"  Python error sending command: {e}")
                 return None
         else:
             raise Exception("  ! Not connected to Dobot Magician E6")
 
+    def _SendResilient(self, command:str, replay:bool) -> tuple[str, str, str]:
+        if self.connection is None and not self._reconnecting:
+            raise Exception("  ! Not connected to Dobot Magician E6")
+        if replay is None:
+            replay = command.split("(", 1)[0] in self.replayCommands
+        entry = (time.time(), command)
+        self.journal.append(entry)
+        deadline = None
+        while True:
+            if self._reconnecting and not self._reconnected.wait(self.reconnectTimeout):
+                raise ConnectionError(f"  ! Dobot Magician E6 did not reconnect within {self.reconnectTimeout} s, {command} was not acknowledged")
+            try:
+                with self.lock:
+                    connection = self.connection
+                    if connection is None:
+                        # Dropped by a reconnect that started meanwhile
+                        raise ConnectionError("Connection closed by Dobot Magician E6")
+                    connection.sendall(command.encode() + b'\n')
+                    try:
+                        result = self._ReceiveReply(command)
+                    except socket.timeout:
+                        self._MarkStale([command])
+                        raise
+            except socket.timeout as e:
+                # A slow reply, the connection itself is fine
+                raise TimeoutError(f"  ! No reply to {command} within {self.timeout} s") from e
+            except OSError as e:
+                # Broken socket, or the connection was dropped by another reconnect
+                if self.debugLevel > 0: print(f"  Connection lost during {command}: {e}")
+                self.StartReconnect()
+                if deadline is None:
+                    deadline = time.monotonic() + self.reconnectTimeout
+                if not replay or time.monotonic() > deadline:
+                    raise ConnectionError(f"  ! Connection to Dobot Magician E6 lost, {command} was not acknowledged") from e
+                if self.debugLevel > 0: print(f"  Replaying {command} after reconnect")
+                continue
+            except Exception as e:
+                if entry in self.journal:
+                    self.journal.remove(entry)
+                raise Exception(f"  ! Could not parse the reply to {command}: {e}") from e
+            if entry in self.journal:
+                self.journal.remove(entry)
+            return result
+
+    def SetAutoReconnect(self, enable:bool=True, timeout:float=5, journalSize:int=64) -> None:
+        """
+        Enable or disable automatic reconnection of the dashboard connection.
+
+        A broken connection is restored in a background thread with exponential backoff. Commands that were sent but not acknowledged stay in the journal. Commands listed in replayCommands (the idempotent queries by default) are resent after the reconnect. All other commands fail fast with a ConnectionError, because the robot may already have executed them.
+
+        Args:
+            enable (bool): Enable (True) or disable (False) auto reconnect. Default is True.
+            timeout (float): Time a command waits for a running reconnect and the time span in which it is replayed. Unit: s. Default is 5.
+            journalSize (int): Maximum number of unacknowledged commands kept in the journal. Default is 64.
+
+        Returns:
+            None
+
+        Example:
+            SetAutoReconnect(True, timeout=2)
+            robot.replayCommands.add("DO")
+        """
+        self.autoReconnect = enable
+        self.reconnectTimeout = timeout
+        self.journal = collections.deque(self.journal, maxlen=journalSize)
+        if not enable:
+            self._reconnecting = False
+
+    def StartReconnect(self) -> None:
+        """
+        Close the dashboard connection and reconnect in a background thread. Does nothing if a reconnect is already running.
+
+        Returns:
+            None
+
+        Example:
+            StartReconnect()
+        """
+        with self._reconnectLock:
+            if self._reconnecting:
+                return
+            self._reconnecting = True
+            self._reconnected.clear()
+            if self.connection:
+                self.connection.close()
+                self.connection = None
+            threading.Thread(target=self._Reconnect, daemon=True).start()
+
+    def _Reconnect(self) -> None:
+        delay = self.reconnectBackoff
+        while self._reconnecting:
+            try:
+                self.Connect(timeout=self.reconnectTimeout, retries=0)
+            except Exception:
+                time.sleep(delay)
+                delay = min(delay * 2, self.reconnectMaxBackoff)
+                continue
+            self._reconnected.set()
+            self._reconnecting = False
+            return
+
+    def StartWorker(self) -> None:
+        """
+        Start the thread-safe worker mode. A writer thread takes commands from a queue shared by all threads and sends them in batches, and a reader thread hands each reply to the future of its command. Replies whose echo does not belong to the next command are discarded. If a reply does not arrive within the timeout attribute, the commands in flight fail and the connection is closed, or restored with auto reconnect, so late replies cannot be handed to later commands. While the worker runs, SendCommand and all commands are thread-safe and commands of different threads are pipelined.
+
+        Returns:
+            None
+
+        Raises:
+            Exception: If not connected to the Dobot Magician E6.
+
+        Example:
+            StartWorker()
+        """
+        if self._worker is not None:
+            return
+        if not self.connection:
+            raise Exception("  ! Not connected to Dobot Magician E6")
+        self._commandQueue = queue.SimpleQueue()
+        self._worker = (threading.Thread(target=self._WriteCommands, daemon=True), threading.Thread(target=self._ReadReplies, daemon=True))
+        for thread in self._worker:
+            thread.start()
+        if self.debugLevel > 0: print("  Command worker started")
+
+    def StopWorker(self) -> None:
+        """
+        Stop the worker mode after all submitted commands have been answered.
+
+        Returns:
+            None
+
+        Example:
+            StopWorker()
+        """
+        if self._worker is None:
+            return
+        worker, self._worker = self._worker, None
+        self._commandQueue.put(None)
+        for thread in worker:
+            thread.join()
+        if self.debugLevel > 0: print("  Command worker stopped")
+
+    def SubmitCommand(self, command:str) -> concurrent.futures.Future:
+        """
+        Queue a command for the worker without waiting for its reply. Can be called from any thread.
+
+        Args:
+            command (string): The command to send to the robot.
+
+        Returns:
+            A future that resolves to the parsed response.
+
+        Raises:
+            Exception: If the worker is not running.
+
+        Example:
+            SubmitCommand("GetPose()").result(1.0)
+        """
+        if self._worker is None:
+            raise Exception("  ! Command worker is not running. Call StartWorker first")
+        future = concurrent.futures.Future()
+        self._commandQueue.put((command, future))
+        return future
+
+    def _WriteCommands(self) -> None:
+        while True:
+            batch = [self._commandQueue.get()]
+            # Coalesce everything queued meanwhile into one write
+            while True:
+                try:
+                    batch.append(self._commandQueue.get_nowait())
+                except queue.Empty:
+                    break
+            stop = None in batch
+            batch = [item for item in batch if item is not None and item[1].set_running_or_notify_cancel()]
+            if batch and self._reconnecting and not self._reconnected.wait(self.reconnectTimeout):
+                for command, future in batch:
+                    future.set_exception(ConnectionError(f"  ! Dobot Magician E6 did not reconnect within {self.reconnectTimeout} s, {command} was not sent"))
+                batch = []
+            if batch:
+                with self.lock:
+                    for command, future in batch:
+                        entry = (time.time(), command)
+                        self.journal.append(entry)
+                        self._inFlight.append((command, future, entry))
+                        self._repliesDue.release()
+                    connection = self.connection
+                    try:
+                        if connection is None:
+                            raise ConnectionError("Connection closed by Dobot Magician E6")
+                        connection.sendall(b"".join(command.encode() + b'\n' for command, future in batch))
+                    except OSError:
+                        # Wake up the reader, it fails the commands in flight
+                        if connection is not None:
+                            try:
+                                connection.shutdown(socket.SHUT_RDWR)
+                            except OSError:
+                                pass
+            if stop:
+                self._inFlight.append(None)
+                self._repliesDue.release()
+                return
+
+    def _ReadReplies(self) -> None:
+        while True:
+            self._repliesDue.acquire()
+            item = self._inFlight[0]
+            if item is None:
+                self._inFlight.popleft()
+                return
+            command, future, entry = item
+            try:
+                while True:
+                    response = self.ReceiveResponse()
+                    try:
+                        result = self.ParseResponse(response)
+                    except Exception as e:
+                        result = e
+                        break
+                    if self._EchoMatches(command, result[2]):
+                        break
+                    # A reply left over from before, the reply to this command follows
+                    if self.debugLevel > 0: print(f"  Discarding reply to {result[2]} while waiting for {command}")
+            except OSError as e:
+                with self.lock:
+                    # The semaphore count of the first command was taken above
+                    failed = 0
+                    while self._inFlight and self._inFlight[0] is not None:
+                        command, future, entry = self._inFlight.popleft()
+                        if failed:
+                            self._repliesDue.acquire()
+                        failed += 1
+                        if isinstance(e, socket.timeout):
+                            future.set_exception(TimeoutError(f"  ! No reply to {command} within {self.timeout} s"))
+                        else:
+                            future.set_exception(ConnectionError(f"  ! Connection to Dobot Magician E6 lost, {command} was not acknowledged"))
+                    if not self.autoReconnect and self.connection:
+                        # Late replies would be read as replies to later commands, so the link is closed
+                        self.connection.close()
+                        self.connection = None
+                        self._recvPending.clear()
+                if self.autoReconnect:
+                    self.StartReconnect()
+                continue
+            self._inFlight.popleft()
+            if entry in self.journal:
+                self.journal.remove(entry)
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    def _MarkStale(self, commands:list) -> None:
+        # Remember commands that timed out, their replies are expected until one more timeout has passed
+        expiry = time.monotonic() + (self._timeout or 0)
+        self._staleReplies.extend((command, expiry) for command in commands)
+
+    def _ReceiveReply(self, command:str) -> tuple[str, str, str]:
+        # Read and parse the reply to command. Late replies of commands that timed out are discarded first
+        stale = self._staleReplies
+        discarded = None
+        while True:
+            try:
+                result = self.ParseResponse(self.ReceiveResponse())
+            except socket.timeout:
+                # The discarded reply was the one to this command, the late reply it was taken for is lost
+                if discarded is None:
+                    raise
+                return discarded
+            # Replies arrive in order, so a late reply overtaken by the reply to another command is lost
+            while stale and not self._EchoMatches(stale[0][0], result[2]):
+                if self.debugLevel > 0: print(f"  Late reply to {stale[0][0]} did not arrive")
+                stale.popleft()
+            matches = self._EchoMatches(command, result[2])
+            if stale:
+                late, expiry = stale.popleft()
+                # The reply of a repeated command is taken as its own once the late reply has expired, so a lost
+                # reply cannot make the command discard its own replies forever
+                if matches and expiry < time.monotonic():
+                    return result
+                if self.debugLevel > 0: print(f"  Discarding late reply to {late}")
+                if matches:
+                    discarded = result
+                continue
+            if not matches:
+                # A reply left over from before, the reply to this command follows
+                if self.debugLevel > 0: print(f"  Discarding reply to {result[2]} while waiting for {command}")
+                continue
+            return result
+
+    @staticmethod
+    def _EchoMatches(command:str, echo:str) -> bool:
+        # Replies without an echo cannot be checked and are accepted
+        return echo is None or echo.split("(", 1)[0] == command.split("(", 1)[0]
+
+    def ReceiveResponse(self) -> str:
+        """
+        Receive exactly one complete reply from the robot.
+
+        Incoming bytes are read with recv_into into a reusable buffer and collected per connection until a reply terminator (';' or newline) arrives. Bytes following the reply are kept for the next call, so long replies and replies split across TCP segments are returned whole.
+
+        Args:
+            None
+
+        Returns:
+            The reply string including its terminator.
+
+        Raises:
+            ConnectionError: If the robot closes the connection.
+
+        Example:
+            ReceiveResponse()
+        """
+        pending = self._recvPending
+        scanned = 0
+        while True:
+            if pending:
+                response = self.SplitResponse(pending, scanned)
+                if response is not None:
+                    return response
+                scanned = len(pending)
+            connection = self.connection
+            if connection is None:
+                raise ConnectionError("Connection closed by Dobot Magician E6")
+            size = connection.recv_into(self._recvBuffer)
+            if size == 0:
+                raise ConnectionError("Connection closed by Dobot Magician E6")
+            pending += self._recvView[:size]
+
+    @staticmethod
+    def SplitResponse(buffer:bytearray, start:int=0) -> str:
+        """
+        Remove the first complete reply from a receive buffer.
+
+        Args:
+            buffer (bytearray): Received bytes. The reply and its terminator are removed in place.
+            start (int): Offset from which to search for the terminator. Bytes before it are known not to contain one. Default is 0.
+
+        Returns:
+            The reply string including its terminator, or None if no complete reply has arrived yet.
+
+        Example:
+            SplitResponse(bytearray(b"0,{},EnableRobot();"))
+        """
+        while True:
+            semicolon = buffer.find(b";", start)
+            newline = buffer.find(b"\n", start)
+            if semicolon < 0 and newline < 0:
+                return None
+            end = (semicolon if newline < 0 or 0 <= semicolon < newline else newline) + 1
+            response = buffer[:end].decode().strip()
+            del buffer[:end]
+            start = 0
+            # Skip empty lines left over from ';\n' terminated replies
+            if response:
+                return response
+
+    def Pipeline(self) -> "DobotPipeline":
+        """
+        Create a pipeline that queues commands and sends them in one batch. Inside the with block, commands return (None, None, None) instead of waiting for their reply. The replies are collected in order when the block exits.
+
+        Args:
+            None
+
+        Returns:
+            The pipeline object. The parsed replies are stored in its results attribute.
+
+        Example:
+            with robot.Pipeline() as p:
+                p.MovL("pose={200,200,200,0,0,0}")
+                p.DO(1, 1)
+            print(p.results)
+        """
+        return DobotPipeline(self)
+
     def SetDebugLevel(self, debugLevel:int) -> tuple[str, str, str]:
         """
         Set the debug level for the Dobot Object.
@@ -3060,6 +3755,128 @@ class Dobot:
         """
         self.debugLevel = debugLevel
 
+    def SetFeedbackCache(self, feedback:"Feedback"=None, maxAge:float=0.02) -> None:
+        """
+        Answer GetPose, GetAngle, RobotMode, DI and GetDO from the feedback stream while its newest frame is fresh, instead of sending them to the robot. The answers have the same format as the replies of the robot. Queries in a pipeline are always sent.
+
+        Args:
+            feedback (Feedback): Feedback with a running reader thread (see Feedback.Start). None disables the cache. Default is None.
+            maxAge (float): Maximum age of the newest frame. Older frames are not used. Unit: s. Default is 0.02.
+
+        Example:
+            SetFeedbackCache(feedback, 0.02)
+        """
+        self.feedbackCache = feedback
+        self.cacheMaxAge = maxAge
+        with self._cacheLock:
+            self.cacheHits = 0
+            self.cacheMisses = 0
+
+    def SetKinematicsCache(self, size:int=1024, resolution:float=0.001) -> None:
+        """
+        Remember the replies of PositiveKin and InverseKin. Joint angles and poses are rounded to the resolution, so nearly identical requests share one reply. The least recently used replies are dropped beyond the size. The cache is cleared when User, SetUser, Tool, SetTool or SetPayload are sent. Requests in a pipeline are always sent.
+
+        Args:
+            size (int): Maximum number of replies kept. 0 disables the cache. Default is 1024.
+            resolution (float): Rounding step of the joint angles (degree) and pose values (mm, degree). Default is 0.001.
+
+        Example:
+            SetKinematicsCache(4096, 0.01)
+        """
+        with self._kinematicsLock:
+            self._kinematicsGeneration += 1
+            self.kinematicsCache = collections.OrderedDict() if size > 0 else None
+            self.kinematicsCacheSize = size
+            self.kinematicsResolution = resolution
+            self.kinematicsHits = 0
+            self.kinematicsMisses = 0
+            self.kinematicsRoundTrip = 0.0
+
+    def ClearKinematicsCache(self) -> None:
+        """
+        Drop all remembered PositiveKin and InverseKin replies, for example after the coordinate systems were changed in DobotStudio.
+
+        Example:
+            ClearKinematicsCache()
+        """
+        with self._kinematicsLock:
+            # Replies still in flight belong to the old frames and are not stored
+            self._kinematicsGeneration += 1
+            if self.kinematicsCache is not None:
+                self.kinematicsCache.clear()
+
+    def KinematicsCacheInfo(self) -> dict:
+        """
+        Get the statistics of the kinematics cache.
+
+        Returns:
+            A dictionary with hits, misses, hitRate, size and savedTime, the round trip time saved by the hits (estimated from the mean time of the misses). Unit: s.
+
+        Example:
+            KinematicsCacheInfo()["hitRate"]
+        """
+        with self._kinematicsLock:
+            hits, misses, roundTrip = self.kinematicsHits, self.kinematicsMisses, self.kinematicsRoundTrip
+            size = len(self.kinematicsCache) if self.kinematicsCache is not None else 0
+        requests = hits + misses
+        return {"hits": hits, "misses": misses, "hitRate": hits / requests if requests else 0.0, "size": size,
+                "savedTime": hits * roundTrip / misses if misses else 0.0}
+
+    def _SendFrameChange(self, command:str) -> tuple[str, str, str]:
+        # Send a command that changes the user, tool or payload frames. The cache is cleared before sending, so
+        # queries in flight are not stored, and again after the reply, so queries sent meanwhile are dropped as well
+        self.ClearKinematicsCache()
+        try:
+            return self.SendCommand(command)
+        finally:
+            self.ClearKinematicsCache()
+
+    def _KinematicsQuery(self, command:str, values:tuple, frames:tuple) -> tuple[str, str, str]:
+        # Answer PositiveKin or InverseKin from the cache, otherwise send it and remember a successful reply
+        cache = self.kinematicsCache
+        if self._pipeline is not None:
+            return self.SendCommand(command)
+        resolution = self.kinematicsResolution
+        try:
+            key = (values[0], *(round(float(value) / resolution) for value in values[1:]), *frames)
+        except ValueError:
+            return self.SendCommand(command)
+        with self._kinematicsLock:
+            response = cache.get(key)
+            if response is not None:
+                cache.move_to_end(key)
+                self.kinematicsHits += 1
+                # Same echo as ParseResponse returns for the reply of the robot
+                return self.error_codes[0], response, command.replace("{", ":").replace("}", ":")
+            generation = self._kinematicsGeneration
+        start = time.perf_counter()
+        result = self.SendCommand(command)
+        with self._kinematicsLock:
+            self.kinematicsMisses += 1
+            self.kinematicsRoundTrip += time.perf_counter() - start
+            if result is not None and result[0] == self.error_codes[0] and generation == self._kinematicsGeneration:
+                cache[key] = result[1]
+                if len(cache) > self.kinematicsCacheSize:
+                    cache.popitem(last=False)
+        return result
+
+    def _CachedQuery(self, command:str, answer) -> tuple[str, str, str]:
+        # Answer a query from a fresh feedback frame, None to send it to the robot
+        feedback = self.feedbackCache
+        if self._pipeline is not None:
+            return None
+        frame = feedback.frame
+        response = None
+        if frame is not None and time.monotonic() - feedback.frameTime <= self.cacheMaxAge:
+            response = answer(frame)
+        # Queries of several threads may be answered at the same time
+        with self._cacheLock:
+            if response is None:
+                self.cacheMisses += 1
+                return None
+            self.cacheHits += 1
+        return self.error_codes[0], response, command
+
     def MoveJJ(self,j1:float,j2:float,j3:float,j4:float,j5:float,j6:float) -> tuple[str, str, str]:
         """
         Move the robot to a specified joint position using joint motion.
@@ -3379,355 +4196,2734 @@ class Dobot:
         self.MoveJJ(122, 0, -135, 45, 90, -104) # above sign
 
 
-# Class for the flexible gripper
+# Class for pipelined commands
 
-class FlexGripper:
+class DobotPipeline:
     """
-    Class for the flexible gripper.
+    Class to send a batch of commands without waiting for each reply.
     """
-    def __init__(self, robot:Dobot, DOvacuum:int=1, DOpressure:int=2):
+
+    def __init__(self, robot:Dobot):
         """
-        Constructor for the flexible gripper.
-        
+        Constructor for the pipeline.
+
         Args:
             robot (DobotTCP): The robot object.
-            DOvacuum (int): Digital port for the vacuum. Default is 1.
-            DOpressure (int): Digital port for the pressure. Default is 2.
         """
         self.robot = robot
-        self.DOvacuum = DOvacuum
-        self.DOpressure = DOpressure
+        self.commands = []
+        self.results = []
 
-    def Open(self) -> tuple[str, str, str]:
+    def __enter__(self) -> "DobotPipeline":
+        if self.robot._pipeline is not None:
+            raise Exception("  ! Pipeline already active on this Dobot")
+        self.robot._pipeline = self
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.robot._pipeline = None
+        if exc_type is None:
+            self.results = self.Execute()
+
+    def __getattr__(self, name):
+        # Commands are queued by the robot itself while the pipeline is active
+        return getattr(self.robot, name)
+
+    def Execute(self) -> list:
         """
-        Open the flexible gripper
+        Send all queued commands in one write and collect their replies.
 
         Returns:
-            The response from the robot.
+            A list of parsed response tuples in the order the commands were queued.
+
+        Raises:
+            Exception: If not connected or if a reply does not echo the command it belongs to.
+            TimeoutError: If a reply does not arrive within the timeout attribute of the robot.
 
         Example:
-            Open()
+            Execute()
         """
-        if self.robot.debugLevel > 1: print(f"  Opening flexible gripper\n    ", end="")
-        self.robot.DO(self.DOvacuum,0)
-        return self.robot.DO(self.DOpressure,1)  
+        commands, self.commands = self.commands, []
+        if not commands:
+            return []
+        if self.robot.debugLevel > 0: print(f"  Sending {len(commands)} pipelined commands")
+        if self.robot._worker is not None:
+            futures = [self.robot.SubmitCommand(command) for command in commands]
+            return [future.result(self.robot.timeout) for future in futures]
+        if not self.robot.connection:
+            raise Exception("  ! Not connected to Dobot Magician E6")
+        entries = [(time.time(), command) for command in commands]
+        self.robot.journal.extend(entries)
+        results = []
+        try:
+            with self.robot.lock:
+                self.robot.connection.sendall(b"".join(command.encode() + b'\n' for command in commands))
+                for command, entry in zip(commands, entries):
+                    try:
+                        result = self.robot._ReceiveReply(command)
+                    except socket.timeout:
+                        self.robot._MarkStale(commands[len(results):])
+                        raise
+                    if entry in self.robot.journal:
+                        self.robot.journal.remove(entry)
+                    results.append(result)
+        except socket.timeout as e:
+            raise TimeoutError(f"  ! No reply to pipelined command {commands[len(results)]} within {self.robot.timeout} s") from e
+        except OSError as e:
+            if not self.robot.autoReconnect:
+                raise
+            self.robot.StartReconnect()
+            raise ConnectionError(f"  ! Connection to Dobot Magician E6 lost after {len(results)} of {len(commands)} pipelined replies") from e
+        for command, result in zip(commands, results):
+            if not Dobot._EchoMatches(command, result[2]):
+                raise Exception(f"  ! Reply to {result[2]} does not match pipelined command {command}")
+        return results
+
+
+# Class for streaming servo setpoints
+
+class ServoStreamer:
+    """
+    Stream ServoJ or ServoP setpoints at a fixed rate. All commands are encoded before streaming starts and each one is sent at its absolute deadline start + k*period, so the timing does not drift. The streamer sleeps until shortly before a deadline and busy-waits for the rest.
 
-    def Close(self) -> tuple[str, str, str]:
-        """
-        Closes the flexible gripper
+    Attributes:
+        robot (Dobot): The robot object.
+        command (string): ServoJ or ServoP.
+        period (float): Time between two setpoints. Unit: s.
+        ticks (int): Number of setpoints sent.
+        missed (int): Number of setpoints dropped because their deadline had passed by a whole period.
+        errors (int): Number of replies that report an error.
+        maxLateness (float): Largest delay of a send after its deadline. Unit: s.
+        histogram (list): Number of sends per lateness bin, see lateness_bins.
+    """
 
-        Returns:
-            The response from the robot.
+    # Upper limits of the lateness histogram bins. Unit: s
+    lateness_bins = (50e-6, 100e-6, 200e-6, 500e-6, 1e-3, 2e-3, 5e-3)
 
-        Example:
-            Close()
+    def __init__(self, robot:Dobot, command:str="ServoJ", period:float=0.008, t:float=None, aheadtime:float=50, gain:float=500, spin:float=0.001):
         """
-        if self.robot.debugLevel > 1: print(f"  Closing flexible gripper\n    ", end="")
-        self.robot.DO(self.DOpressure,0)
-        return self.robot.DO(self.DOvacuum,1) 
-    
-    def Neutral(self) -> tuple[str, str, str]:
+        Constructor for the servo streamer.
+
+        Args:
+            robot (Dobot): The robot object.
+            command (string): ServoJ for joint setpoints or ServoP for pose setpoints. Default is ServoJ.
+            period (float): Time between two setpoints. Unit: s. Default is 0.008.
+            t (float): Running time of each setpoint. Unit: s. Default is the period.
+            aheadtime (float): Advanced time, similar to the D in PID control. Range: [20,100]. Default is 50.
+            gain (float): Proportional gain of the target position. Range: [200,1000]. Default is 500.
+            spin (float): Time before a deadline that is busy-waited instead of slept. Unit: s. Default is 0.001.
         """
-        Puts the flexible gripper in the neutral state.
+        if command not in ("ServoJ", "ServoP"):
+            raise Exception(f"  ! Unknown servo command {command}, use ServoJ or ServoP")
+        self.robot = robot
+        self.command = command
+        self.period = period
+        self.t = period if t is None else t
+        self.aheadtime = aheadtime
+        self.gain = gain
+        self.spin = spin
+        self.ticks = 0
+        self.missed = 0
+        self.errors = 0
+        self.lastError = None
+        self.maxLateness = 0.0
+        self.histogram = [0] * (len(self.lateness_bins) + 1)
+        self._template = f"{command}(" + ",".join(["{:.6f}"] * 6) + f",{self.t},{aheadtime},{gain})\n"
+        self._next = None
+        self._swapLock = threading.Lock()
+        self._running = False
+        self._thread = None
+        self._failure = None
+        self._sent = 0
+        self._repliesDue = threading.Semaphore(0)
+
+    def Encode(self, setpoints) -> list:
+        """
+        Encode setpoints into the command bytes sent to the robot.
+
+        Args:
+            setpoints (array): N×6 joint angles for ServoJ or poses for ServoP, as a NumPy array or a list of rows.
 
         Returns:
-            The response from the robot.
+            A list with the encoded command of each setpoint.
+
+        Raises:
+            Exception: If a setpoint does not have 6 values.
 
         Example:
-            Neutral()
+            Encode(np.zeros((100, 6)))
         """
-        if self.robot.debugLevel > 1: print(f"  Setting flexible gripper to neutral\n    ", end="")
-        self.robot.DO(self.DOpressure,0)
-        return self.robot.DO(self.DOvacuum,0)
-    
-    def SetState(self, state:int, vacuum:int=1, pressure:int=2) -> tuple[str, str, str]:
+        if np is not None and isinstance(setpoints, np.ndarray):
+            if setpoints.ndim != 2 or setpoints.shape[1] != 6:
+                raise Exception(f"  ! Setpoints must have the shape (N,6), not {setpoints.shape}")
+            setpoints = setpoints.astype(float).tolist()
+        template = self._template
+        encoded = []
+        for row in setpoints:
+            if len(row) != 6:
+                raise Exception(f"  ! Setpoint {len(encoded)} has {len(row)} values instead of 6")
+            encoded.append(template.format(*row).encode())
+        return encoded
+
+    def Start(self, setpoints) -> None:
         """
-        Set the status of the flexible gripper
+        Start streaming setpoints in a background thread. The dashboard connection is reserved for the streamer until all setpoints are sent or Stop is called.
 
         Args:
-            state (int): State of the gripper. -1: Vacuum (closed), 0:Neutral, 1:Pressure (open)
-            vacuum (int): Digital port for the vacuum. Default is 1.
-            pressure (int): Digital port for the pressure. Default is 2.
+            setpoints (array): N×6 joint angles for ServoJ or poses for ServoP.
 
-        Returns:
-            The response from the robot.
+        Raises:
+            Exception: If not connected, if the streamer is already running or if the command worker of the robot is running.
 
         Example:
-            SetState(1)
+            Start(trajectory)
         """
-        if self.robot.debugLevel > 1: print(f"  Setting flexible gripper to {state}\n    ", end="")
-        match state:
-            case -1:
-                self.robot.DO(pressure,0)
-                return self.robot.DO(vacuum,1)
-            case 0:
-                self.robot.DO(vacuum,0)
-                return self.robot.DO(pressure,0)
-            case 1:
-                self.robot.DO(vacuum,0)
-                return self.robot.DO(pressure,1)
+        if self._thread is not None and self._thread.is_alive():
+            raise Exception("  ! Servo streamer is already running")
+        if not self.robot.connection:
+            raise Exception("  ! Not connected to Dobot Magician E6")
+        if self.robot._worker is not None:
+            raise Exception("  ! Servo streaming is not possible while the command worker is running")
+        self._next = self.Encode(setpoints)
+        # Each run starts with fresh statistics
+        self.ticks = 0
+        self.missed = 0
+        self.errors = 0
+        self.lastError = None
+        self.maxLateness = 0.0
+        self.histogram = [0] * (len(self.lateness_bins) + 1)
+        self._failure = None
+        self._repliesDue = threading.Semaphore(0)
+        self._running = True
+        self._thread = threading.Thread(target=self._Stream, daemon=True)
+        self._thread.start()
 
+    def Replace(self, setpoints) -> None:
+        """
+        Replace the setpoints while streaming. The first new setpoint is sent at the next deadline, so the rate is kept.
 
-# Class for the servo gripper
+        Args:
+            setpoints (array): N×6 joint angles for ServoJ or poses for ServoP.
 
-class ServoGripper:
-    """
+        Example:
+            Replace(newTrajectory)
+        """
+        encoded = self.Encode(setpoints)
+        with self._swapLock:
+            self._next = encoded
+
+    def Wait(self, timeout:float=None) -> None:
+        """
+        Wait until all setpoints are sent and acknowledged.
+
+        Args:
+            timeout (float): Time to wait. Unit: s. Default is None (wait indefinitely).
+
+        Raises:
+            TimeoutError: If streaming did not finish within the timeout.
+            OSError: If the connection failed while streaming.
+
+        Example:
+            Wait(10)
+        """
+        thread = self._thread
+        if thread is None:
+            return
+        thread.join(timeout)
+        if thread.is_alive():
+            raise TimeoutError(f"  ! Servo streaming did not finish within {timeout} s")
+        self._thread = None
+        failure, self._failure = self._failure, None
+        if failure is not None:
+            raise failure
+
+    def Stop(self) -> None:
+        """
+        Stop streaming after the current setpoint and wait for the outstanding replies.
+
+        Raises:
+            OSError: If the connection failed while streaming.
+
+        Example:
+            Stop()
+        """
+        self._running = False
+        self.Wait()
+
+    def Run(self, setpoints, timeout:float=None) -> dict:
+        """
+        Stream setpoints and wait until they are sent.
+
+        Args:
+            setpoints (array): N×6 joint angles for ServoJ or poses for ServoP.
+            timeout (float): Time to wait. Unit: s. Default is None (wait indefinitely).
+
+        Returns:
+            The statistics of the run, see Statistics.
+
+        Raises:
+            OSError: If the connection failed while streaming.
+
+        Example:
+            Run(trajectory)
+        """
+        self.Start(setpoints)
+        self.Wait(timeout)
+        return self.Statistics()
+
+    def Statistics(self) -> dict:
+        """
+        Get the timing statistics of the streamer.
+
+        Returns:
+            A dictionary with ticks, missed, errors, maxLateness (s) and a lateness histogram keyed by the upper limit of each bin in µs.
+
+        Example:
+            Statistics()["histogram"]
+        """
+        labels = [f"<{limit * 1e6:.0f}us" for limit in self.lateness_bins] + [f">={self.lateness_bins[-1] * 1e6:.0f}us"]
+        return {"ticks": self.ticks, "missed": self.missed, "errors": self.errors, "maxLateness": self.maxLateness,
+                "histogram": dict(zip(labels, self.histogram))}
+
+    def _Stream(self) -> None:
+        robot = self.robot
+        period = self.period
+        spin = self.spin
+        bins = self.lateness_bins
+        histogram = self.histogram
+        perf_counter = time.perf_counter
+        sleep = time.sleep
+        connection = robot.connection
+        self._sent = 0
+        replies = threading.Thread(target=self._ReadReplies, daemon=True)
+        with robot.lock:
+            replies.start()
+            try:
+                source = ()
+                index = 0
+                tick = 0
+                start = perf_counter() + period
+                while self._running:
+                    if self._next is not None:
+                        with self._swapLock:
+                            source, self._next, index = self._next, None, 0
+                    if index >= len(source):
+                        break
+                    deadline = start + tick * period
+                    remaining = deadline - perf_counter()
+                    if remaining > spin:
+                        sleep(remaining - spin)
+                    while perf_counter() < deadline:
+                        pass
+                    lateness = perf_counter() - deadline
+                    if lateness >= period:
+                        # Setpoints whose deadline passed by a whole period are dropped
+                        skipped = int(lateness // period)
+                        self.missed += skipped
+                        tick += skipped
+                        index += skipped
+                        continue
+                    connection.sendall(source[index])
+                    self._sent += 1
+                    self._repliesDue.release()
+                    histogram[bisect.bisect_right(bins, lateness)] += 1
+                    if lateness > self.maxLateness:
+                        self.maxLateness = lateness
+                    self.ticks += 1
+                    tick += 1
+                    index += 1
+            except OSError as failure:
+                # Kept for Wait, Stop and Run, the reply thread may have failed first
+                if self._failure is None:
+                    self._failure = failure
+            finally:
+                self._running = False
+                # Wake up the reply thread once more to end it
+                self._repliesDue.release()
+                replies.join()
+
+    def _ReadReplies(self) -> None:
+        robot = self.robot
+        received = 0
+        while True:
+            self._repliesDue.acquire()
+            if received == self._sent and not self._running:
+                return
+            try:
+                if robot.connection is None:
+                    raise ConnectionError("  ! Connection to Dobot Magician E6 closed while streaming")
+                (error, response, command) = robot.ParseResponse(robot.ReceiveResponse())
+            except OSError as failure:
+                if self._failure is None:
+                    self._failure = failure
+                self._running = False
+                return
+            received += 1
+            if error != Dobot.error_codes[0]:
+                self.errors += 1
+                self.lastError = (error, command)
+                if robot.debugLevel > 0: print(f"  ! {command} failed: {error}")
+
+
+# Class for local forward and inverse kinematics
+
+class Kinematics:
+    """
+    Forward and inverse kinematics computed locally with NumPy, so whole paths are transformed in one call without a round trip per point. The geometry of each robot type is stored as standard Denavit-Hartenberg parameters in kinematic_parameters, keyed like robot_types.
+
+    Attributes:
+        robotType (int): The robot type, see Dobot.robot_types.
+        parameters (dict): The DH parameters and joint limits of the robot.
+        user (array): Pose of the user coordinate system {x,y,z,rx,ry,rz} in the base coordinate system.
+        tool (array): Pose of the tool coordinate system {x,y,z,rx,ry,rz} in the flange coordinate system.
+    """
+
+    # Twist angles of the joints. Unit: degree. All supported robots share the same structure
+    dh_alpha = (90, 0, 0, 90, -90, 0)
+
+    # DH parameters (d and a in mm, offset in degree) and joint limits (degree) by robot type. The values are
+    # the nominal geometry of the data sheets, compare them with CrossCheck on a real robot
+    kinematic_parameters = {
+        3: {"d": (128, 0, 0, 116, 116, 105), "a": (0, -274, -230, 0, 0, 0), "offset": (0, -90, 0, -90, 0, 0),
+            "limits": ((-360, 360), (-360, 360), (-160, 160), (-360, 360), (-360, 360), (-360, 360))},
+        5: {"d": (147, 0, 0, 141, 116, 105), "a": (0, -427, -357, 0, 0, 0), "offset": (0, -90, 0, -90, 0, 0),
+            "limits": ((-360, 360), (-360, 360), (-160, 160), (-360, 360), (-360, 360), (-360, 360))},
+        10: {"d": (147, 0, 0, 191, 106, 113), "a": (0, -607, -568, 0, 0, 0), "offset": (0, -90, 0, -90, 0, 0),
+             "limits": ((-360, 360), (-360, 360), (-160, 160), (-360, 360), (-360, 360), (-360, 360))},
+        150: {"d": (134, 0, 0, 76, 80, 62), "a": (0, -200, -170, 0, 0, 0), "offset": (0, -90, 0, -90, 0, 0),
+              "limits": ((-360, 360), (-135, 135), (-154, 154), (-360, 360), (-360, 360), (-360, 360))}
+    }
+    # The A series shares the geometry of the corresponding CR robot
+    kinematic_parameters[113] = kinematic_parameters[3]
+    kinematic_parameters[115] = kinematic_parameters[5]
+    kinematic_parameters[120] = kinematic_parameters[10]
+
+    def __init__(self, robotType=150, user=None, tool=None, parameters:dict=None):
+        """
+        Constructor for the kinematics.
+
+        Args:
+            robotType (int or string): The robot type as number or name, for example 5 or "CR5". Default is 150 (Magician E6).
+            user (array): Pose of the user coordinate system {x,y,z,rx,ry,rz}. Default is None (base coordinate system).
+            tool (array): Pose of the tool coordinate system {x,y,z,rx,ry,rz}. Default is None (flange).
+            parameters (dict): DH parameters and joint limits that replace the table entry, for example of a calibrated robot.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+            Exception: If there are no parameters for the robot type.
+        """
+        if np is None:
+            raise ImportError("  ! Kinematics requires NumPy. Install it with pip install numpy")
+        if isinstance(robotType, str):
+            types = {name: number for number, name in Dobot.robot_types.items()}
+            if robotType not in types:
+                raise Exception(f"  ! Unknown robot type {robotType}")
+            robotType = types[robotType]
+        if parameters is None:
+            if robotType not in self.kinematic_parameters:
+                raise Exception(f"  ! No kinematic parameters for robot type {Dobot.robot_types.get(robotType, robotType)}")
+            parameters = self.kinematic_parameters[robotType]
+        self.robotType = robotType
+        self.parameters = parameters
+        self._d = np.array(parameters["d"], dtype=float)
+        self._a = np.array(parameters["a"], dtype=float)
+        self._alpha = np.radians(self.dh_alpha)
+        self._offset = np.radians(parameters["offset"])
+        self.limits = np.array(parameters["limits"], dtype=float)
+        self.SetUser(user)
+        self.SetTool(tool)
+
+    def SetUser(self, pose=None) -> None:
+        """
+        Set the user coordinate system in which poses are given.
+
+        Args:
+            pose (array): Pose {x,y,z,rx,ry,rz} of the user coordinate system in the base coordinate system. Default is None (base coordinate system).
+
+        Example:
+            SetUser([300,0,0,0,0,90])
+        """
+        self.user = None if pose is None else np.asarray(pose, dtype=float)
+        self._user = np.eye(4) if pose is None else self.PoseToMatrix(self.user)
+        self._userInverse = self._Invert(self._user)
+
+    def SetTool(self, pose=None) -> None:
+        """
+        Set the tool coordinate system of which the pose is computed.
+
+        Args:
+            pose (array): Pose {x,y,z,rx,ry,rz} of the tool coordinate system in the flange coordinate system. Default is None (flange).
+
+        Example:
+            SetTool([0,0,120,0,0,0])
+        """
+        self.tool = None if pose is None else np.asarray(pose, dtype=float)
+        self._tool = np.eye(4) if pose is None else self.PoseToMatrix(self.tool)
+        self._toolInverse = self._Invert(self._tool)
+
+    @staticmethod
+    def PoseToMatrix(poses) -> "np.ndarray":
+        """
+        Convert poses to homogeneous transformation matrices. The rotation is Rz·Ry·Rx, as used by the robot.
+
+        Args:
+            poses (array): Poses {x,y,z,rx,ry,rz} with the shape (6,) or (N,6). Unit: mm and degree.
+
+        Returns:
+            Matrices with the shape (4,4) or (N,4,4).
+
+        Example:
+            PoseToMatrix([473,-141,469,-180,0,-90])
+        """
+        poses = np.asarray(poses, dtype=float)
+        (rx, ry, rz) = np.moveaxis(np.radians(poses[..., 3:6]), -1, 0)
+        (cx, sx, cy, sy, cz, sz) = (np.cos(rx), np.sin(rx), np.cos(ry), np.sin(ry), np.cos(rz), np.sin(rz))
+        matrix = np.zeros(poses.shape[:-1] + (4, 4))
+        matrix[..., 0, 0] = cz * cy
+        matrix[..., 0, 1] = cz * sy * sx - sz * cx
+        matrix[..., 0, 2] = cz * sy * cx + sz * sx
+        matrix[..., 1, 0] = sz * cy
+        matrix[..., 1, 1] = sz * sy * sx + cz * cx
+        matrix[..., 1, 2] = sz * sy * cx - cz * sx
+        matrix[..., 2, 0] = -sy
+        matrix[..., 2, 1] = cy * sx
+        matrix[..., 2, 2] = cy * cx
+        matrix[..., :3, 3] = poses[..., :3]
+        matrix[..., 3, 3] = 1
+        return matrix
+
+    @staticmethod
+    def MatrixToPose(matrices) -> "np.ndarray":
+        """
+        Convert homogeneous transformation matrices to poses.
+
+        Args:
+            matrices (array): Matrices with the shape (4,4) or (N,4,4).
+
+        Returns:
+            Poses {x,y,z,rx,ry,rz} with the shape (6,) or (N,6). Unit: mm and degree.
+
+        Example:
+            MatrixToPose(np.eye(4))
+        """
+        matrices = np.asarray(matrices, dtype=float)
+        poses = np.empty(matrices.shape[:-2] + (6,))
+        poses[..., :3] = matrices[..., :3, 3]
+        poses[..., 3] = np.arctan2(matrices[..., 2, 1], matrices[..., 2, 2])
+        poses[..., 4] = np.arctan2(-matrices[..., 2, 0], np.hypot(matrices[..., 0, 0], matrices[..., 1, 0]))
+        poses[..., 5] = np.arctan2(matrices[..., 1, 0], matrices[..., 0, 0])
+        poses[..., 3:] = np.degrees(poses[..., 3:])
+        return poses
+
+    @staticmethod
+    def _Link(theta, d:float, a:float, alpha:float) -> "np.ndarray":
+        # Standard DH transformation Rz(theta)·Tz(d)·Tx(a)·Rx(alpha) for an array of joint angles
+        (ct, st, ca, sa) = (np.cos(theta), np.sin(theta), np.cos(alpha), np.sin(alpha))
+        (zero, one) = (np.zeros_like(ct), np.ones_like(ct))
+        return np.stack((ct, -st * ca, st * sa, a * ct,
+                         st, ct * ca, -ct * sa, a * st,
+                         zero, sa * one, ca * one, d * one,
+                         zero, zero, zero, one), axis=-1).reshape(np.shape(theta) + (4, 4))
+
+    @staticmethod
+    def _Invert(matrices) -> "np.ndarray":
+        # Inverse of rigid transformations
+        inverse = np.zeros_like(matrices)
+        rotation = np.swapaxes(matrices[..., :3, :3], -1, -2)
+        inverse[..., :3, :3] = rotation
+        inverse[..., :3, 3] = -np.einsum("...ij,...j->...i", rotation, matrices[..., :3, 3])
+        inverse[..., 3, 3] = 1
+        return inverse
+
+    def Forward(self, joints) -> "np.ndarray":
+        """
+        Compute the poses of the tool in the user coordinate system from joint angles. Local counterpart of PositiveKin.
+
+        Args:
+            joints (array): Joint angles {J1,J2,J3,J4,J5,J6} with the shape (6,) or (N,6). Unit: degree.
+
+        Returns:
+            Poses {x,y,z,rx,ry,rz} with the shape (6,) or (N,6). Unit: mm and degree.
+
+        Example:
+            Forward([0,0,-90,0,90,0])
+        """
+        theta = np.radians(np.asarray(joints, dtype=float)) + self._offset
+        matrices = self._Link(theta[..., 0], self._d[0], self._a[0], self._alpha[0])
+        for i in range(1, 6):
+            matrices = matrices @ self._Link(theta[..., i], self._d[i], self._a[i], self._alpha[i])
+        return self.MatrixToPose(self._userInverse @ matrices @ self._tool)
+
+    def Inverse(self, poses, jointNear=None) -> "np.ndarray":
+        """
+        Compute the joint angles for poses of the tool in the user coordinate system. Local counterpart of InverseKin.
+
+        All eight solutions of each pose are computed in closed form. Like JointNear of InverseKin, the solution closest to jointNear is selected, with joints turned by full revolutions where that brings them closer. Solutions outside the joint limits are not used.
+
+        Args:
+            poses (array): Poses {x,y,z,rx,ry,rz} with the shape (6,) or (N,6). Unit: mm and degree.
+            jointNear (array): Joint angles to select the solution, with the shape (6,) for all poses or (N,6) for each pose. Default is None (all joints 0).
+
+        Returns:
+            Joint angles with the shape (6,) or (N,6). Unit: degree. Rows of unreachable poses are NaN.
+
+        Example:
+            Inverse([473,-141,469,-180,0,-90], jointNear=[0,0,-90,0,90,0])
+        """
+        poses = np.asarray(poses, dtype=float)
+        single = poses.ndim == 1
+        solutions = self.Solutions(poses.reshape(-1, 6))
+        near = np.zeros(6) if jointNear is None else np.asarray(jointNear, dtype=float)
+        near = np.broadcast_to(near, (len(solutions), 6))[:, None, :]
+        # Full revolutions towards jointNear
+        solutions = solutions + 360 * np.round((near - solutions) / 360)
+        valid = np.all((solutions >= self.limits[:, 0]) & (solutions <= self.limits[:, 1]), axis=-1)
+        distance = np.where(valid, np.sum((solutions - near) ** 2, axis=-1), np.inf)
+        best = np.argmin(distance, axis=1)
+        joints = solutions[np.arange(len(solutions)), best]
+        joints[~valid[np.arange(len(solutions)), best]] = np.nan
+        return joints[0] if single else joints
+
+    def Solutions(self, poses) -> "np.ndarray":
+        """
+        Compute all eight joint solutions for poses of the tool in the user coordinate system, without selecting one and without checking the joint limits.
+
+        Args:
+            poses (array): Poses {x,y,z,rx,ry,rz} with the shape (N,6). Unit: mm and degree.
+
+        Returns:
+            Joint angles with the shape (N,8,6). Unit: degree. Solutions that do not exist are NaN.
+
+        Example:
+            Solutions([[473,-141,469,-180,0,-90]])
+        """
+        matrices = self._user @ self.PoseToMatrix(np.asarray(poses, dtype=float)) @ self._toolInverse
+        return np.degrees(self._Solutions(matrices) - self._offset)
+
+    def CrossCheck(self, robot:Dobot, joints, samples:int=10, user:int=0, tool:int=0) -> dict:
+        """
+        Compare the local kinematics with PositiveKin and InverseKin of the controller on samples of a path. The user and tool poses of this object must match the user and tool indices.
+
+        Args:
+            robot (Dobot): The connected robot.
+            joints (array): Joint angles with the shape (N,6). Unit: degree.
+            samples (int): Number of evenly spaced rows that are checked. Default is 10.
+            user (int): User coordinate system index on the controller. Default is 0.
+            tool (int): Tool coordinate system index on the controller. Default is 0.
+
+        Returns:
+            A dictionary with the checked indices and the largest position (mm), rotation (degree) and joint (degree) differences.
+
+        Raises:
+            Exception: If the controller rejects a request.
+
+        Example:
+            CrossCheck(robot, path, samples=20)
+        """
+        joints = np.asarray(joints, dtype=float).reshape(-1, 6)
+        indices = np.unique(np.linspace(0, len(joints) - 1, min(samples, len(joints))).astype(int))
+        poses = self.Forward(joints[indices])
+        remotePoses = []
+        remoteJoints = []
+        for row, pose in zip(joints[indices].tolist(), poses.tolist()):
+            (error, response, command) = robot.PositiveKin(*row, user=user, tool=tool)
+            if error != Dobot.error_codes[0]:
+                raise Exception(f"  ! {command} failed: {error}")
+            remotePoses.append([float(value) for value in response.split(",")])
+            near = "{" + ",".join(str(value) for value in row) + "}"
+            (error, response, command) = robot.InverseKin(*pose, useJointNear=1, JointNear=near, user=user, tool=tool)
+            if error != Dobot.error_codes[0]:
+                raise Exception(f"  ! {command} failed: {error}")
+            remoteJoints.append([float(value) for value in response.split(",")])
+        localJoints = self.Inverse(poses, jointNear=joints[indices])
+        rotation = (poses[:, 3:] - np.array(remotePoses)[:, 3:] + 180) % 360 - 180
+        return {"indices": indices.tolist(),
+                "positionError": float(np.max(np.linalg.norm(poses[:, :3] - np.array(remotePoses)[:, :3], axis=1))),
+                "rotationError": float(np.max(np.abs(rotation))),
+                "jointError": float(np.max(np.abs(localJoints - np.array(remoteJoints))))}
+
+    def _Solutions(self, matrices) -> "np.ndarray":
+        # Closed form inverse kinematics of the flange with three intersecting shoulder axes, as for UR-type arms.
+        # Returns the DH joint angles of all eight branches with the shape (N,8,6), NaN where a branch does not exist
+        (d1, d4, d5, d6) = self._d[[0, 3, 4, 5]]
+        (a2, a3) = self._a[[1, 2]]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            position = matrices[:, :3, 3]
+            wrist = position - d6 * matrices[:, :3, 2]
+            phi = np.arccos(d4 / np.hypot(wrist[:, 0], wrist[:, 1]))
+            theta1 = np.arctan2(wrist[:, 1], wrist[:, 0])[:, None] + np.array([1, -1]) * phi[:, None] + np.pi / 2
+            (s1, c1) = (np.sin(theta1), np.cos(theta1))
+            c5 = (position[:, 0, None] * s1 - position[:, 1, None] * c1 - d4) / d6
+            theta5 = np.arccos(c5)[..., None] * np.array([1, -1])
+            theta1 = np.broadcast_to(theta1[..., None], theta5.shape)
+            (s1, c1) = (s1[..., None], c1[..., None])
+            sign = np.where(np.sin(theta5) < 0, -1.0, 1.0)
+            rotation = matrices[:, None, None, :3, :3]
+            theta6 = np.arctan2(sign * (-rotation[..., 0, 1] * s1 + rotation[..., 1, 1] * c1),
+                                sign * (rotation[..., 0, 0] * s1 - rotation[..., 1, 0] * c1))
+            # Columns 0, 1 and 3 of inv(T01)·T06·inv(T45·T56), expanded in closed form
+            (s5, c5, s6, c6) = (np.sin(theta5), np.cos(theta5), np.sin(theta6), np.cos(theta6))
+            column0 = np.sum(rotation * np.stack((c6 * c5, -s6 * c5, -s5), axis=-1)[..., None, :], axis=-1)
+            column1 = np.sum(rotation * np.stack((c6 * s5, -s6 * s5, c5), axis=-1)[..., None, :], axis=-1)
+            column3 = position[:, None, None] - np.sum(rotation * np.stack((-s6 * d5, -c6 * d5, np.full_like(s6, d6)), axis=-1)[..., None, :], axis=-1)
+            p13 = np.stack((c1 * (column3[..., 0] - d4 * column1[..., 0]) + s1 * (column3[..., 1] - d4 * column1[..., 1]),
+                            column3[..., 2] - d1 - d4 * column1[..., 2]), axis=-1)
+            length = np.hypot(p13[..., 0], p13[..., 1])
+            c3 = (length ** 2 - a2 ** 2 - a3 ** 2) / (2 * a2 * a3)
+            theta3 = np.arccos(c3)[..., None] * np.array([1, -1])
+            theta2 = (np.arctan2(-p13[..., 1], -p13[..., 0])[..., None]
+                      - np.arcsin(-a3 * np.sin(theta3) / length[..., None]))
+            # The rotation from link 1 to link 4 is a turn by theta2+theta3+theta4 about the z axis of link 1
+            theta4 = np.arctan2(column0[..., 2], c1 * column0[..., 0] + s1 * column0[..., 1])[..., None] - theta2 - theta3
+            (theta1, theta5, theta6) = (np.broadcast_to(theta[..., None], theta3.shape) for theta in (theta1, theta5, theta6))
+        return np.stack((theta1, theta2, theta3, theta4, theta5, theta6), axis=-1).reshape(len(matrices), 8, 6)
+
+
+# Class for checking paths before sending them
+
+class PathValidator:
+    """
+    Check a whole path before it is sent to the robot: the joint limits of the robot type, the reachability of the poses and the enabled safety walls and work zones. All points are checked at once with NumPy.
+
+    Safety walls and work zones are set up in DobotStudio, so their boxes have to be added to the validator as well. The tool must stay inside a safety wall box and must not enter a work zone (interference area) box. With a robot, only the boxes enabled with SetSafeWallEnable and SetWorkZoneEnable are checked.
+
+    Attributes:
+        kinematics (Kinematics): The kinematics of the robot type.
+        robot (Dobot): The robot whose enabled safety walls and work zones are checked. None checks all boxes.
+        safeWallBoxes (dict): Boxes (minimum, maximum) of the safety walls by index. Unit: mm.
+        workZoneBoxes (dict): Boxes (minimum, maximum) of the work zones by index. Unit: mm.
+    """
+
+    def __init__(self, kinematics:Kinematics=None, robot:Dobot=None):
+        """
+        Constructor for the path validator.
+
+        Args:
+            kinematics (Kinematics): The kinematics of the robot type, including the user and tool coordinate systems of the path. Default is a Magician E6.
+            robot (Dobot): The robot whose enabled safety walls and work zones are checked. Default is None (all boxes are checked).
+        """
+        self.kinematics = kinematics if kinematics is not None else Kinematics()
+        self.robot = robot
+        self.safeWallBoxes = {}
+        self.workZoneBoxes = {}
+
+    def AddSafeWall(self, index:int, minimum, maximum) -> None:
+        """
+        Add the box of a safety wall. The tool must stay inside it.
+
+        Args:
+            index (int): Safety wall index. Range: [1,8]
+            minimum (array): Lower corner {x,y,z} in the base coordinate system. Unit: mm.
+            maximum (array): Upper corner {x,y,z} in the base coordinate system. Unit: mm.
+
+        Example:
+            AddSafeWall(1, [-400,-400,0], [400,400,600])
+        """
+        self.safeWallBoxes[index] = (np.asarray(minimum, dtype=float), np.asarray(maximum, dtype=float))
+
+    def AddWorkZone(self, index:int, minimum, maximum) -> None:
+        """
+        Add the box of a work zone. The tool must not enter it.
+
+        Args:
+            index (int): Work zone index. Range: [1,6]
+            minimum (array): Lower corner {x,y,z} in the base coordinate system. Unit: mm.
+            maximum (array): Upper corner {x,y,z} in the base coordinate system. Unit: mm.
+
+        Example:
+            AddWorkZone(1, [200,-100,0], [400,100,150])
+        """
+        self.workZoneBoxes[index] = (np.asarray(minimum, dtype=float), np.asarray(maximum, dtype=float))
+
+    def Validate(self, path, kind:str="joint", jointNear=None) -> tuple:
+        """
+        Check the points of a path. Straight or circular segments between the points are not checked.
+
+        Args:
+            path (array): Joint angles (degree) or poses {x,y,z,rx,ry,rz} (mm, degree) in the user coordinate system, with the shape (N,6).
+            kind (string): "joint" for joint angles, "pose" for poses. Default is "joint".
+            jointNear (array): Joint angles to select the solutions of poses, see Kinematics.Inverse. Default is None.
+
+        Returns:
+            The tuple (index, reason) of the first point that fails a check, or None if the whole path is valid.
+
+        Raises:
+            Exception: If the path does not have the shape (N,6) or the kind is unknown.
+
+        Example:
+            Validate(trajectory, "pose", jointNear=[0,0,-90,0,90,0])
+        """
+        path = np.asarray(path, dtype=float)
+        if path.ndim != 2 or path.shape[1] != 6:
+            raise Exception(f"  ! Path must have the shape (N,6), not {path.shape}")
+        kinematics = self.kinematics
+        failures = []
+        if kind == "joint":
+            limits = kinematics.limits
+            outside = (path < limits[:, 0]) | (path > limits[:, 1]) | np.isnan(path)
+            failed = np.any(outside, axis=1)
+            if failed.any():
+                index = int(np.argmax(failed))
+                joint = int(np.argmax(outside[index]))
+                failures.append((index, f"J{joint + 1} {path[index, joint]} is outside the limits [{limits[joint, 0]:g},{limits[joint, 1]:g}]"))
+            poses = kinematics.Forward(path)
+        elif kind == "pose":
+            poses = path
+            failed = np.isnan(kinematics.Inverse(path, jointNear)[:, 0])
+            if failed.any():
+                index = int(np.argmax(failed))
+                if np.isnan(kinematics.Solutions(path[index:index + 1])).any(axis=-1).all():
+                    failures.append((index, "Pose is not reachable"))
+                else:
+                    failures.append((index, "Pose has no solution within the joint limits"))
+        else:
+            raise Exception(f"  ! Unknown path kind {kind}, use joint or pose")
+        positions = poses[:, :3]
+        if kinematics.user is not None:
+            user = kinematics.PoseToMatrix(kinematics.user)
+            positions = positions @ user[:3, :3].T + user[:3, 3]
+        for index, (minimum, maximum) in self.safeWallBoxes.items():
+            if self._Enabled(self.robot.safeWalls if self.robot is not None else None, index):
+                failed = np.any((positions < minimum) | (positions > maximum), axis=1)
+                if failed.any():
+                    failures.append((int(np.argmax(failed)), f"Tool is outside safety wall {index}"))
+        for index, (minimum, maximum) in self.workZoneBoxes.items():
+            if self._Enabled(self.robot.workZones if self.robot is not None else None, index):
+                failed = np.all((positions >= minimum) & (positions <= maximum), axis=1)
+                if failed.any():
+                    failures.append((int(np.argmax(failed)), f"Tool is inside work zone {index}"))
+        return min(failures, key=lambda failure: failure[0]) if failures else None
+
+    @staticmethod
+    def _Enabled(states:dict, index:int) -> bool:
+        # Without a robot every box is checked
+        return states is None or states.get(index) == 1
+
+
+# Class for controlling the robot with asyncio
+
+class AsyncDobot:
+    """
+    Class for controlling the Dobot robot arms with asyncio.
+
+    Every command of the Dobot class is available as a coroutine with the same arguments, e.g. await robot.MovJ("pose={200,200,200,0,0,0}"). Each command accepts an additional timeout keyword (s) that limits the wait for its reply. Replies are matched to commands in order by a reader task, so a timed out or cancelled call does not shift the replies of later calls.
+
+    Attributes:
+        ip (string): The IP address of the robot. Default is 192.168.5.1
+        port (int): The port number of the robot. Default is 29999.
+        timeout (float): Default reply timeout for every command. Unit: s. Default is None (no timeout).
+        isEnabled (bool): The state of the robot arm. True if the robot is enabled, False otherwise.
+    """
+
+    # Dobot methods that do not send commands or block with sleeps and are therefore not wrapped as coroutines
+    local_methods = {"Connect", "Disconnect", "SendCommand", "ReceiveResponse", "SplitResponse", "Pipeline", "SetDebugLevel",
+                     "ParseResponse", "ParseError", "ParseRobotMode", "ParseRobotType", "SayHi", "SayBye", "EnableRobot", "DisableRobot",
+                     "SetAutoReconnect", "StartReconnect", "StartWorker", "StopWorker", "SubmitCommand", "SetFeedbackCache",
+                     "SetKinematicsCache", "ClearKinematicsCache", "KinematicsCacheInfo"}
+
+    def __init__(self, ip='192.168.5.1', port=29999, timeout:float=None):
+        self.ip = ip
+        self.port = port
+        self.timeout = timeout
+        self.isEnabled = False
+        self.reader = None
+        self.writer = None
+        # Dobot instance used only to format commands, its commands are queued instead of sent. SendCommand is
+        # replaced on the instance, because pipelines are per thread and the event loop may run in another thread
+        self.formatter = Dobot(ip, port)
+        self._commands = DobotPipeline(self.formatter)
+        self.formatter.SendCommand = self._QueueCommand
+        self._replies = collections.deque()
+        self._readTask = None
+
+    def __getattr__(self, name):
+        # Parsing helpers and lookup tables are shared with the Dobot class
+        return getattr(self.formatter, name)
+
+    @property
+    def debugLevel(self) -> int:
+        return self.formatter.debugLevel
+
+    def SetDebugLevel(self, debugLevel:int) -> None:
+        """
+        Set the debug level for the AsyncDobot object.
+
+        Args:
+            debugLevel (int): Print Debug messages yes (>0) or no  (=0). Level 1 is minimal debug information. Level 2 is all debug information (including parsing).
+
+        Example:
+            SetDebugLevel(0)
+        """
+        self.formatter.debugLevel = debugLevel
+
+    async def Connect(self, timeout:float=None) -> None:
+        """
+        Connect to the robot and start the reply reader task.
+
+        Args:
+            timeout (float): Time to wait for the connection. Unit: s. Default is None (no timeout).
+
+        Raises:
+            Exception: If the connection fails.
+
+        Example:
+            await Connect(2)
+        """
+        if self.debugLevel > 0: print(f"Connecting to Dobot at {self.ip}:{self.port}...")
+        try:
+            self.reader, self.writer = await asyncio.wait_for(asyncio.open_connection(self.ip, self.port), timeout)
+        except (OSError, asyncio.TimeoutError) as e:
+            raise Exception(f"  ! Connection error: {e}")
+        self._readTask = asyncio.get_running_loop().create_task(self._ReadReplies())
+        if self.debugLevel > 0: print("  Connected to Dobot Magician E6")
+
+    async def Disconnect(self) -> None:
+        """
+        Disconnect from the robot. Commands still waiting for a reply fail with a ConnectionError.
+
+        Example:
+            await Disconnect()
+        """
+        if self.writer is None:
+            return
+        self._readTask.cancel()
+        self.writer.close()
+        try:
+            await self.writer.wait_closed()
+        except OSError:
+            pass
+        self._FailReplies(ConnectionError("Disconnected from Dobot Magician E6"))
+        self.reader = self.writer = self._readTask = None
+        if self.debugLevel > 0: print("  Disconnected from Dobot Magician E6")
+
+    async def SendCommand(self, command:str, timeout:float=None) -> tuple[str, str, str]:
+        """
+        Send a command to the Dobot and wait for its response.
+
+        Args:
+            command (string): The command to send to the robot.
+            timeout (float): Time to wait for the reply. Unit: s. Default is the timeout attribute.
+
+        Returns:
+            The parsed response from the robot.
+
+        Raises:
+            Exception: If not connected to the Dobot Magician E6.
+            asyncio.TimeoutError: If the reply does not arrive in time.
+
+        Example:
+            await SendCommand("GetPose()")
+        """
+        if self.writer is None:
+            raise Exception("  ! Not connected to Dobot Magician E6")
+        reply = asyncio.get_running_loop().create_future()
+        # Queue the reply slot and write without awaiting in between to keep both in the same order
+        self._replies.append(reply)
+        self.writer.write(command.encode() + b'\n')
+        await self.writer.drain()
+        response = await asyncio.wait_for(reply, self.timeout if timeout is None else timeout)
+        return self.formatter.ParseResponse(response)
+
+    async def EnableRobot(self, *args, timeout:float=None) -> tuple[str, str, str]:
+        """
+        Enable the robot. Accepts the same arguments as Dobot.EnableRobot.
+
+        Raises:
+            Exception: If the control mode is not TCP.
+
+        Example:
+            await EnableRobot(0.5)
+        """
+        if self.isEnabled:
+            return "Robot is already enabled."
+        self.formatter.isEnabled = False
+        response = await self._RunCommand("EnableRobot", args, {}, timeout)
+        if response[1] == "Control Mode Is Not Tcp":
+            raise Exception("Control Mode Is Not Tcp")
+        self.isEnabled = True
+        return response
+
+    async def DisableRobot(self, timeout:float=None) -> tuple[str, str, str]:
+        """
+        Disable the robot.
+
+        Example:
+            await DisableRobot()
+        """
+        if self.isEnabled:
+            self.formatter.isEnabled = True
+            response = await self._RunCommand("DisableRobot", (), {}, timeout)
+            self.isEnabled = False
+            return response
+
+    def _QueueCommand(self, command:str, replay:bool=None) -> tuple[str, str, str]:
+        # SendCommand of the formatter: collect the formatted command for _RunCommand
+        self._commands.commands.append(command)
+        return None, None, None
+
+    async def _RunCommand(self, name:str, args:tuple, kwargs:dict, timeout:float) -> tuple[str, str, str]:
+        # Format with the Dobot method, then send every command it produced
+        getattr(self.formatter, name)(*args, **kwargs)
+        commands, self._commands.commands = self._commands.commands, []
+        response = None
+        for command in commands:
+            response = await self.SendCommand(command, timeout)
+        return response
+
+    async def _ReadReplies(self) -> None:
+        buffer = bytearray()
+        scanned = 0
+        try:
+            while True:
+                response = Dobot.SplitResponse(buffer, scanned)
+                if response is None:
+                    scanned = len(buffer)
+                    data = await self.reader.read(self.formatter.recvBufferSize)
+                    if not data:
+                        raise ConnectionError("Connection closed by Dobot Magician E6")
+                    buffer += data
+                    continue
+                scanned = 0
+                if self._replies:
+                    reply = self._replies.popleft()
+                    # Skip replies of calls that timed out or were cancelled
+                    if not reply.done():
+                        reply.set_result(response)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self._FailReplies(e)
+
+    def _FailReplies(self, error:Exception) -> None:
+        while self._replies:
+            reply = self._replies.popleft()
+            if not reply.done():
+                reply.set_exception(error)
+
+    @classmethod
+    def _AddCommands(cls) -> None:
+        # Mirror the Dobot command surface as coroutines
+        for name, method in vars(Dobot).items():
+            if name[0].isupper() and callable(method) and name not in cls.local_methods:
+                setattr(cls, name, cls._MakeCommand(name, getattr(method, "__doc__", None)))
+
+    @staticmethod
+    def _MakeCommand(name:str, doc:str):
+        async def command(self, *args, timeout:float=None, **kwargs) -> tuple[str, str, str]:
+            return await self._RunCommand(name, args, kwargs, timeout)
+        command.__name__ = name
+        command.__qualname__ = f"AsyncDobot.{name}"
+        command.__doc__ = doc
+        return command
+
+
+AsyncDobot._AddCommands()
+
+
+# Class for the flexible gripper
+
+class FlexGripper:
+    """
+    Class for the flexible gripper.
+    """
+    def __init__(self, robot:Dobot, DOvacuum:int=1, DOpressure:int=2):
+        """
+        Constructor for the flexible gripper.
+        
+        Args:
+            robot (DobotTCP): The robot object.
+            DOvacuum (int): Digital port for the vacuum. Default is 1.
+            DOpressure (int): Digital port for the pressure. Default is 2.
+        """
+        self.robot = robot
+        self.DOvacuum = DOvacuum
+        self.DOpressure = DOpressure
+
+    def Open(self) -> tuple[str, str, str]:
+        """
+        Open the flexible gripper
+
+        Returns:
+            The response from the robot.
+
+        Example:
+            Open()
+        """
+        if self.robot.debugLevel > 1: print(f"  Opening flexible gripper\n    ", end="")
+        self.robot.DO(self.DOvacuum,0)
+        return self.robot.DO(self.DOpressure,1)  
+
+    def Close(self) -> tuple[str, str, str]:
+        """
+        Closes the flexible gripper
+
+        Returns:
+            The response from the robot.
+
+        Example:
+            Close()
+        """
+        if self.robot.debugLevel > 1: print(f"  Closing flexible gripper\n    ", end="")
+        self.robot.DO(self.DOpressure,0)
+        return self.robot.DO(self.DOvacuum,1) 
+    
+    def Neutral(self) -> tuple[str, str, str]:
+        """
+        Puts the flexible gripper in the neutral state.
+
+        Returns:
+            The response from the robot.
+
+        Example:
+            Neutral()
+        """
+        if self.robot.debugLevel > 1: print(f"  Setting flexible gripper to neutral\n    ", end="")
+        self.robot.DO(self.DOpressure,0)
+        return self.robot.DO(self.DOvacuum,0)
+    
+    def SetState(self, state:int, vacuum:int=1, pressure:int=2) -> tuple[str, str, str]:
+        """
+        Set the status of the flexible gripper
+
+        Args:
+            state (int): State of the gripper. -1: Vacuum (closed), 0:Neutral, 1:Pressure (open)
+            vacuum (int): Digital port for the vacuum. Default is 1.
+            pressure (int): Digital port for the pressure. Default is 2.
+
+        Returns:
+            The response from the robot.
+
+        Example:
+            SetState(1)
+        """
+        if self.robot.debugLevel > 1: print(f"  Setting flexible gripper to {state}\n    ", end="")
+        match state:
+            case -1:
+                self.robot.DO(pressure,0)
+                return self.robot.DO(vacuum,1)
+            case 0:
+                self.robot.DO(vacuum,0)
+                return self.robot.DO(pressure,0)
+            case 1:
+                self.robot.DO(vacuum,0)
+                return self.robot.DO(pressure,1)
+
+
+# Class for the servo gripper
+
+class ServoGripper:
+    """
     Class for the servo gripper.
     """
 
-    def __init__(self, robot:Dobot, DOin1:int=1, DOin2:int=2, DIout1:int=1, DIout2:int=2):
+    def __init__(self, robot:Dobot, DOin1:int=1, DOin2:int=2, DIout1:int=1, DIout2:int=2):
+        """
+        Constructor for the servo gripper.
+
+        Args:
+            robot (DobotTCP): The robot object.
+            DOin1 (int): Digital input port 1. Default is 1.
+            DOin2 (int): Digital input port 2. Default is 2.
+            DIout1 (int): Digital output port 1. Default is 1.
+            DIout2 (int): Digital output port 2. Default is 2.
+        """
+
+        self.robot = robot
+        self.DOin1 = DOin1
+        self.DOin2 = DOin2
+        self.DIout1 = DIout1
+        self.DIout2 = DIout2
+    
+    def SetState(self, state) -> tuple[str, str, str]:
+        """
+        Set the state of the servo gripper.
+
+        Args:
+            state (int): IO State group of the gripper. Range: 1-4.
+
+        Returns:
+            The response from the robot.
+
+        Example:
+            SetState(1)
+        """
+        if self.robot.debugLevel > 1: print(f"  Setting servo gripper group to {state}\n    ", end="")
+        match state:
+            case 1:
+                self.robot.DO(self.DOin1,0)
+                if self.robot.debugLevel > 1: print("    ", end="")
+                return self.robot.DO(self.DOin2,0)
+            case 2:
+                self.robot.DO(self.DOin1,1)
+                if self.robot.debugLevel > 1: print("    ", end="")
+                return self.robot.DO(self.DOin2,0)
+            case 3:
+                self.robot.DO(self.DOin1,0)
+                if self.robot.debugLevel > 1: print("    ", end="")
+                return self.robot.DO(self.DOin2,1)
+            case 4:
+                self.robot.DO(self.DOin1,1)
+                if self.robot.debugLevel > 1: print("    ", end="")
+                return self.robot.DO(self.DOin2,1)
+            case _:
+                return "    Invalid state group. Please choose a value between 1 and 4."
+            
+    def GetState(self) -> tuple[str, str, str]:
+        """
+        Get the state of the servo gripper.
+
+        Returns:
+            The state of the gripper.
+
+        Example:
+            GetState()
+        """
+        if self.robot.debugLevel > 1: print(f"  Getting servo gripper state\n    ", end="")
+        output1 = self.robot.DI(self.DIout1)
+        output2 = self.robot.DI(self.DIout2)
+        match (output1, output2):
+            case (0,0):
+                if self.robot.debugLevel > 1: print("    Fingers are in motion")
+                return "Fingers are in motion"
+            case (1,0):
+                if self.robot.debugLevel > 1: print("    Fingers are at reference position, No object detected or object has been dropped")
+                return "Fingers are at reference position, No object detected or object has been dropped"
+            case (0,1):
+                if self.robot.debugLevel > 1: print("    Fingers have stopped due to an object detection")
+                return "Fingers have stopped due to an object detection"
+            case (1,1):
+                if self.robot.debugLevel > 1: print("    Fingers are holding an object")
+                return "Fingers are holding an object"
+
+
+# Class to receive feedback from the robot
+
+class Feedback:
+    """
+    Class to receive feedback from the robot.
+
+    Attributes:
+        frame (FeedbackFrame): The newest feedback frame. Fields are decoded on access.
+        frameTime (float): Monotonic time at which the newest frame was received. Unit: s.
+        data (dict): All fields of the newest feedback frame.
+        frames (deque): The most recent frames (FeedbackFrame), oldest first. Filled while the reader thread runs.
+        listeners (list): Functions called by the reader thread or the AsyncFeedback reader task with every new FeedbackFrame.
+        frameCount (int): Number of frames parsed by the reader thread or the AsyncFeedback reader task.
+        bytesRead (int): Number of bytes received from the feedback port.
+        framesDecoded (int): Number of complete frames received with a valid MessageSize header.
+        resyncs (int): Number of times the stream was misaligned and had to be resynchronized to a frame boundary.
+    """
+
+    # Size of a feedback frame in bytes and its MessageSize header
+    frame_size = 1440
+    frame_header = struct.pack('<H', 1440)
+
+    # Frame layout in the order of the TCP protocol: (struct format, field name). Reserved bytes are padding without a name.
+    frame_layout = [
+        ('H', 'MessageSize'),                      # Message size (2 bytes)
+        ('6x', None),                              # Reserved (6 bytes)
+        ('Q', 'DigitalInputs'),                    # Digital inputs (8 bytes)
+        ('Q', 'DigitalOutputs'),                   # Digital outputs (8 bytes)
+        ('Q', 'RobotMode'),                        # Robot mode (8 bytes)
+        ('Q', 'TimeStamp'),                        # Timestamp in milliseconds (8 bytes)
+        ('Q', 'RunTime'),                          # Robot running time in milliseconds (8 bytes)
+        ('Q', 'TestValue'),                        # Memory test value (8 bytes)
+        ('8x', None),                              # Reserved (8 bytes)
+        ('d', 'SpeedScaling'),                     # Speed scaling (8 bytes)
+        ('16x', None),                             # Reserved (16 bytes)
+        ('d', 'VRobot'),                           # Robot voltage (8 bytes)
+        ('d', 'IRobot'),                           # Robot current (8 bytes)
+        ('d', 'ProgramState'),                     # Script running status (8 bytes)
+        ('2B', 'SafetyIOIn'),                      # Safety IO input (2 bytes)
+        ('2B', 'SafetyIOOut'),                     # Safety IO output (2 bytes)
+        ('76x', None),                             # Reserved (76 bytes)
+
+        # Joint data
+        ('6d', 'QTarget'),                         # Target joint position (6 doubles)
+        ('6d', 'QDTarget'),                        # Target joint speed (6 doubles)
+        ('6d', 'QDDTarget'),                       # Target joint acceleration (6 doubles)
+        ('6d', 'ITarget'),                         # Target joint current (6 doubles)
+        ('6d', 'MTarget'),                         # Target joint torque (6 doubles)
+        ('6d', 'QActual'),                         # Actual joint position (6 doubles)
+        ('6d', 'QDActual'),                        # Actual joint speed (6 doubles)
+        ('6d', 'IActual'),                         # Actual joint current (6 doubles)
+        ('6d', 'ActualTCPForce'),                  # TCP actual force (6 doubles)
+        ('6d', 'ToolVectorActual'),                # TCP actual Cartesian (6 doubles)
+        ('6d', 'TCPSpeedActual'),                  # TCP actual speed (6 doubles)
+        ('6d', 'TCPForce'),                        # TCP force (6 doubles)
+        ('6d', 'ToolVectorTarget'),                # TCP target Cartesian (6 doubles)
+        ('6d', 'TCPSpeedTarget'),                  # TCP target speed (6 doubles)
+        ('6d', 'MotorTemperatures'),               # Joint temperatures (6 doubles)
+        ('6d', 'JointModes'),                      # Joint modes (6 doubles)
+        ('6d', 'VActual'),                         # Joint voltage (6 doubles)
+        ('4x', None),                              # Reserved (4 bytes)
+        ('B', 'UserCoordinateSystem'),             # User coordinate system (1 byte)
+        ('B', 'ToolCoordinateSystem'),             # Tool coordinate system (1 byte)
+        ('B', 'RunQueuedCmd'),                     # Run queued command flag (1 byte)
+        ('B', 'PauseCmdFlag'),                     # Pause command flag (1 byte)
+        ('B', 'VelocityRatio'),                    # Joint velocity ratio (1 byte)
+        ('B', 'AccelerationRatio'),                # Joint acceleration ratio (1 byte)
+        ('1x', None),                              # Reserved (1 byte)
+        ('B', 'XYZVelocityRatio'),                 # Cartesian velocity ratio (1 byte)
+        ('B', 'RVelocityRatio'),                   # Cartesian posture speed ratio (1 byte)
+        ('B', 'XYZAccelerationRatio'),             # Cartesian acceleration ratio (1 byte)
+        ('B', 'RAccelerationRatio'),               # Cartesian posture acceleration ratio (1 byte)
+        ('B', 'BrakeStatus'),                      # Brake status (1 byte)
+        ('B', 'EnableStatus'),                     # Enable status (1 byte)
+        ('B', 'DragStatus'),                       # Drag status (1 byte)
+        ('B', 'RunningStatus'),                    # Running status (1 byte)
+        ('B', 'ErrorStatus'),                      # Error status (1 byte)
+        ('B', 'JogStatus'),                        # Jog status (1 byte)
+        ('B', 'RobotType'),                        # Robot type (1 byte)
+        ('B', 'DragButtonSignal'),                 # Drag button signal (1 byte)
+        ('B', 'EnableButtonSignal'),               # Enable button signal (1 byte)
+        ('B', 'RecordButtonSignal'),               # Record button signal (1 byte)
+        ('B', 'ReappearButtonSignal'),             # Playback signal (1 byte)
+        ('B', 'JawButtonSignal'),                  # Gripper control signal (1 byte)
+        ('B', 'SixForceOnline'),                   # Six-axis force sensor status (1 byte)
+        ('B', 'CollisionState'),                   # Collision state (1 byte)
+        ('B', 'ArmApproachState'),                 # Forearm approach pause (1 byte)
+        ('B', 'J4ApproachState'),                  # J4 approach pause (1 byte)
+        ('B', 'J5ApproachState'),                  # J5 approach pause (1 byte)
+        ('B', 'J6ApproachState'),                  # J6 approach pause (1 byte)
+        ('61x', None),                             # Reserved (61 bytes)
+        ('d', 'ZAxisJitter'),                      # Z-axis jitter displacement (8 bytes)
+        ('Q', 'CurrentCommandID'),                 # Current command ID (8 bytes)
+        ('6d', 'ActualTorque'),                    # Actual torque (6 doubles)
+        ('d', 'Payload'),                          # Payload (8 bytes)
+        ('d', 'CenterX'),                          # Eccentric X (8 bytes)
+        ('d', 'CenterY'),                          # Eccentric Y (8 bytes)
+        ('d', 'CenterZ'),                          # Eccentric Z (8 bytes)
+        ('6d', 'UserCoordinates'),                 # User coordinates (6 doubles)
+        ('6d', 'ToolCoordinates'),                 # Tool coordinates (6 doubles)
+        ('8x', None),                              # Reserved (8 bytes)
+        ('6d', 'SixAxisForce'),                    # Six-axis force (6 doubles)
+        ('4d', 'TargetQuaternion'),                # Target quaternion (4 doubles)
+        ('4d', 'ActualQuaternion'),                # Actual quaternion (4 doubles)
+        ('2B', 'AutoManualMode'),                  # Manual/Automatic mode (2 bytes)
+        ('H', 'ExportStatus'),                     # USB export status (2 bytes)
+        ('B', 'SafetyStatus'),                     # Safety status (1 byte)
+        ('21x', None),                             # Reserved (21 bytes)
+    ]
+
+    def __init__(self, robot:Dobot, port=30004, history:int=100):
+        """
+        Constructor for the feedback class.
+
+        Args:
+            robot (DobotTCP): The robot object.
+            port (int): Port to receive feedback. Different ports have different feedback timings. See TCP protocol for details. Default is port 30004.
+            history (int): Number of frames kept in the frames attribute while the reader thread runs. Default is 100.
+        """
+        self.robot = robot
+        self.port = port
+        self.client = None
+        self.frame = None
+        self.frameTime = 0.0
+        self.frames = collections.deque(maxlen=history)
+        self.listeners = []
+        self.frameCount = 0
+        self.bytesRead = 0
+        self.framesDecoded = 0
+        self.resyncs = 0
+        # Room for a second frame, so the start of the next frame can be checked when it has already arrived
+        self._frameBuffer = bytearray(2 * self.frame_size)
+        self._frameView = memoryview(self._frameBuffer)
+        self._frameFill = 0
+        self._frameReturned = False
+        self._reader = None
+        self._readerError = None
+        self._frameCondition = threading.Condition()
+
+    @property
+    def data(self) -> dict:
+        # Decoded once per frame on first access
+        frame = self.frame
+        return frame.ToDict() if frame is not None else {}
+
+    def Connect(self) -> None:
+        """
+        Connect to the robot's feedback port.
+
+        Returns:
+            None
+
+        Example:
+            Connect()
+        """
+        self.client = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.client.connect((self.robot.ip, self.port))
+        self._frameFill = 0
+        self._frameReturned = False
+
+    def Get(self) -> None:
+        """
+        Get feedback from the robot. Data is stored in the data attribute.
+
+        Returns:
+            None
+
+        Example:
+            Get()
+        """
+        if self._reader is not None:
+            # The reader thread keeps the data attribute up to date
+            return
+        # Skip the frames that are already buffered, keeping the frame alignment
+        self.client.setblocking(False)
+        try:
+            while True:
+                self.ReceiveFrame()
+        except BlockingIOError:
+            pass
+        finally:
+            self.client.setblocking(True)
+        # Wait for the next frame
+        self.frame = FeedbackFrame(bytes(self.ReceiveFrame()))
+        self.frameTime = time.monotonic()
+
+    def ReceiveFrame(self) -> bytearray:
+        """
+        Receive the next complete frame into the preallocated frame buffer. Partial frames are reassembled and a misaligned stream is resynchronized to the next MessageSize header. If bytes of the next frame have already arrived and do not start with a header, the frame was cut short and is dropped as a resync.
+
+        Returns:
+            A memoryview of the frame in the frame buffer. It is overwritten by the next call.
+
+        Raises:
+            ConnectionError: If the connection was closed by the robot.
+            BlockingIOError: If the socket is non-blocking and no complete frame is available.
+
+        Example:
+            ParseFeedback(ReceiveFrame())
+        """
+        buffer, view, size, header = self._frameBuffer, self._frameView, self.frame_size, self.frame_header
+        if self._frameReturned:
+            # Move the bytes read ahead to the front
+            self._frameReturned = False
+            self._frameFill -= size
+            buffer[:self._frameFill] = buffer[size:size + self._frameFill]
+        while True:
+            while self._frameFill < size:
+                received = self.client.recv_into(view[self._frameFill:])
+                if not received:
+                    raise ConnectionError("  ! Feedback connection closed by the robot")
+                self._frameFill += received
+                self.bytesRead += received
+            fill = self._frameFill
+            if buffer.startswith(header) and self._NextHeaderFits(buffer, size, fill):
+                self._frameReturned = True
+                self.framesDecoded += 1
+                return view[:size]
+            # Misaligned or cut short: move the next header candidate to the front and read the rest of its frame
+            self.resyncs += 1
+            start = buffer.find(header, 1, fill)
+            if start < 0:
+                # Keep a trailing first header byte, it may start the next frame
+                start = fill - 1 if buffer[fill - 1] == header[0] else fill
+            buffer[:fill - start] = buffer[start:fill]
+            self._frameFill = fill - start
+
+    @classmethod
+    def _NextHeaderFits(cls, buffer:bytearray, size:int, fill:int) -> bool:
+        # Bytes received after a frame must start the header of the next one, else the frame is a cut short one
+        # followed by a new frame. Without such bytes the frame is accepted
+        return cls.frame_header.startswith(buffer[size:min(fill, size + len(cls.frame_header))])
+
+    def Start(self) -> None:
+        """
+        Start a thread reading the feedback stream continuously. Connects first if necessary. While the thread runs, Get returns immediately and the data attribute always holds the newest frame.
+
+        Example:
+            Start()
+        """
+        if self._reader is not None:
+            return
+        if self.client is None:
+            self.Connect()
+        self._readerError = None
+        self._reader = threading.Thread(target=self._ReadFrames, daemon=True)
+        self._reader.start()
+
+    def Stop(self) -> None:
+        """
+        Stop the reader thread and close the feedback connection.
+
+        Example:
+            Stop()
+        """
+        reader, self._reader = self._reader, None
+        if self.client is not None:
+            try:
+                self.client.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            self.client.close()
+            self.client = None
+        if reader is not None and reader is not threading.current_thread():
+            reader.join()
+
+    def WaitFrame(self, timeout:float=None) -> "FeedbackFrame":
+        """
+        Wait for the next frame of the reader thread.
+
+        Args:
+            timeout (float): Time to wait for the frame. Unit: s. Default is None (wait indefinitely).
+
+        Returns:
+            The feedback frame. Fields can be read as attributes or by key.
+
+        Raises:
+            Exception: If the reader thread is not running.
+            TimeoutError: If no frame arrives within the timeout.
+            ConnectionError: If the feedback connection was lost.
+
+        Example:
+            WaitFrame(0.1)
+        """
+        with self._frameCondition:
+            if self._reader is None:
+                raise Exception("  ! Feedback reader is not running. Call Start first.")
+            count = self.frameCount
+            if not self._frameCondition.wait_for(lambda: self.frameCount != count or self._readerError is not None, timeout):
+                raise TimeoutError(f"  ! No feedback frame within {timeout} s")
+            if self.frameCount == count:
+                raise ConnectionError("  ! Feedback connection lost") from self._readerError
+            return self.frame
+
+    def _ReadFrames(self) -> None:
+        try:
+            while True:
+                self._Publish(FeedbackFrame(bytes(self.ReceiveFrame())))
+        except Exception as e:
+            if self._reader is not None and self.robot.debugLevel > 0: print(f"  Feedback reader stopped: {e}")
+            with self._frameCondition:
+                self._readerError = e
+                self._frameCondition.notify_all()
+
+    def _Publish(self, frame:"FeedbackFrame") -> None:
+        # Hand a new frame of a reader to WaitFrame, the history and the listeners
+        # Swapping the reference publishes the frame to readers without a lock
+        self.frame = frame
+        self.frameTime = time.monotonic()
+        self.frames.append(frame)
+        with self._frameCondition:
+            self.frameCount += 1
+            self._frameCondition.notify_all()
+        for listener in self.listeners:
+            try:
+                listener(frame)
+            except Exception as e:
+                if self.robot.debugLevel > 0: print(f"  Feedback listener {listener} failed: {e}")
+
+    @classmethod
+    def ParseFeedback(cls, data) -> dict:
+        """
+        Parse the feedback data from the robot. The frame is decoded with one call of the precompiled frame_struct.
+        
+        Args:
+            data (bytes): The feedback data from the robot.
+            
+        Returns:
+            A dictionary with the feedback data. Fields with one value are numbers, fields with several values are lists.
+        
+        Example:
+            ParseFeedback(data)
+        """
+        values = cls.frame_struct.unpack_from(data)
+        # Keys in the order of frame_layout
+        return {key: values[index] if end is None else list(values[index:end]) for key, index, end in cls._fields}
+
+    @classmethod
+    def DecodeFrames(cls, buffer, check:bool=True) -> dict:
+        """
+        Decode many frames at once. Requires NumPy.
+
+        Args:
+            buffer (bytes): Contiguous raw frames, a multiple of 1440 bytes. Any buffer such as bytearray, memoryview or mmap works.
+            check (bool): Check the MessageSize header of every frame. Default is True.
+
+        Returns:
+            A dictionary of NumPy arrays with the keys of ParseFeedback. Fields with one value have the shape (N,), fields with several values (N,count). The arrays are views onto the buffer.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+            Exception: If the buffer does not hold whole frames or a MessageSize header is wrong.
+
+        Example:
+            columns = DecodeFrames(open("frames.bin", "rb").read())
+            columns["QActual"][:, 0]
+        """
+        if np is None:
+            raise ImportError("  ! DecodeFrames requires NumPy. Install it with pip install numpy")
+        if cls._frameDtype is None:
+            cls._frameDtype = cls.FrameDtype()
+        size = len(memoryview(buffer).cast('B'))
+        if size % cls.frame_size:
+            raise Exception(f"  ! Buffer of {size} bytes does not hold whole {cls.frame_size} byte frames")
+        records = np.frombuffer(buffer, dtype=cls._frameDtype)
+        if check and records.size and not (records['MessageSize'] == cls.frame_size).all():
+            index = int(np.argmax(records['MessageSize'] != cls.frame_size))
+            raise Exception(f"  ! Frame {index} has MessageSize {records['MessageSize'][index]}")
+        return {key: records[key] for key in cls._frameDtype.names}
+
+    @classmethod
+    def FrameDtype(cls):
+        """
+        NumPy structured dtype of a feedback frame. Reserved bytes are left out of the fields but kept in the item size.
+
+        Returns:
+            The dtype.
+        """
+        names, formats, offsets, offset = [], [], [], 0
+        for fmt, key in cls.frame_layout:
+            size = struct.calcsize('<' + fmt)
+            if key is not None:
+                kind = np.dtype('<' + fmt[-1])
+                names.append(key)
+                formats.append((kind, (int(fmt[:-1]),)) if len(fmt) > 1 else kind)
+                offsets.append(offset)
+            offset += size
+        return np.dtype({'names': names, 'formats': formats, 'offsets': offsets, 'itemsize': offset})
+
+    @classmethod
+    def _CompileLayout(cls) -> None:
+        # Compile frame_layout into one little endian struct and the positions of the fields in its values
+        cls.frame_struct = struct.Struct('<' + ''.join(fmt for fmt, key in cls.frame_layout))
+        cls._frameDtype = None
+        cls._fields, index = [], 0
+        for fmt, key in cls.frame_layout:
+            if key is None:
+                continue
+            count = int(fmt[:-1]) if len(fmt) > 1 else 1
+            cls._fields.append((key, index, None if count == 1 else index + count))
+            index += count
+
+
+Feedback._CompileLayout()
+
+
+# Class for a single feedback frame
+
+class FeedbackFrame:
+    """
+    View of a raw 1440 byte feedback frame. A field such as QActual is only decoded when it is read.
+
+    Attributes:
+        raw (memoryview): The raw frame.
+        fields (tuple): Names of the frame fields, the same as the keys of Feedback.data.
+    """
+    __slots__ = ("raw", "_dict")
+
+    def __init__(self, raw):
+        """
+        Constructor for the feedback frame. The raw data is not copied, so it must not change while the frame is used.
+
+        Args:
+            raw (bytes): The raw frame.
+        """
+        self.raw = memoryview(raw)
+        self._dict = None
+
+    def __getitem__(self, key:str):
+        if key not in self.fields:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key:str, default=None):
+        return getattr(self, key) if key in self.fields else default
+
+    def keys(self) -> tuple:
+        return self.fields
+
+    def ToDict(self) -> dict:
+        """
+        Decode all fields. The result is computed once per frame.
+
+        Returns:
+            A dictionary with the feedback data, as returned by Feedback.ParseFeedback.
+
+        Example:
+            ToDict()
+        """
+        if self._dict is None:
+            self._dict = Feedback.ParseFeedback(self.raw)
+        return self._dict
+
+    @classmethod
+    def _AddFields(cls) -> None:
+        # One property per field of the frame layout, decoding only that field
+        fields, offset = [], 0
+        for fmt, key in Feedback.frame_layout:
+            field = struct.Struct('<' + fmt)
+            if key is not None:
+                setattr(cls, key, cls._MakeField(field, offset, len(fmt) > 1))
+                fields.append(key)
+            offset += field.size
+        cls.fields = tuple(fields)
+
+    @staticmethod
+    def _MakeField(field:struct.Struct, offset:int, isList:bool) -> property:
+        if isList:
+            return property(lambda self: list(field.unpack_from(self.raw, offset)))
+        return property(lambda self: field.unpack_from(self.raw, offset)[0])
+
+
+FeedbackFrame._AddFields()
+
+
+# Class for events on feedback changes
+
+class FeedbackEvent(collections.namedtuple("FeedbackEvent", ["key", "index", "old", "new", "frame"])):
+    """
+    Event passed to the callbacks of FeedbackEvents.
+
+    Attributes:
+        key (string): The feedback field, for example DigitalInputs or RobotMode.
+        index (int): The bit index for edge events, starting at 1 as in DI(index). None for change events.
+        old: The previous value. For edge events the previous bit state.
+        new: The new value. For edge events the new bit state.
+        frame (FeedbackFrame): The frame with the change.
+    """
+    __slots__ = ()
+
+
+class FeedbackEvents:
+    """
+    Detect changes in the feedback stream and call registered functions. Registered as a listener of a Feedback object, the events are dispatched by its reader thread within one feedback period and without dashboard commands. Callbacks should return quickly, since they delay the next frame.
+
+    Attributes:
+        feedback (Feedback): The feedback object, or None if frames are passed to Check directly.
+    """
+
+    def __init__(self, feedback:Feedback=None):
+        """
+        Constructor for the feedback events.
+
+        Args:
+            feedback (Feedback): The feedback object. Its reader thread must be started with Start. Default is None (call Check with each frame, for example from a FeedbackHub subscription).
+        """
+        self.feedback = feedback
+        self._handlers = {}
+        self._previous = {}
+        self.lock = threading.Lock()
+        if feedback is not None:
+            feedback.listeners.append(self.Check)
+
+    def OnRisingEdge(self, key:str, index:int, callback) -> tuple:
+        """
+        Call a function when a bit turns on.
+
+        Args:
+            key (string): Bit field, DigitalInputs or DigitalOutputs.
+            index (int): Bit index, starting at 1 as in DI(index). Range: [1,64].
+            callback (function): Called with a FeedbackEvent.
+
+        Returns:
+            A handle for Remove.
+
+        Example:
+            OnRisingEdge("DigitalInputs", 3, lambda event: print("Part detected"))
+        """
+        return self._Add(key, (1 << (index - 1), True, index, callback))
+
+    def OnFallingEdge(self, key:str, index:int, callback) -> tuple:
+        """
+        Call a function when a bit turns off.
+
+        Args:
+            key (string): Bit field, DigitalInputs or DigitalOutputs.
+            index (int): Bit index, starting at 1 as in DI(index). Range: [1,64].
+            callback (function): Called with a FeedbackEvent.
+
+        Returns:
+            A handle for Remove.
+
+        Example:
+            OnFallingEdge("DigitalInputs", 3, lambda event: print("Part removed"))
+        """
+        return self._Add(key, (1 << (index - 1), False, index, callback))
+
+    def OnChange(self, key:str, callback) -> tuple:
+        """
+        Call a function when a feedback field changes, for example RobotMode, ErrorStatus, CollisionState or SafetyStatus.
+
+        Args:
+            key (string): Feedback field name.
+            callback (function): Called with a FeedbackEvent.
+
+        Returns:
+            A handle for Remove.
+
+        Example:
+            OnChange("RobotMode", lambda event: print(Dobot.robot_modes.get(event.new)))
+        """
+        return self._Add(key, (None, None, None, callback))
+
+    def Remove(self, handle:tuple) -> None:
+        """
+        Remove a registered function.
+
+        Args:
+            handle (tuple): The handle returned when the function was registered.
+
+        Example:
+            Remove(handle)
+        """
+        key, handler = handle
+        with self.lock:
+            handlers = {name: list(entries) for name, entries in self._handlers.items()}
+            handlers[key] = [entry for entry in handlers.get(key, []) if entry is not handler]
+            if not handlers[key]:
+                del handlers[key]
+                self._previous.pop(key, None)
+            self._handlers = handlers
+
+    def Close(self) -> None:
+        """
+        Stop listening to the feedback object.
+
+        Example:
+            Close()
+        """
+        if self.feedback is not None and self.Check in self.feedback.listeners:
+            self.feedback.listeners.remove(self.Check)
+
+    def Check(self, frame:FeedbackFrame) -> None:
+        """
+        Compare a frame with the previous one and call the functions of the changed fields. The first frame only sets the reference.
+
+        Args:
+            frame (FeedbackFrame): The new frame.
+
+        Example:
+            hub.Subscribe(events.Check)
+        """
+        previous = self._previous
+        for key, handlers in self._handlers.items():
+            new = getattr(frame, key)
+            old = previous.get(key)
+            previous[key] = new
+            if old is None or old == new:
+                continue
+            for mask, rising, index, callback in handlers:
+                if mask is None:
+                    event = FeedbackEvent(key, None, old, new, frame)
+                elif (old ^ new) & mask and bool(new & mask) == rising:
+                    event = FeedbackEvent(key, index, not rising, rising, frame)
+                else:
+                    continue
+                try:
+                    callback(event)
+                except Exception as e:
+                    if self.feedback is not None and self.feedback.robot.debugLevel > 0: print(f"  Feedback event callback {callback} failed: {e}")
+
+    def _Add(self, key:str, handler:tuple) -> tuple:
+        if key not in FeedbackFrame.fields:
+            raise Exception(f"  ! Unknown feedback field {key}")
+        with self.lock:
+            # Replace the table instead of changing it while the reader thread iterates over it
+            handlers = {name: list(entries) for name, entries in self._handlers.items()}
+            handlers.setdefault(key, []).append(handler)
+            self._handlers = handlers
+        return key, handler
+
+
+# Class to track queued motions
+
+class MotionTracker:
+    """
+    Track queued motion commands with the feedback stream. Motion commands called through the tracker return a future that resolves when the CurrentCommandID of the feedback passes the ResultID of the command and the robot has settled. No dashboard commands are used for waiting.
+
+    Attributes:
+        robot (Dobot): The robot object.
+        feedback (Feedback): The feedback object with a running reader thread.
+        currentCommandID (int): CurrentCommandID of the newest frame.
+        robotMode (int): RobotMode of the newest frame.
+    """
+
+    # Commands that are called through the tracker return a future
+    motion_commands = {"MovJ", "MovL", "MovJIO", "MovLIO", "Arc", "Circle", "RelMovJTool", "RelMovLTool", "RelMovJUser", "RelMovLUser",
+                       "RelJointMovJ", "MoveJJ", "MoveJP", "MoveLJ", "MoveLP"}
+
+    # Robot modes that stop the motion queue
+    stopped_modes = {3, 4, 9, 11}
+
+    def __init__(self, robot:Dobot, feedback:Feedback=None):
+        """
+        Constructor for the motion tracker.
+
+        Args:
+            robot (Dobot): The robot object.
+            feedback (Feedback): The feedback object. Its reader thread must be started with Start. Default is the feedback of the shared FeedbackHub of the robot on port 30004.
+        """
+        self.robot = robot
+        self.feedback = feedback if feedback is not None else FeedbackHub.Shared(robot).feedback
+        self.currentCommandID = None
+        self.robotMode = None
+        self._pending = {}
+        self._frames = 0
+        self._condition = threading.Condition()
+        self.feedback.listeners.append(self.Check)
+
+    def __getattr__(self, name):
+        attribute = getattr(self.robot, name)
+        if name in self.motion_commands:
+            return lambda *args, **kwargs: self.Track(attribute(*args, **kwargs))
+        return attribute
+
+    def Track(self, response:tuple) -> concurrent.futures.Future:
+        """
+        Create a future for a motion command that was already sent.
+
+        Args:
+            response (tuple): The response of the motion command, with the ResultID as response.
+
+        Returns:
+            A future resolved with the FeedbackFrame in which the motion is complete. It fails if the command was rejected or the robot stops with an error, a collision or by being disabled.
+
+        Example:
+            Track(robot.MovJ("pose={200,200,200,0,0,0}")).result(10)
+        """
+        future = concurrent.futures.Future()
+        (error, result, command) = response if isinstance(response, tuple) else (response, None, None)
+        if error != Dobot.error_codes[0]:
+            future.set_exception(Exception(f"  ! {command} was not queued: {error}"))
+            return future
+        commandID = int(result.split(",")[0])
+        with self._condition:
+            self._pending.setdefault(commandID, []).append(future)
+        return future
+
+    def WaitIdle(self, timeout:float=None) -> None:
+        """
+        Wait until the motion queue has drained and the robot is enabled and idle, based on the next feedback frames only.
+
+        Args:
+            timeout (float): Time to wait. Unit: s. Default is None (wait indefinitely).
+
+        Raises:
+            TimeoutError: If the robot is still moving after the timeout.
+            Exception: If the robot stopped with an error, a collision or by being disabled.
+
+        Example:
+            WaitIdle(30)
+        """
+        with self._condition:
+            frames = self._frames
+            # A frame received after the call, all tracked motions done and the robot idle
+            idle = lambda: self._frames > frames and (self.robotMode == 5 and not self._pending or self.robotMode in self.stopped_modes)
+            if not self._condition.wait_for(idle, timeout):
+                raise TimeoutError(f"  ! Robot still moving after {timeout} s, robot mode {self.robotMode}")
+            if self.robotMode != 5:
+                raise Exception(f"  ! Robot stopped: {Dobot.robot_modes.get(self.robotMode, self.robotMode)}")
+
+    def Check(self, frame:FeedbackFrame) -> None:
+        """
+        Resolve the futures of the motions completed in a frame. Called by the feedback reader thread.
+
+        Args:
+            frame (FeedbackFrame): The new frame.
+        """
+        current, mode = frame.CurrentCommandID, frame.RobotMode
+        with self._condition:
+            self.currentCommandID, self.robotMode = current, mode
+            self._frames += 1
+            if mode in self.stopped_modes:
+                done, failed = [], [future for futures in self._pending.values() for future in futures]
+                self._pending = {}
+            else:
+                finished = [commandID for commandID in self._pending if commandID < current or commandID == current and mode == 5]
+                done, failed = [future for commandID in finished for future in self._pending.pop(commandID)], []
+            self._condition.notify_all()
+        for future in done:
+            future.set_result(frame)
+        for future in failed:
+            future.set_exception(Exception(f"  ! Robot stopped: {Dobot.robot_modes.get(mode, mode)}"))
+
+    def Close(self) -> None:
+        """
+        Stop listening to the feedback object.
+
+        Example:
+            Close()
+        """
+        if self.Check in self.feedback.listeners:
+            self.feedback.listeners.remove(self.Check)
+
+
+# Classes to record feedback frames and read them back
+
+class FeedbackRecorder:
+    """
+    Append raw feedback frames to segmented files. Each segment name.bin has a sidecar index name.idx with one (TimeStamp, offset) record per frame.
+
+    Attributes:
+        directory (string): Directory of the segment files.
+        segmentFrames (int): Number of frames per segment file.
+        frameCount (int): Number of frames written.
+    """
+
+    # Index record: TimeStamp in ms and byte offset of the frame in its segment
+    index_record = struct.Struct('<QQ')
+
+    def __init__(self, directory:str, segmentFrames:int=45000, prefix:str="feedback"):
+        """
+        Constructor for the feedback recorder. Existing segments in the directory are kept, new frames go into new segments.
+
+        Args:
+            directory (string): Directory of the segment files. It is created if necessary.
+            segmentFrames (int): Number of frames per segment file. Default is 45000 (6 minutes on port 30004).
+            prefix (string): File name prefix of the segments. Default is feedback.
+        """
+        self.directory = directory
+        self.segmentFrames = segmentFrames
+        self.prefix = prefix
+        self.frameCount = 0
+        self.lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        # Continue after the highest segment number, segments may have been removed or archived
+        numbers = [int(name[len(prefix) + 1:-4]) for name in os.listdir(directory)
+                   if name.startswith(prefix + "_") and name[-4:] in (".bin", ".idx") and name[len(prefix) + 1:-4].isdigit()]
+        self._segment = max(numbers) + 1 if numbers else 0
+        self._segmentFill = 0
+        self._data = None
+        self._index = None
+
+    def Write(self, frame) -> None:
+        """
+        Append a frame. Can be added to Feedback.listeners to record the stream.
+
+        Args:
+            frame (FeedbackFrame): The frame. Raw 1440 bytes are accepted as well.
+
+        Example:
+            feedback.listeners.append(recorder.Write)
+        """
+        if not isinstance(frame, FeedbackFrame):
+            frame = FeedbackFrame(frame)
+        with self.lock:
+            if self._data is None or self._segmentFill >= self.segmentFrames:
+                self._NextSegment()
+            self._data.write(frame.raw)
+            self._index.write(self.index_record.pack(frame.TimeStamp, self._segmentFill * Feedback.frame_size))
+            self._segmentFill += 1
+            self.frameCount += 1
+
+    def Flush(self) -> None:
+        """
+        Write buffered frames to the files.
+
+        Example:
+            Flush()
+        """
+        with self.lock:
+            if self._data is not None:
+                self._data.flush()
+                self._index.flush()
+
+    def Close(self) -> None:
+        """
+        Flush and close the current segment.
+
+        Example:
+            Close()
+        """
+        with self.lock:
+            self._CloseSegment()
+
+    def _NextSegment(self) -> None:
+        self._CloseSegment()
+        path = os.path.join(self.directory, f"{self.prefix}_{self._segment:06d}")
+        # Never append to an existing segment, its index offsets would be wrong
+        self._data = open(path + ".bin", "xb")
+        try:
+            self._index = open(path + ".idx", "xb")
+        except OSError:
+            self._data.close()
+            self._data = None
+            raise
+        self._segment += 1
+        self._segmentFill = 0
+
+    def _CloseSegment(self) -> None:
+        if self._data is not None:
+            self._data.close()
+            self._index.close()
+            self._data = self._index = None
+
+
+class FeedbackLog:
+    """
+    Read feedback frames recorded by FeedbackRecorder. The segments are memory mapped, so only the frames that are read are loaded. Time lookups use binary search on the index files.
+
+    Attributes:
+        directory (string): Directory of the segment files.
+        segments (list): The mapped segments as (data, index, frame count, first frame number).
+    """
+
+    def __init__(self, directory:str, prefix:str="feedback"):
+        """
+        Constructor for the feedback log.
+
+        Args:
+            directory (string): Directory of the segment files.
+            prefix (string): File name prefix of the segments. Default is feedback.
+        """
+        self.directory = directory
+        self.segments = []
+        self._starts = []
+        self._numbers = []
+        frames = 0
+        for path in self.Segments(directory, prefix):
+            count = min(os.path.getsize(path + ".bin") // Feedback.frame_size, os.path.getsize(path + ".idx") // FeedbackRecorder.index_record.size)
+            if count == 0:
+                continue
+            with open(path + ".bin", "rb") as data, open(path + ".idx", "rb") as index:
+                segment = (mmap.mmap(data.fileno(), 0, access=mmap.ACCESS_READ), mmap.mmap(index.fileno(), 0, access=mmap.ACCESS_READ), count, frames)
+            self.segments.append(segment)
+            self._starts.append(self.TimeStamp(segment, 0))
+            self._numbers.append(frames)
+            frames += count
+        self._frames = frames
+
+    @staticmethod
+    def Segments(directory:str, prefix:str="feedback") -> list:
+        """
+        Find the segment files of a recording.
+
+        Args:
+            directory (string): Directory of the segment files.
+            prefix (string): File name prefix of the segments. Default is feedback.
+
+        Returns:
+            The segment paths without extension, in recording order.
+        """
+        if not os.path.isdir(directory):
+            return []
+        names = sorted(name[:-4] for name in os.listdir(directory) if name.startswith(prefix + "_") and name.endswith(".bin"))
+        return [os.path.join(directory, name) for name in names]
+
+    @staticmethod
+    def TimeStamp(segment:tuple, position:int) -> int:
+        return FeedbackRecorder.index_record.unpack_from(segment[1], position * FeedbackRecorder.index_record.size)[0]
+
+    def __len__(self) -> int:
+        return self._frames
+
+    def __getitem__(self, number:int) -> FeedbackFrame:
+        if number < 0:
+            number += self._frames
+        if not 0 <= number < self._frames:
+            raise IndexError(number)
+        segment = self.segments[bisect.bisect_right(self._numbers, number) - 1]
+        offset = (number - segment[3]) * Feedback.frame_size
+        return FeedbackFrame(memoryview(segment[0])[offset:offset + Feedback.frame_size])
+
+    def Find(self, timestamp:int) -> int:
+        """
+        Find the first frame recorded at or after a time.
+
+        Args:
+            timestamp (int): Time in the unit of the TimeStamp field. Unit: ms.
+
+        Returns:
+            The frame number. len(log) if all frames are older.
+
+        Example:
+            Find(1736940000000)
         """
-        Constructor for the servo gripper.
+        position = max(bisect.bisect_right(self._starts, timestamp) - 1, 0)
+        for segment in self.segments[position:]:
+            times = _IndexTimes(segment)
+            found = bisect.bisect_left(times, timestamp)
+            if found < len(times):
+                return segment[3] + found
+        return self._frames
+
+    def Range(self, start:int, end:int) -> tuple:
+        """
+        Find the frames recorded in a time range.
 
         Args:
-            robot (DobotTCP): The robot object.
-            DOin1 (int): Digital input port 1. Default is 1.
-            DOin2 (int): Digital input port 2. Default is 2.
-            DIout1 (int): Digital output port 1. Default is 1.
-            DIout2 (int): Digital output port 2. Default is 2.
+            start (int): Start time, included. Unit: ms.
+            end (int): End time, excluded. Unit: ms.
+
+        Returns:
+            The frame numbers (first, last + 1).
+
+        Example:
+            Range(t0, t0 + 60000)
         """
+        return self.Find(start), self.Find(end)
 
-        self.robot = robot
-        self.DOin1 = DOin1
-        self.DOin2 = DOin2
-        self.DIout1 = DIout1
-        self.DIout2 = DIout2
-    
-    def SetState(self, state) -> tuple[str, str, str]:
+    def Frames(self, start:int=None, end:int=None):
         """
-        Set the state of the servo gripper.
+        Iterate over the frames of a time range without copying them.
 
         Args:
-            state (int): IO State group of the gripper. Range: 1-4.
+            start (int): Start time, included. Unit: ms. Default is the beginning of the recording.
+            end (int): End time, excluded. Unit: ms. Default is the end of the recording.
 
         Returns:
-            The response from the robot.
+            A generator of FeedbackFrame objects.
 
         Example:
-            SetState(1)
+            for frame in log.Frames(t0, t0 + 1000):
+                print(frame.QActual)
         """
-        if self.robot.debugLevel > 1: print(f"  Setting servo gripper group to {state}\n    ", end="")
-        match state:
-            case 1:
-                self.robot.DO(self.DOin1,0)
-                if self.robot.debugLevel > 1: print("    ", end="")
-                return self.robot.DO(self.DOin2,0)
-            case 2:
-                self.robot.DO(self.DOin1,1)
-                if self.robot.debugLevel > 1: print("    ", end="")
-                return self.robot.DO(self.DOin2,0)
-            case 3:
-                self.robot.DO(self.DOin1,0)
-                if self.robot.debugLevel > 1: print("    ", end="")
-                return self.robot.DO(self.DOin2,1)
-            case 4:
-                self.robot.DO(self.DOin1,1)
-                if self.robot.debugLevel > 1: print("    ", end="")
-                return self.robot.DO(self.DOin2,1)
-            case _:
-                return "    Invalid state group. Please choose a value between 1 and 4."
-            
-    def GetState(self) -> tuple[str, str, str]:
+        first = 0 if start is None else self.Find(start)
+        last = self._frames if end is None else self.Find(end)
+        for number in range(first, last):
+            yield self[number]
+
+    def Columns(self, start:int=None, end:int=None) -> dict:
         """
-        Get the state of the servo gripper.
+        Decode the frames of a time range into NumPy column arrays with Feedback.DecodeFrames. Requires NumPy.
+
+        Args:
+            start (int): Start time, included. Unit: ms. Default is the beginning of the recording.
+            end (int): End time, excluded. Unit: ms. Default is the end of the recording.
 
         Returns:
-            The state of the gripper.
+            A dictionary of NumPy arrays with the keys of Feedback.ParseFeedback.
 
         Example:
-            GetState()
+            Columns(t0, t0 + 60000)["QActual"]
         """
-        if self.robot.debugLevel > 1: print(f"  Getting servo gripper state\n    ", end="")
-        output1 = self.robot.DI(self.DIout1)
-        output2 = self.robot.DI(self.DIout2)
-        match (output1, output2):
-            case (0,0):
-                if self.robot.debugLevel > 1: print("    Fingers are in motion")
-                return "Fingers are in motion"
-            case (1,0):
-                if self.robot.debugLevel > 1: print("    Fingers are at reference position, No object detected or object has been dropped")
-                return "Fingers are at reference position, No object detected or object has been dropped"
-            case (0,1):
-                if self.robot.debugLevel > 1: print("    Fingers have stopped due to an object detection")
-                return "Fingers have stopped due to an object detection"
-            case (1,1):
-                if self.robot.debugLevel > 1: print("    Fingers are holding an object")
-                return "Fingers are holding an object"
+        first = 0 if start is None else self.Find(start)
+        last = self._frames if end is None else self.Find(end)
+        parts = []
+        for data, index, count, number in self.segments:
+            low, high = max(first - number, 0), min(last - number, count)
+            if low < high:
+                parts.append(Feedback.DecodeFrames(memoryview(data)[low * Feedback.frame_size:high * Feedback.frame_size]))
+        if not parts:
+            return Feedback.DecodeFrames(b"")
+        if len(parts) == 1:
+            return parts[0]
+        return {key: np.concatenate([part[key] for part in parts]) for key in parts[0]}
 
+    def Close(self) -> None:
+        """
+        Unmap the segments.
 
-# Class to receive feedback from the robot
+        Raises:
+            BufferError: If frames read from the log are still referenced.
 
-class Feedback:
+        Example:
+            Close()
+        """
+        for data, index, count, number in self.segments:
+            data.close()
+            index.close()
+        self.segments = []
+        self._starts = []
+        self._numbers = []
+        self._frames = 0
+
+
+class _IndexTimes:
+    # Sequence of the TimeStamps in a segment index for bisect
+    def __init__(self, segment:tuple):
+        self.segment = segment
+
+    def __len__(self) -> int:
+        return self.segment[2]
+
+    def __getitem__(self, position:int) -> int:
+        return FeedbackLog.TimeStamp(self.segment, position)
+
+
+# Classes to share one feedback connection
+
+class FeedbackHub:
     """
-    Class to receive feedback from the robot.
+    One feedback connection per robot and port, shared by many subscribers. Each frame is received once and the same FeedbackFrame object is handed to every subscriber.
+
+    Attributes:
+        feedback (Feedback): The feedback connection. Its frame attribute holds the newest frame.
+        subscriptions (list): The active subscriptions.
     """
 
-    def __init__(self, robot:Dobot, port=30004):
+    # Shared hubs by (ip, port)
+    hubs = {}
+    hubs_lock = threading.Lock()
+
+    def __init__(self, robot:Dobot, port:int=30004):
         """
-        Constructor for the feedback class.
+        Constructor for the feedback hub. Use Shared to reuse the hub of a robot and port.
 
         Args:
             robot (DobotTCP): The robot object.
-            port (int): Port to receive feedback. Different ports have different feedback timings. See TCP protocol for details. Default is port 30004.
+            port (int): Port to receive feedback. Default is port 30004.
         """
-        self.robot = robot
-        self.port = port
-        self.client = None
-        self.data = {}
+        self.feedback = Feedback(robot, port)
+        self.feedback.listeners.append(self._Publish)
+        self.subscriptions = []
+        self.lock = threading.Lock()
 
-    def Connect(self) -> None:
+    @classmethod
+    def Shared(cls, robot:Dobot, port:int=30004) -> "FeedbackHub":
         """
-        Connect to the robot's feedback port.
+        Get the hub for a robot and port, creating and starting it on first use.
+
+        Args:
+            robot (DobotTCP): The robot object.
+            port (int): Port to receive feedback. Default is port 30004.
 
         Returns:
-            None
+            The shared hub.
 
         Example:
-            Connect()
+            hub = FeedbackHub.Shared(robot)
         """
-        self.client = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        self.client.connect((self.robot.ip, self.port))
+        with cls.hubs_lock:
+            hub = cls.hubs.get((robot.ip, port))
+            if hub is None:
+                hub = cls(robot, port)
+                hub.feedback.Start()
+                cls.hubs[(robot.ip, port)] = hub
+            return hub
 
-    def Get(self) -> None:
+    def Subscribe(self, callback=None, policy:str="dropOldest", maxsize:int=100) -> "FeedbackSubscription":
         """
-        Get feedback from the robot. Data is stored in the data attribute.
+        Add a subscriber. Frames are buffered per subscriber, so a slow subscriber never delays the others.
+
+        Args:
+            callback (function): Called with every FeedbackFrame in a thread of the subscription. Default is None (read frames with Get).
+            policy (string): What to do when the buffer is full. dropOldest: drop the oldest frame, latestOnly: keep only the newest frame. Default is dropOldest.
+            maxsize (int): Number of frames buffered with dropOldest. Default is 100.
 
         Returns:
-            None
+            The subscription.
 
         Example:
-            Get()
+            subscription = hub.Subscribe(policy="latestOnly")
+            frame = subscription.Get(0.1)
         """
-        # Clear the buffer
-        self.client.setblocking(False)
+        subscription = FeedbackSubscription(self, callback, policy, maxsize)
+        with self.lock:
+            self.subscriptions = self.subscriptions + [subscription]
+        return subscription
+
+    def Unsubscribe(self, subscription:"FeedbackSubscription") -> None:
+        """
+        Remove a subscriber.
+
+        Args:
+            subscription (FeedbackSubscription): The subscription.
+
+        Example:
+            Unsubscribe(subscription)
+        """
+        with self.lock:
+            self.subscriptions = [s for s in self.subscriptions if s is not subscription]
+        subscription._Close()
+
+    def Close(self) -> None:
+        """
+        Close all subscriptions and the feedback connection.
+
+        Example:
+            Close()
+        """
+        with self.hubs_lock:
+            if self.hubs.get((self.feedback.robot.ip, self.feedback.port)) is self:
+                del self.hubs[(self.feedback.robot.ip, self.feedback.port)]
+        for subscription in self.subscriptions:
+            self.Unsubscribe(subscription)
+        self.feedback.Stop()
+
+    def _Publish(self, frame:FeedbackFrame) -> None:
+        # Called by the reader thread, the subscription list is replaced instead of changed
+        for subscription in self.subscriptions:
+            subscription._Put(frame)
+
+
+class FeedbackSubscription:
+    """
+    Subscriber of a FeedbackHub.
+
+    Attributes:
+        policy (string): dropOldest or latestOnly.
+        received (int): Number of frames handed to the subscription.
+        dropped (int): Number of frames dropped because the subscriber was too slow.
+    """
+
+    policies = {"dropOldest", "latestOnly"}
+
+    def __init__(self, hub:FeedbackHub, callback=None, policy:str="dropOldest", maxsize:int=100):
+        """
+        Constructor for the subscription. Use FeedbackHub.Subscribe.
+
+        Args:
+            hub (FeedbackHub): The hub.
+            callback (function): Called with every frame in a thread of the subscription. Default is None.
+            policy (string): dropOldest or latestOnly. Default is dropOldest.
+            maxsize (int): Number of frames buffered with dropOldest. Default is 100.
+        """
+        if policy not in self.policies:
+            raise Exception(f"  ! Unknown policy {policy}. Use one of {sorted(self.policies)}")
+        self.hub = hub
+        self.policy = policy
+        self.received = 0
+        self.dropped = 0
+        self.closed = False
+        self._buffer = collections.deque(maxlen=1 if policy == "latestOnly" else maxsize)
+        self._condition = threading.Condition()
+        self._thread = None
+        if callback is not None:
+            self._thread = threading.Thread(target=self._Deliver, args=(callback,), daemon=True)
+            self._thread.start()
+
+    def Get(self, timeout:float=None) -> FeedbackFrame:
+        """
+        Take the next buffered frame, waiting for one if necessary.
+
+        Args:
+            timeout (float): Time to wait for a frame. Unit: s. Default is None (wait indefinitely).
+
+        Returns:
+            The frame.
+
+        Raises:
+            TimeoutError: If no frame arrives within the timeout.
+            Exception: If the subscription is closed.
+
+        Example:
+            Get(0.1)
+        """
+        with self._condition:
+            if not self._condition.wait_for(lambda: self._buffer or self.closed, timeout):
+                raise TimeoutError(f"  ! No feedback frame within {timeout} s")
+            if not self._buffer:
+                raise Exception("  ! Subscription is closed")
+            return self._buffer.popleft()
+
+    def Close(self) -> None:
+        """
+        Unsubscribe from the hub.
+
+        Example:
+            Close()
+        """
+        self.hub.Unsubscribe(self)
+
+    def _Put(self, frame:FeedbackFrame) -> None:
+        with self._condition:
+            if len(self._buffer) == self._buffer.maxlen:
+                self.dropped += 1
+            self._buffer.append(frame)
+            self.received += 1
+            self._condition.notify()
+
+    def _Close(self) -> None:
+        with self._condition:
+            self.closed = True
+            self._condition.notify_all()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+
+    def _Deliver(self, callback) -> None:
         while True:
             try:
-                data = self.client.recv(1440)
-                if not data:
-                    break
-            except:
-                break
-        self.client.setblocking(True)
-        # wait 10 ms for the data to be ready
-        time.sleep(0.01)
-        rawdata = self.client.recv(1440)
-        self.data = self.ParseFeedback(rawdata)
+                frame = self.Get()
+            except Exception:
+                return
+            try:
+                callback(frame)
+            except Exception as e:
+                if self.hub.feedback.robot.debugLevel > 0: print(f"  Feedback subscriber {callback} failed: {e}")
+
+
+# Classes to share feedback frames between processes
+
+class SharedFeedbackPublisher:
+    """
+    Publish feedback frames into a ring of slots in shared memory. Each slot is guarded by a sequence counter (seqlock): it is odd while the slot is written, so readers in other processes detect and retry torn reads without any lock.
+
+    Attributes:
+        name (string): Name of the shared memory block. Readers attach with this name.
+        slots (int): Number of frames in the ring.
+        count (int): Number of frames published.
+    """
 
-    def ParseFeedback(self, data) -> dict:
+    # Header: magic, number of slots, number of frames published. Slot: sequence counter and raw frame.
+    header = struct.Struct('<QQQ')
+    sequence = struct.Struct('<Q')
+    magic = 0x4442544645454442
+    slot_size = 8 + 1440
+
+    def __init__(self, name:str=None, slots:int=64):
         """
-        Parse the feedback data from the robot.
-        
+        Constructor for the publisher. Creates the shared memory block.
+
         Args:
-            data (bytes): The feedback data from the robot.
-            
+            name (string): Name of the shared memory block. Default is a generated name.
+            slots (int): Number of frames in the ring. Default is 64.
+        """
+        self.slots = slots
+        self.count = 0
+        self.memory = multiprocessing.shared_memory.SharedMemory(name, create=True, size=self.header.size + slots * self.slot_size)
+        self.name = self.memory.name
+        self.header.pack_into(self.memory.buf, 0, self.magic, slots, 0)
+
+    def Publish(self, frame) -> None:
+        """
+        Write a frame into the next slot. Can be added to Feedback.listeners to publish the stream.
+
+        Args:
+            frame (FeedbackFrame): The frame. Raw 1440 bytes are accepted as well.
+
+        Example:
+            feedback.listeners.append(publisher.Publish)
+        """
+        raw = frame.raw if isinstance(frame, FeedbackFrame) else frame
+        buffer = self.memory.buf
+        offset = self.header.size + self.count % self.slots * self.slot_size
+        sequence = self.sequence.unpack_from(buffer, offset)[0]
+        self.sequence.pack_into(buffer, offset, sequence + 1)
+        buffer[offset + 8:offset + self.slot_size] = raw
+        self.sequence.pack_into(buffer, offset, sequence + 2)
+        self.count += 1
+        self.header.pack_into(buffer, 0, self.magic, self.slots, self.count)
+
+    def Close(self) -> None:
+        """
+        Close and remove the shared memory block.
+
+        Example:
+            Close()
+        """
+        self.memory.close()
+        self.memory.unlink()
+
+
+class SharedFeedbackReader:
+    """
+    Read feedback frames published by a SharedFeedbackPublisher in another process. Fields are decoded directly from shared memory, no socket is needed.
+
+    Attributes:
+        name (string): Name of the shared memory block.
+        slots (int): Number of frames in the ring.
+        retries (int): Number of reads repeated because the slot was written at the same time.
+    """
+
+    def __init__(self, name:str):
+        """
+        Constructor for the reader. Attaches to the shared memory block of a publisher.
+
+        Args:
+            name (string): Name of the shared memory block.
+
+        Raises:
+            Exception: If the block was not created by a SharedFeedbackPublisher.
+        """
+        # Attach without registering at the resource tracker, only the publisher removes the block
+        if sys.version_info >= (3, 13):
+            self.memory = multiprocessing.shared_memory.SharedMemory(name, track=False)
+        else:
+            from multiprocessing import resource_tracker
+            register = resource_tracker.register
+            resource_tracker.register = lambda name, rtype: None if rtype == "shared_memory" else register(name, rtype)
+            try:
+                self.memory = multiprocessing.shared_memory.SharedMemory(name)
+            finally:
+                resource_tracker.register = register
+        self.name = name
+        magic, self.slots, _ = SharedFeedbackPublisher.header.unpack_from(self.memory.buf, 0)
+        if magic != SharedFeedbackPublisher.magic:
+            raise Exception(f"  ! Shared memory {name} holds no feedback frames")
+        self.retries = 0
+        self._fields = {key: getattr(FeedbackFrame, key) for key in FeedbackFrame.fields}
+
+    @property
+    def count(self) -> int:
+        # Number of frames published so far
+        return SharedFeedbackPublisher.header.unpack_from(self.memory.buf, 0)[2]
+
+    def Read(self, *keys:str, number:int=None) -> dict:
+        """
+        Decode fields of a frame straight from shared memory.
+
+        Args:
+            keys (string): Field names, for example QActual or DigitalInputs. Default is all fields.
+            number (int): Frame number, counted from 0. Default is the newest frame.
+
         Returns:
-            A dictionary with the feedback data.
-        
+            A dictionary with the fields and the frame number under the key Number.
+
+        Raises:
+            Exception: If nothing was published yet or the frame was already overwritten.
+
         Example:
-            ParseFeedback(data)
+            Read("QActual", "ToolVectorActual", "DigitalInputs")
         """
-        feedback_dict = {}
-
-        # Remove brackets and convert to a list if comma-separated.
-        def parse_value(value):
-            if isinstance(value, tuple):
-                # Flatten single-value tuples and keep lists for multiple values
-                if len(value) == 1:
-                    return value[0]
-                return list(value)
-            return value
-
-        # Helper function to unpack data and assign it a key
-        def unpack(offset, fmt, key):
-            size = struct.calcsize(fmt)
-            value = struct.unpack_from(fmt, data, offset)
-            feedback_dict[key] = parse_value(value)  # Parse value into clean format
-            return offset + size
-
-        # Parse fields based on their "Meaning" in the TCP protocol
-        offset = 0
-        offset = unpack(offset, 'H', 'MessageSize')                        # Message size (2 bytes)
-        offset += 6                                                        # Reserved (6 bytes)
-        offset = unpack(offset, 'Q', 'DigitalInputs')                      # Digital inputs (8 bytes)
-        offset = unpack(offset, 'Q', 'DigitalOutputs')                     # Digital outputs (8 bytes)
-        offset = unpack(offset, 'Q', 'RobotMode')                          # Robot mode (8 bytes)
-        offset = unpack(offset, 'Q', 'TimeStamp')                          # Timestamp in milliseconds (8 bytes)
-        offset = unpack(offset, 'Q', 'RunTime')                            # Robot running time in milliseconds (8 bytes)
-        offset = unpack(offset, 'Q', 'TestValue')                          # Memory test value (8 bytes)
-        offset += 8                                                        # Reserved (8 bytes)
-        offset = unpack(offset, 'd', 'SpeedScaling')                       # Speed scaling (8 bytes)
-        offset += 16                                                       # Reserved (16 bytes)
-        offset = unpack(offset, 'd', 'VRobot')                             # Robot voltage (8 bytes)
-        offset = unpack(offset, 'd', 'IRobot')                             # Robot current (8 bytes)
-        offset = unpack(offset, 'd', 'ProgramState')                       # Script running status (8 bytes)
-        offset = unpack(offset, '2B', 'SafetyIOIn')                        # Safety IO input (2 bytes)
-        offset = unpack(offset, '2B', 'SafetyIOOut')                       # Safety IO output (2 bytes)
-        offset += 76                                                       # Reserved (76 bytes)
+        buffer = self.memory.buf
+        keys = keys or FeedbackFrame.fields
+        while True:
+            count = self.count
+            if count == 0:
+                raise Exception("  ! No feedback frame published yet")
+            current = count - 1 if number is None else number
+            if not count - self.slots <= current < count:
+                raise Exception(f"  ! Frame {current} is not in the ring, frames {max(count - self.slots, 0)} to {count - 1} are available")
+            offset = SharedFeedbackPublisher.header.size + current % self.slots * SharedFeedbackPublisher.slot_size
+            before = SharedFeedbackPublisher.sequence.unpack_from(buffer, offset)[0]
+            if before % 2 == 0:
+                view = buffer[offset + 8:offset + SharedFeedbackPublisher.slot_size]
+                frame = FeedbackFrame(view)
+                values = {key: self._fields[key].fget(frame) for key in keys}
+                frame.raw.release()
+                view.release()
+                # The slot must not have been rewritten while it was decoded
+                if SharedFeedbackPublisher.sequence.unpack_from(buffer, offset)[0] == before and (number is None or self.count - self.slots <= current):
+                    values["Number"] = current
+                    return values
+            self.retries += 1
+
+    def WaitFrame(self, after:int, timeout:float=None, poll:float=0.0002) -> int:
+        """
+        Wait until a frame newer than a frame number is published.
+
+        Args:
+            after (int): Frame number already seen. -1 to wait for the first frame.
+            timeout (float): Time to wait. Unit: s. Default is None (wait indefinitely).
+            poll (float): Time between checks. 0 checks continuously. Unit: s. Default is 0.0002.
+
+        Returns:
+            The number of the newest frame.
 
-        # Joint data
-        offset = unpack(offset, '6d', 'QTarget')                           # Target joint position (6 doubles)
-        offset = unpack(offset, '6d', 'QDTarget')                          # Target joint speed (6 doubles)
-        offset = unpack(offset, '6d', 'QDDTarget')                         # Target joint acceleration (6 doubles)
-        offset = unpack(offset, '6d', 'ITarget')                           # Target joint current (6 doubles)
-        offset = unpack(offset, '6d', 'MTarget')                           # Target joint torque (6 doubles)
-        offset = unpack(offset, '6d', 'QActual')                           # Actual joint position (6 doubles)
-        offset = unpack(offset, '6d', 'QDActual')                          # Actual joint speed (6 doubles)
-        offset = unpack(offset, '6d', 'IActual')                           # Actual joint current (6 doubles)
-        offset = unpack(offset, '6d', 'ActualTCPForce')                    # TCP actual force (6 doubles)
-        offset = unpack(offset, '6d', 'ToolVectorActual')                  # TCP actual Cartesian (6 doubles)
-        offset = unpack(offset, '6d', 'TCPSpeedActual')                    # TCP actual speed (6 doubles)
-        offset = unpack(offset, '6d', 'TCPForce')                          # TCP force (6 doubles)
-        offset = unpack(offset, '6d', 'ToolVectorTarget')                  # TCP target Cartesian (6 doubles)
-        offset = unpack(offset, '6d', 'TCPSpeedTarget')                    # TCP target speed (6 doubles)
-        offset = unpack(offset, '6d', 'MotorTemperatures')                 # Joint temperatures (6 doubles)
-        offset = unpack(offset, '6d', 'JointModes')                        # Joint modes (6 doubles)
-        offset = unpack(offset, '6d', 'VActual')                           # Joint voltage (6 doubles)
-        offset += 4                                                        # Reserved (4 bytes)
-        offset = unpack(offset, 'B', 'UserCoordinateSystem')               # User coordinate system (1 byte)
-        offset = unpack(offset, 'B', 'ToolCoordinateSystem')               # Tool coordinate system (1 byte)
-        offset = unpack(offset, 'B', 'RunQueuedCmd')                       # Run queued command flag (1 byte)
-        offset = unpack(offset, 'B', 'PauseCmdFlag')                       # Pause command flag (1 byte)
-        offset = unpack(offset, 'B', 'VelocityRatio')                      # Joint velocity ratio (1 byte)
-        offset = unpack(offset, 'B', 'AccelerationRatio')                  # Joint acceleration ratio (1 byte)
-        offset += 1                                                        # Reserved (1 byte)
-        offset = unpack(offset, 'B', 'XYZVelocityRatio')                   # Cartesian velocity ratio (1 byte)
-        offset = unpack(offset, 'B', 'RVelocityRatio')                     # Cartesian posture speed ratio (1 byte)
-        offset = unpack(offset, 'B', 'XYZAccelerationRatio')               # Cartesian acceleration ratio (1 byte)
-        offset = unpack(offset, 'B', 'RAccelerationRatio')                 # Cartesian posture acceleration ratio (1 byte)
-        offset = unpack(offset, 'B', 'BrakeStatus')                        # Brake status (1 byte)
-        offset = unpack(offset, 'B', 'EnableStatus')                       # Enable status (1 byte)
-        offset = unpack(offset, 'B', 'DragStatus')                         # Drag status (1 byte)
-        offset = unpack(offset, 'B', 'RunningStatus')                      # Running status (1 byte)
-        offset = unpack(offset, 'B', 'ErrorStatus')                        # Error status (1 byte)
-        offset = unpack(offset, 'B', 'JogStatus')                          # Jog status (1 byte)
-        offset = unpack(offset, 'B', 'RobotType')                          # Robot type (1 byte)
-        offset = unpack(offset, 'B', 'DragButtonSignal')                   # Drag button signal (1 byte)
-        offset = unpack(offset, 'B', 'EnableButtonSignal')                 # Enable button signal (1 byte)
-        offset = unpack(offset, 'B', 'RecordButtonSignal')                 # Record button signal (1 byte)
-        offset = unpack(offset, 'B', 'ReappearButtonSignal')               # Playback signal (1 byte)
-        offset = unpack(offset, 'B', 'JawButtonSignal')                    # Gripper control signal (1 byte)
-        offset = unpack(offset, 'B', 'SixForceOnline')                     # Six-axis force sensor status (1 byte)
-        offset = unpack(offset, 'B', 'CollisionState')                     # Collision state (1 byte)
-        offset = unpack(offset, 'B', 'ArmApproachState')                   # Forearm approach pause (1 byte)
-        offset = unpack(offset, 'B', 'J4ApproachState')                    # J4 approach pause (1 byte)
-        offset = unpack(offset, 'B', 'J5ApproachState')                    # J5 approach pause (1 byte)
-        offset = unpack(offset, 'B', 'J6ApproachState')                    # J6 approach pause (1 byte)
-        offset += 61                                                       # Reserved (61 bytes)
-        offset = unpack(offset, 'd', 'ZAxisJitter')                        # Z-axis jitter displacement (8 bytes)
-        offset = unpack(offset, 'Q', 'CurrentCommandID')                   # Current command ID (8 bytes)
-        offset = unpack(offset, '6d', 'ActualTorque')                      # Actual torque (6 doubles)
-        offset = unpack(offset, 'd', 'Payload')                            # Payload (8 bytes)
-        offset = unpack(offset, 'd', 'CenterX')                            # Eccentric X (8 bytes)
-        offset = unpack(offset, 'd', 'CenterY')                            # Eccentric Y (8 bytes)
-        offset = unpack(offset, 'd', 'CenterZ')                            # Eccentric Z (8 bytes)
-        offset = unpack(offset, '6d', 'UserCoordinates')                   # User coordinates (6 doubles)
-        offset = unpack(offset, '6d', 'ToolCoordinates')                   # Tool coordinates (6 doubles)
-        offset += 8                                                        # Reserved (8 bytes)
-        offset = unpack(offset, '6d', 'SixAxisForce')                      # Six-axis force (6 doubles)
-        offset = unpack(offset, '4d', 'TargetQuaternion')                  # Target quaternion (4 doubles)
-        offset = unpack(offset, '4d', 'ActualQuaternion')                  # Actual quaternion (4 doubles)
-        offset = unpack(offset, '2B', 'AutoManualMode')                    # Manual/Automatic mode (2 bytes)
-        offset = unpack(offset, 'H', 'ExportStatus')                       # USB export status (2 bytes)
-        offset = unpack(offset, 'B', 'SafetyStatus')                       # Safety status (1 byte)
-
-        return feedback_dict
\ No newline at end of file
+        Raises:
+            TimeoutError: If no new frame is published within the timeout.
+
+        Example:
+            number = WaitFrame(number, 0.1)
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            count = self.count
+            if count - 1 > after:
+                return count - 1
+            if deadline is not None and time.monotonic() > deadline:
+                raise TimeoutError(f"  ! No feedback frame within {timeout} s")
+            if poll:
+                time.sleep(poll)
+
+    def Close(self) -> None:
+        """
+        Detach from the shared memory block.
+
+        Example:
+            Close()
+        """
+        self.memory.close()
+
+
+# Class to receive feedback from the robot with asyncio
+
+class AsyncFeedback(Feedback):
+    """
+    Class to receive feedback from the robot with asyncio. A reader task keeps the data attribute updated with the newest frame. Frames are checked against their MessageSize header and a misaligned stream is resynchronized like in Feedback.
+    """
+
+    def __init__(self, robot, port=30004):
+        """
+        Constructor for the asyncio feedback class.
+
+        Args:
+            robot (Dobot or AsyncDobot): The robot object.
+            port (int): Port to receive feedback. Default is port 30004.
+        """
+        super().__init__(robot, port)
+        self.reader = None
+        self.writer = None
+        self._frame = None
+        self._readTask = None
+
+    async def Connect(self, timeout:float=None) -> None:
+        """
+        Connect to the robot's feedback port and start reading frames.
+
+        Args:
+            timeout (float): Time to wait for the connection. Unit: s. Default is None (no timeout).
+
+        Example:
+            await Connect()
+        """
+        self.reader, self.writer = await asyncio.wait_for(asyncio.open_connection(self.robot.ip, self.port), timeout)
+        self._frame = asyncio.get_running_loop().create_future()
+        self._readTask = asyncio.get_running_loop().create_task(self._ReadFrames())
+
+    async def Disconnect(self) -> None:
+        """
+        Stop reading frames and close the feedback connection.
+
+        Example:
+            await Disconnect()
+        """
+        if self.writer is None:
+            return
+        self._readTask.cancel()
+        self.writer.close()
+        try:
+            await self.writer.wait_closed()
+        except OSError:
+            pass
+        if not self._frame.done():
+            # Fails waiting Get calls. Reading the exception back keeps asyncio from logging it when nobody waits
+            self._frame.set_exception(ConnectionError("  ! Feedback connection closed"))
+            self._frame.exception()
+        self.reader = self.writer = self._readTask = self._frame = None
+
+    async def Get(self, timeout:float=None) -> "FeedbackFrame":
+        """
+        Wait for the next feedback frame. The frame is stored in the frame attribute.
+
+        Args:
+            timeout (float): Time to wait for the frame. Unit: s. Default is None (no timeout).
+
+        Returns:
+            The feedback frame. Fields can be read as attributes or by key.
+
+        Raises:
+            Exception: If not connected.
+            TimeoutError: If no frame arrives within the timeout.
+
+        Example:
+            await Get(0.1)
+        """
+        if self._frame is None:
+            raise Exception("  ! Feedback is not connected. Call Connect first.")
+        return await asyncio.wait_for(asyncio.shield(self._frame), timeout)
+
+    async def _ReadFrames(self) -> None:
+        buffer = bytearray()
+        size, header = self.frame_size, self.frame_header
+        try:
+            while True:
+                while len(buffer) < size:
+                    data = await self.reader.read(65536)
+                    if not data:
+                        raise ConnectionError("  ! Feedback connection closed by the robot")
+                    buffer += data
+                    self.bytesRead += len(data)
+                if not (buffer.startswith(header) and self._NextHeaderFits(buffer, size, len(buffer))):
+                    # Misaligned or cut short: drop the bytes before the next header candidate, as in ReceiveFrame
+                    self.resyncs += 1
+                    start = buffer.find(header, 1)
+                    if start < 0:
+                        # Keep a trailing first header byte, it may start the next frame
+                        start = len(buffer) - 1 if buffer[-1] == header[0] else len(buffer)
+                    del buffer[:start]
+                    continue
+                frame = FeedbackFrame(bytes(buffer[:size]))
+                del buffer[:size]
+                self.framesDecoded += 1
+                self._Publish(frame)
+                pending, self._frame = self._frame, asyncio.get_running_loop().create_future()
+                pending.set_result(frame)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self._frame.set_exception(e)
@@ -0,0 +1,512 @@
+'''
+benchmarks.py
+
+Benchmarks for the DobotTCP library. The benchmarks run against a local stand-in controller, so no robot is required.
+
+Usage:
+    python benchmarks.py [benchmark ...]
+
+Benchmarks:
+    reader: Buffered response reader versus the previous single recv(1024) path.
+    pipeline: Palletizing job sent command by command versus as one pipeline.
+    threads: Throughput of concurrent callers with the request lock versus the command worker.
+    latency: Round trip latency percentiles per command family against the dashboard simulator, split into client and wire time.
+    dispatch: Call overhead of overloaded commands, compared with multipledispatch if it is installed.
+    feedback: Feedback frames decoded per second with one precompiled struct versus one unpack call per field, lazy FeedbackFrame access and NumPy batch decoding.
+    shared: Latency from feedback frame arrival to a reader in another process through shared memory.
+    servo: Send time lateness of ServoJ setpoints from a sleep loop versus the ServoStreamer deadline scheduler.
+    kinematics: Local vectorized forward and inverse kinematics of a path versus PositiveKin round trips.
+    validate: Time to validate a path of joint angles and a path of poses with PathValidator.
+
+Results of all benchmarks can be written to JSON with --output to compare runs.
+'''
+
+import argparse
+import json
+import multiprocessing
+import platform
+import socket
+import statistics
+import struct
+import threading
+import time
+
+from DobotTCP import Dobot, DobotPipeline, Feedback, FeedbackFrame, SharedFeedbackPublisher, SharedFeedbackReader, ServoStreamer, Kinematics, PathValidator
+from DobotSimulator import DashboardSimulator, FeedbackSimulator, SimulatedRobot
+
+
+class StandInController:
+    """
+    Minimal dashboard server answering every command with a fixed payload.
+
+    Args:
+        payloadSize (int): Number of characters in the reply payload. Default is 8.
+        latency (float): Delay before each batch of replies is sent, emulating the network round trip. Unit: s. Default is 0.
+        host (string): Interface to listen on. Default is 127.0.0.1.
+    """
+
+    def __init__(self, payloadSize:int=8, latency:float=0, host:str="127.0.0.1"):
+        self.payload = ",".join(["1"] * max(1, payloadSize // 2))
+        self.latency = latency
+        self.server = socket.create_server((host, 0))
+        self.ip, self.port = self.server.getsockname()
+        self.thread = threading.Thread(target=self._Serve, daemon=True)
+        self.thread.start()
+
+    def _Serve(self) -> None:
+        while True:
+            try:
+                client, _ = self.server.accept()
+            except OSError:
+                return
+            threading.Thread(target=self._Handle, args=(client,), daemon=True).start()
+
+    def _Handle(self, client:socket.socket) -> None:
+        client.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        pending = b""
+        with client:
+            while True:
+                data = client.recv(65536)
+                if not data:
+                    return
+                pending += data
+                *commands, pending = pending.split(b"\n")
+                replies = [b"0,{" + self.payload.encode() + b"}," + command + b";" for command in commands if command]
+                if replies:
+                    if self.latency:
+                        time.sleep(self.latency)
+                    client.sendall(b"".join(replies))
+
+    def Close(self) -> None:
+        self.server.close()
+
+
+def legacy_send(robot:Dobot, command:str) -> tuple:
+    # Reply path used before the buffered reader: one recv(1024) per command
+    try:
+        robot.connection.sendall(command.encode() + b'\n')
+        return robot.ParseResponse(robot.connection.recv(1024).decode().strip())
+    except Exception:
+        return None, None, None
+
+
+def run_reader_case(payloadSize:int, count:int) -> dict:
+    controller = StandInController(payloadSize)
+    robot = Dobot(controller.ip, controller.port)
+    robot.SetDebugLevel(0)
+    robot.Connect()
+    result = {"payloadSize": payloadSize, "count": count}
+    for name, send in (("legacy", legacy_send), ("buffered", Dobot.SendCommand)):
+        corrupt = 0
+        start = time.perf_counter()
+        for i in range(count):
+            (error, response, command) = send(robot, f"GetHoldRegs(1,{i},1)")
+            if response != controller.payload:
+                corrupt += 1
+        elapsed = time.perf_counter() - start
+        result[name] = {"commandsPerSecond": count / elapsed, "corruptReplies": corrupt}
+        # Drop bytes the legacy path left behind before the next run
+        robot.connection.settimeout(0.2)
+        try:
+            while robot.connection.recv(65536):
+                pass
+        except socket.timeout:
+            pass
+        robot.connection.settimeout(None)
+        robot._recvPending.clear()
+    robot.Disconnect()
+    controller.Close()
+    return result
+
+
+def benchmark_reader(count:int) -> list:
+    results = []
+    for payloadSize in (8, 4096, 16384):
+        result = run_reader_case(payloadSize, count)
+        print(f"  payload {payloadSize:>6} B: legacy {result['legacy']['commandsPerSecond']:9.0f} cmd/s ({result['legacy']['corruptReplies']} corrupt), "
+              f"buffered {result['buffered']['commandsPerSecond']:9.0f} cmd/s ({result['buffered']['corruptReplies']} corrupt)")
+        results.append(result)
+    return results
+
+
+def palletize(robot:Dobot, points:int) -> None:
+    for i in range(points):
+        robot.MovL(f"pose={{{200 + i % 10 * 20},{i // 10 * 20},50,180,0,0}}")
+        robot.DO(1, i % 2)
+
+
+def benchmark_pipeline(count:int, latency:float=0.002) -> dict:
+    points = max(1, count // 10)
+    controller = StandInController(latency=latency)
+    robot = Dobot(controller.ip, controller.port)
+    robot.SetDebugLevel(0)
+    robot.Connect()
+    start = time.perf_counter()
+    palletize(robot, points)
+    sequential = time.perf_counter() - start
+    start = time.perf_counter()
+    with robot.Pipeline() as p:
+        palletize(p, points)
+    pipelined = time.perf_counter() - start
+    robot.Disconnect()
+    controller.Close()
+    print(f"  {2 * points} commands, {latency * 1000:.1f} ms latency: sequential {sequential * 1000:8.1f} ms, "
+          f"pipelined {pipelined * 1000:8.1f} ms ({len(p.results)} replies)")
+    return {"commands": 2 * points, "latency": latency, "sequential": sequential, "pipelined": pipelined}
+
+
+def benchmark_threads(count:int, latency:float=0.002) -> list:
+    controller = StandInController(latency=latency)
+    robot = Dobot(controller.ip, controller.port)
+    robot.SetDebugLevel(0)
+    robot.Connect()
+    results = []
+    for mode in ("lock", "worker"):
+        if mode == "worker":
+            robot.StartWorker()
+        for callers in (1, 4, 16):
+            perCaller = max(1, count // 10 // callers)
+            threads = [threading.Thread(target=lambda: [robot.GetPose() for _ in range(perCaller)]) for _ in range(callers)]
+            start = time.perf_counter()
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            rate = callers * perCaller / (time.perf_counter() - start)
+            print(f"  {mode:>6}, {callers:>2} callers: {rate:8.0f} cmd/s")
+            results.append({"mode": mode, "callers": callers, "commandsPerSecond": rate})
+    robot.StopWorker()
+    robot.Disconnect()
+    controller.Close()
+    return results
+
+
+command_families = {
+    "motion": [
+        lambda robot, i: robot.MovJ(f"pose={{{200 + i % 10},{i % 7},200,180,0,0}}"),
+        lambda robot, i: robot.MovL(f"pose={{{200 + i % 10},{i % 7},150,180,0,0}}"),
+        lambda robot, i: robot.Arc("pose={250,50,150,180,0,0}", f"pose={{{300 + i % 10},0,150,180,0,0}}"),
+    ],
+    "queries": [
+        lambda robot, i: robot.GetPose(),
+        lambda robot, i: robot.GetAngle(),
+        lambda robot, i: robot.RobotMode(),
+    ],
+    "io": [
+        lambda robot, i: robot.DO(1, i % 2),
+        lambda robot, i: robot.DI(1),
+        lambda robot, i: robot.DOGroup(f"1,{i % 2},2,{(i + 1) % 2}"),
+    ],
+    "modbus": [
+        lambda robot, i: robot.GetHoldRegs(0, 3095, 4),
+    ],
+    "servo": [
+        lambda robot, i: robot.ServoJ(i % 90 * 0.1, 0, 90, 0, 90, 0, 0.008),
+    ],
+}
+
+
+def percentiles(samples:list) -> dict:
+    cuts = statistics.quantiles(samples, n=100, method="inclusive")
+    return {"p50": cuts[49] * 1e6, "p95": cuts[94] * 1e6, "p99": cuts[98] * 1e6, "mean": statistics.fmean(samples) * 1e6}
+
+
+def measure_command(robot:Dobot, capture:DobotPipeline, call, i:int) -> tuple:
+    # Same steps as Dobot.SendCommand, timed one by one
+    start = time.perf_counter()
+    robot._pipeline = capture
+    call(robot, i)
+    robot._pipeline = None
+    command = capture.commands.pop()
+    formatted = time.perf_counter()
+    robot.connection.sendall(command.encode() + b'\n')
+    response = robot.ReceiveResponse()
+    received = time.perf_counter()
+    robot.ParseResponse(response)
+    parsed = time.perf_counter()
+    return formatted - start, received - formatted, parsed - received
+
+
+def benchmark_latency(count:int, latency:float=0) -> dict:
+    simulator = DashboardSimulator(SimulatedRobot(moveTime=0), port=0, latency=latency).Start()
+    robot = Dobot(simulator.ip, simulator.port)
+    robot.SetDebugLevel(0)
+    robot.Connect()
+    robot.EnableRobot()
+    capture = DobotPipeline(robot)
+    results = {}
+    for family, calls in command_families.items():
+        client, wire, total = [], [], []
+        for i in range(max(2, count // len(command_families))):
+            formatTime, wireTime, parseTime = measure_command(robot, capture, calls[i % len(calls)], i)
+            client.append(formatTime + parseTime)
+            wire.append(wireTime)
+            total.append(formatTime + wireTime + parseTime)
+        results[family] = {
+            "commands": len(total),
+            "commandsPerSecond": len(total) / sum(total),
+            "totalUs": percentiles(total),
+            "clientUs": percentiles(client),
+            "wireUs": percentiles(wire),
+        }
+        print(f"  {family:>8}: {results[family]['commandsPerSecond']:8.0f} cmd/s, total p50/p95/p99 "
+              f"{results[family]['totalUs']['p50']:7.1f}/{results[family]['totalUs']['p95']:7.1f}/{results[family]['totalUs']['p99']:7.1f} us, "
+              f"client p50 {results[family]['clientUs']['p50']:6.1f} us, wire p50 {results[family]['wireUs']['p50']:7.1f} us")
+    robot.Disconnect()
+    simulator.Close()
+    return {"latency": latency, "families": results}
+
+
+dispatch_cases = [
+    ("DO", (1, 1)),
+    ("MovJ", ("pose={200,0,200,180,0,0}",)),
+    ("MoveJog", ("X+",)),
+    ("SetPayload", (1.5,)),
+    ("RelMovJTool", (1.0, 0.0, 0.0, 0.0, 0.0, 0.0)),
+]
+
+
+def benchmark_dispatch(count:int) -> dict:
+    try:
+        import multipledispatch
+    except ImportError:
+        multipledispatch = None
+    robot = Dobot()
+    robot.SetDebugLevel(0)
+    robot._pipeline = DobotPipeline(robot)
+    calls = max(1000, count * 5)
+    results = {}
+    for name, args in dispatch_cases:
+        dispatcher = getattr(Dobot, name).dispatcher
+        function, _, _ = dispatcher.Resolve(args, {})
+        variants = {"direct": lambda: function(robot, *args), "dispatcher": lambda: getattr(robot, name)(*args)}
+        if multipledispatch is not None:
+            legacy = multipledispatch.Dispatcher(name)
+            for types, overload, _, _ in dispatcher.overloads:
+                legacy.add((object,) + types, overload)
+            variants["multipledispatch"] = lambda: legacy(robot, *args)
+        result = {}
+        for variant, call in variants.items():
+            # Best of five runs
+            best = float("inf")
+            for _ in range(5):
+                start = time.perf_counter()
+                for _ in range(calls):
+                    call()
+                best = min(best, time.perf_counter() - start)
+                robot._pipeline.commands.clear()
+            result[variant] = best / calls * 1e9
+        overheads = ", ".join(f"{variant} +{result[variant] - result['direct']:6.0f} ns" for variant in result if variant != "direct")
+        print(f"  {name:>12}: direct {result['direct']:6.0f} ns, {overheads}")
+        results[name] = result
+    return results
+
+
+def legacy_parse_feedback(data:bytes) -> dict:
+    # Frame decoder used before the precompiled struct: nested helpers with one calcsize and unpack_from per field
+    feedback_dict = {}
+
+    def parse_value(value):
+        if isinstance(value, tuple):
+            if len(value) == 1:
+                return value[0]
+            return list(value)
+        return value
+
+    def unpack(offset, fmt, key):
+        size = struct.calcsize(fmt)
+        value = struct.unpack_from(fmt, data, offset)
+        feedback_dict[key] = parse_value(value)
+        return offset + size
+
+    offset = 0
+    for fmt, key in Feedback.frame_layout:
+        if key is None:
+            offset += struct.calcsize(fmt)
+        else:
+            offset = unpack(offset, fmt, key)
+    return feedback_dict
+
+
+def benchmark_feedback(count:int) -> dict:
+    frame = FeedbackSimulator(SimulatedRobot(), port=0).Frame()
+    feedback = Feedback(Dobot())
+    if legacy_parse_feedback(frame) != feedback.ParseFeedback(frame):
+        raise Exception("  ! Decoders disagree")
+    frames = max(1000, count * 10)
+    results = {}
+    # A recorder or controller usually reads a few fields per frame
+    lazy = lambda data: ((view := FeedbackFrame(data)).QActual, view.RobotMode)
+    for name, parse in (("legacy", legacy_parse_feedback), ("struct", feedback.ParseFeedback), ("frame", lazy)):
+        start = time.perf_counter()
+        for _ in range(frames):
+            parse(frame)
+        results[name] = frames / (time.perf_counter() - start)
+    print(f"  legacy {results['legacy']:9.0f} frames/s, struct {results['struct']:9.0f} frames/s ({results['struct'] / results['legacy']:.1f}x), "
+          f"FeedbackFrame with 2 fields {results['frame']:9.0f} frames/s")
+    try:
+        buffer = frame * frames * 10
+        start = time.perf_counter()
+        columns = Feedback.DecodeFrames(buffer)
+        columns["QActual"].mean(axis=0)
+        results["numpy"] = frames * 10 / (time.perf_counter() - start)
+        print(f"  NumPy batch of {frames * 10} frames {results['numpy']:9.0f} frames/s")
+    except ImportError:
+        print("  NumPy batch skipped, NumPy is not installed")
+    return results
+
+
+def shared_reader(name:str, frames:int, poll:float, connection) -> None:
+    # Runs in a separate process: note when each new frame becomes visible
+    reader = SharedFeedbackReader(name)
+    seen, number = [], -1
+    while len(seen) < frames:
+        try:
+            number = reader.WaitFrame(number, 2, poll)
+        except TimeoutError:
+            break
+        seen.append((number, time.perf_counter_ns()))
+        reader.Read("QActual", "ToolVectorActual", "DigitalInputs")
+    connection.send((seen, reader.retries))
+    reader.Close()
+
+
+def benchmark_shared(count:int) -> dict:
+    frames = max(100, count // 10)
+    simulator = FeedbackSimulator(SimulatedRobot(), port=0, period=0.002).Start()
+    publisher = SharedFeedbackPublisher()
+    feedback = Feedback(Dobot(simulator.ip), simulator.port)
+    arrivals = {}
+
+    def publish(frame):
+        arrivals[publisher.count] = time.perf_counter_ns()
+        publisher.Publish(frame)
+
+    feedback.listeners.append(publish)
+    feedback.Start()
+    context = multiprocessing.get_context("spawn")
+    results = {}
+    for poll in (0, 0.0002):
+        receiver, sender = context.Pipe(False)
+        process = context.Process(target=shared_reader, args=(publisher.name, frames, poll, sender))
+        process.start()
+        seen, retries = receiver.recv()
+        process.join()
+        # The first frame may have been published before the reader started
+        latencies = [(observed - arrivals[number]) / 1e9 for number, observed in seen[1:] if number in arrivals]
+        result = {"frames": len(latencies), "retries": retries, "latencyUs": percentiles(latencies)}
+        results[f"poll{poll * 1e6:.0f}us"] = result
+        print(f"  poll {poll * 1e6:4.0f} us: p50/p95/p99 {result['latencyUs']['p50']:6.1f}/{result['latencyUs']['p95']:6.1f}/"
+              f"{result['latencyUs']['p99']:6.1f} us over {len(latencies)} frames, {retries} torn reads retried")
+    feedback.Stop()
+    publisher.Close()
+    simulator.Close()
+    return results
+
+
+def benchmark_servo(count:int, period:float=0.008) -> dict:
+    setpoints = [[0, 0, 90 - 10 * i / count, 0, 90, 0] for i in range(max(10, count // 4))]
+    simulator = DashboardSimulator(SimulatedRobot(moveTime=0), port=0).Start()
+    robot = Dobot(simulator.ip, simulator.port)
+    robot.SetDebugLevel(0)
+    robot.Connect()
+    robot.EnableRobot()
+    lateness = []
+    start = time.perf_counter()
+    for i, setpoint in enumerate(setpoints):
+        lateness.append(time.perf_counter() - start - i * period)
+        robot.ServoJ(*setpoint, t=period)
+        time.sleep(period)
+    streamer = ServoStreamer(robot, period=period)
+    result = streamer.Run(setpoints)
+    robot.Disconnect()
+    simulator.Close()
+    print(f"  sleep loop:     {len(setpoints)} setpoints, lateness max {max(lateness) * 1000:7.2f} ms, final drift {lateness[-1] * 1000:7.2f} ms")
+    print(f"  ServoStreamer: {result['ticks']} setpoints, lateness max {result['maxLateness'] * 1000:7.2f} ms, {result['missed']} missed")
+    print(f"  histogram: {result['histogram']}")
+    return {"setpoints": len(setpoints), "period": period, "loopMaxLateness": max(lateness), "loopDrift": lateness[-1], "streamer": result}
+
+
+def benchmark_kinematics(count:int, latency:float=0.002) -> dict:
+    try:
+        import numpy as np
+    except ImportError:
+        print("  skipped, NumPy is not installed")
+        return {}
+    points = count * 50
+    kinematics = Kinematics("CR5")
+    joints = np.random.default_rng(0).uniform(-150, 150, (points, 6))
+    start = time.perf_counter()
+    poses = kinematics.Forward(joints)
+    forward = time.perf_counter() - start
+    start = time.perf_counter()
+    kinematics.Inverse(poses, jointNear=joints)
+    inverse = time.perf_counter() - start
+    simulator = DashboardSimulator(SimulatedRobot(robotType=5), port=0, latency=latency).Start()
+    robot = Dobot(simulator.ip, simulator.port)
+    robot.SetDebugLevel(0)
+    robot.Connect()
+    calls = max(10, count // 20)
+    start = time.perf_counter()
+    for row in joints[:calls].tolist():
+        robot.PositiveKin(*row)
+    remote = (time.perf_counter() - start) / calls
+    robot.Disconnect()
+    simulator.Close()
+    print(f"  {points} points: Forward {forward * 1000:7.1f} ms ({forward / points * 1e6:.2f} us/point), "
+          f"Inverse {inverse * 1000:7.1f} ms ({inverse / points * 1e6:.2f} us/point)")
+    print(f"  PositiveKin round trip with {latency * 1000:.1f} ms latency: {remote * 1000:.2f} ms/point, "
+          f"{remote * points:.1f} s for the same path")
+    return {"points": points, "forward": forward, "inverse": inverse, "latency": latency, "roundTrip": remote}
+
+
+def benchmark_validate(count:int) -> dict:
+    try:
+        import numpy as np
+    except ImportError:
+        print("  skipped, NumPy is not installed")
+        return {}
+    points = count * 50
+    validator = PathValidator(Kinematics("CR5"))
+    validator.AddSafeWall(1, [-1000, -1000, 0], [1000, 1000, 1200])
+    validator.AddWorkZone(1, [-100, -100, 0], [100, 100, 200])
+    joints = np.linspace([0, 0, -90, 0, 90, 0], [90, 30, -60, 20, 60, 40], points)
+    poses = validator.kinematics.Forward(joints)
+    results = {"points": points}
+    for kind, path in (("joint", joints), ("pose", poses)):
+        start = time.perf_counter()
+        failure = validator.Validate(path, kind, jointNear=joints[0])
+        results[kind] = time.perf_counter() - start
+        print(f"  {points} {kind} points: {results[kind] * 1000:7.1f} ms, result {failure}")
+    return results
+
+
+benchmarks = {
+    "reader": benchmark_reader,
+    "pipeline": benchmark_pipeline,
+    "threads": benchmark_threads,
+    "latency": benchmark_latency,
+    "dispatch": benchmark_dispatch,
+    "feedback": benchmark_feedback,
+    "shared": benchmark_shared,
+    "servo": benchmark_servo,
+    "kinematics": benchmark_kinematics,
+    "validate": benchmark_validate,
+}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run DobotTCP benchmarks against a local stand-in controller.")
+    parser.add_argument("names", nargs="*", default=list(benchmarks), help="Benchmarks to run. Default: all.")
+    parser.add_argument("--count", type=int, default=2000, help="Commands per run. Default is 2000.")
+    parser.add_argument("--output", help="Write the results to this JSON file.")
+    args = parser.parse_args()
+    results = {}
+    for name in args.names:
+        print(f"{name}:")
+        results[name] = benchmarks[name](args.count)
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump({"time": time.strftime("%Y-%m-%dT%H:%M:%S"), "python": platform.python_version(),
+                       "count": args.count, "results": results}, file, indent=2)
+        print(f"Results written to {args.output}")
@@ -0,0 +1,31 @@
+import asyncio
+import os
+import sys
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from DobotTCP import AsyncDobot
+from DobotSimulator import DashboardSimulator, SimulatedRobot
+
+
+def test_client_built_and_used_in_different_threads():
+    # The event loop runs in another thread than the one that built the client
+    simulator = DashboardSimulator(SimulatedRobot(), port=0).Start()
+    robot = AsyncDobot(simulator.ip, simulator.port)
+    robot.SetDebugLevel(0)
+    results = []
+
+    async def main():
+        await robot.Connect()
+        results.append(await robot.GetPose(timeout=2))
+        results.append(await robot.RobotMode(timeout=2))
+        await robot.Disconnect()
+
+    thread = threading.Thread(target=lambda: asyncio.run(main()))
+    thread.start()
+    thread.join(10)
+    simulator.Close()
+    assert len(results) == 2
+    assert results[0][2].startswith("GetPose(")
+    assert results[1][2] == "RobotMode()"